@@ -89,10 +89,17 @@ def create_app(config_name: str | None = None) -> Flask:
         FlaskInstrumentor().instrument_app(app)
         SQLAlchemyInstrumentor().instrument(engine=db.engine)
 
+    # Per-request latency/DB-time capture for operation logs and /api/metrics
+    if app.config.get("REQUEST_METRICS_ENABLED", True):
+        from app.services.request_metrics import init_request_metrics
+
+        init_request_metrics(app)
+
     # Register blueprints
-    from app.api import evaluation_bp
+    from app.api import blob_bp, evaluation_bp
 
     app.register_blueprint(evaluation_bp, url_prefix="/api/evaluations")
+    app.register_blueprint(blob_bp, url_prefix="/api/blobs")
 
     # Configure logging
     if not app.debug and not app.testing:
@@ -137,9 +144,24 @@ def create_app(config_name: str | None = None) -> Flask:
 
     # Health check endpoint
     @app.route("/api/health")
-    def health_check() -> dict[str, str]:
+    def health_check() -> dict[str, Any]:
         """Health check endpoint for monitoring."""
-        return {"status": "healthy", "message": "Solution Evaluation System is running"}
+        from app.services.operation_log_writer import OperationLogWriter
+
+        return {
+            "status": "healthy",
+            "message": "Solution Evaluation System is running",
+            "operation_log": OperationLogWriter.stats(),
+        }
+
+    @app.route("/api/metrics/endpoints")
+    def endpoint_metrics() -> dict[str, Any]:
+        """Latency histogram and percentiles of recent requests per endpoint."""
+        stats = app.extensions.get("request_metrics")
+        return {
+            "success": True,
+            "data": {"endpoints": stats.summary() if stats is not None else []},
+        }
 
     # Debug CORS endpoint
     @app.route("/api/debug/cors")
@@ -3,6 +3,7 @@
 Contains the public, auth-less evaluation endpoints.
 """
 
+from .blob import blob_bp
 from .evaluation import evaluation_bp
 
-__all__ = ["evaluation_bp"]
+__all__ = ["blob_bp", "evaluation_bp"]
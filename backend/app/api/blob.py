@@ -0,0 +1,66 @@
+"""Blob API endpoints (auth-less).
+
+Serves content-addressed files written by ``BlobStore``.
+"""
+
+from __future__ import annotations
+
+from flask import Blueprint, Response, current_app, jsonify, send_file
+
+from app.services.blob_store import BlobStore
+
+blob_bp = Blueprint("blob", __name__)
+
+# Content never changes for a given digest, so clients may cache forever.
+IMMUTABLE_MAX_AGE = 31536000
+
+
+@blob_bp.route("/<digest>", methods=["GET"])
+def get_blob(digest: str) -> Response | tuple[Response, int]:
+    """Stream a stored blob.
+
+    Args:
+        digest (str): SHA-256 hex digest of the blob content.
+
+    Returns:
+        Response: The blob body, honouring ``Range`` and conditional headers.
+    ---
+    tags:
+      - Blobs
+    parameters:
+      - name: digest
+        in: path
+        required: true
+        schema:
+          type: string
+        description: SHA-256 hex digest returned in evaluation payloads
+    responses:
+      200:
+        description: Blob content
+      206:
+        description: Partial content for a Range request
+      304:
+        description: Not modified
+      404:
+        description: Blob not found
+    """
+    digest = digest.lower()
+    if not BlobStore.exists(digest):
+        return jsonify({"success": False, "message": "Blob not found"}), 404
+
+    try:
+        response = send_file(
+            BlobStore.path_for(digest),
+            mimetype=BlobStore.content_type(digest),
+            conditional=True,
+            etag=digest,
+            max_age=IMMUTABLE_MAX_AGE,
+        )
+    except OSError as e:
+        current_app.logger.error(f"Error reading blob {digest}: {str(e)}")
+        return jsonify({"success": False, "message": "Blob not found"}), 404
+
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    response.headers["X-Content-Type-Options"] = "nosniff"
+    return response
@@ -2,35 +2,81 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+import csv
+import io
+import json
+import os
 import re
-from datetime import datetime, timedelta
+import tempfile
+from datetime import date, datetime, timedelta
 from typing import Any
 
-from flask import Blueprint, Response, current_app, jsonify, request
-from sqlalchemy import or_
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    request,
+    stream_with_context,
+    url_for,
+)
+from sqlalchemy import and_, case, cast, insert, literal, or_, select, union_all
+from sqlalchemy.orm import joinedload, noload, selectinload
 
 from app.models import db
+from app.models.data_version import version_token
 from app.models.evaluation import (
     Evaluation,
+    EvaluationDetail,
     EvaluationNestedProcess,
     EvaluationProcess,
     EvaluationProcessLot,
     EvaluationProcessRaw,
     EvaluationProcessStep,
+    EvaluationResult,
     EvaluationStatus,
     EvaluationStepFailure,
     EvaluationStepLot,
     EvaluationType,
-    FailCode,
     NandAppliedProduct,
     NandEvaluation,
     NandGrade,
     NandProduct,
 )
+from app.models.kpi_rollup import EvaluationKpiDaily
+from app.models.nested_snapshot import EvaluationNestedSnapshot, store_snapshot
 from app.models.operation_log import OperationLog, OperationType
+from app.models.payload_blob import (
+    load_payloads,
+    payload_digest,
+    payload_ref,
+    store_payload,
+)
+from app.models.search_index import substring_filter
+from app.models.view_counter import ViewCounter
+from app.services.blob_store import BlobStore
+from app.services.fail_code_dictionary import FailCodeDictionary
+from app.services.log_archive import LogArchive, _naive_utc
+from app.services.operation_log_writer import OperationLogWriter
+from app.services.response_cache import ResponseCache
+from app.services.suggestion_index import SuggestionIndex
 from app.utils import get_client_ip
+from app.utils.audit_diff import make_patch
+from app.utils.http_cache import (
+    apply_etag,
+    compute_etag,
+    not_modified,
+    request_fingerprint,
+)
 from app.utils.rich_text import sanitize_rich_text
-from app.utils.timezone import resolve_timezone_from_request, timezone_label, utcnow
+from app.utils.timezone import (
+    iso_local,
+    resolve_timezone_from_request,
+    timezone_label,
+    utcnow,
+)
 
 evaluation_bp = Blueprint("evaluation", __name__)
 
@@ -65,6 +111,72 @@ NAND_PRODUCT_ORDER = {
     ("V8", "CR"): 15,
     ("V8", "CU"): 16,
 }
+EVALUATION_SORT_COLUMNS = {
+    "evaluation_number": Evaluation.evaluation_number,
+    "evaluation_name": Evaluation.evaluation_name,
+    "evaluation_type": Evaluation.evaluation_type,
+    "product_name": Evaluation.product_name,
+    "part_number": Evaluation.part_number,
+    "status": Evaluation.status,
+    "start_date": Evaluation.start_date,
+    "actual_end_date": Evaluation.actual_end_date,
+    "scs_charger_name": Evaluation.scs_charger_name,
+    "head_office_charger_name": Evaluation.head_office_charger_name,
+}
+MAX_CURSOR_PAGE_SIZE = 1000
+
+EXPORT_CHUNK_SIZE = 500
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+EXPORT_COLUMNS = (
+    "id",
+    "evaluation_number",
+    "evaluation_name",
+    "evaluation_type",
+    "product_name",
+    "part_number",
+    "evaluation_reason",
+    "remarks",
+    "test_process",
+    "process_step",
+    "pgm_version",
+    "scs_charger_name",
+    "head_office_charger_name",
+    "status",
+    "start_date",
+    "actual_end_date",
+    "created_at",
+    "updated_at",
+    "process_count",
+    "step_count",
+    "total_units",
+    "fail_units",
+    "fail_codes",
+    "nested_summary",
+)
+
+# Operational views compare against "now", so their validators expire each minute.
+TIME_RELATIVE_VIEWS = {"no_update_48h", "open_over_10d"}
+
+MAX_BATCH_IDS = 200
+DEFAULT_BATCH_LOG_LIMIT = 50
+EVALUATION_INCLUDES = ("details", "nested", "logs")
+# Log target types whose target_id is the evaluation id itself.
+EVALUATION_LOG_TARGETS = (
+    "evaluation",
+    "evaluation_status",
+    "evaluation_nested_process",
+)
+# View counter targets keyed by evaluation id; "evaluation_process" views are
+# keyed by process id and joined through EvaluationProcess.
+EVALUATION_VIEW_TARGETS = (
+    "evaluation",
+    "evaluation_nested_process",
+    "evaluation_processes",
+)
 
 
 def _safe_int(value: object, default: int = 0) -> int:
@@ -335,14 +447,23 @@ def _failure_evaluation_ids_query():
     )
 
 
-def _apply_evaluation_base_filters(query, args):
-    evaluation_number = args.get("evaluation_number")
-    status = args.get("status")
-    evaluation_type = args.get("evaluation_type")
+def _product_filter_terms(args) -> list[str]:
     product_name = args.get("product_name")
     if not product_name:
         product_name = args.get("product")
-    product_names = _parse_multi_param(product_name, args.getlist("product"))
+    return _parse_multi_param(product_name, args.getlist("product"))
+
+
+def _evaluation_filter_clauses(args) -> dict[str, Any]:
+    """Return the list filter predicates keyed by their query parameter.
+
+    Keyed clauses let facet counts drop a single filter while reusing the
+    trigram lookups behind the others.
+    """
+    evaluation_number = args.get("evaluation_number")
+    status = args.get("status")
+    evaluation_type = args.get("evaluation_type")
+    product_names = _product_filter_terms(args)
 
     scs_charger_name = args.get("scs_charger_name")
     scs_charger_names = _parse_multi_param(
@@ -356,42 +477,39 @@ def _apply_evaluation_base_filters(query, args):
     start_date_from = args.get("start_date_from")
     start_date_to = args.get("start_date_to")
 
+    clauses: dict[str, Any] = {}
     if evaluation_number:
-        query = query.filter(
-            Evaluation.evaluation_number.ilike(f"%{evaluation_number}%")
+        clauses["evaluation_number"] = substring_filter(
+            Evaluation.evaluation_number, evaluation_number
         )
     if status:
-        query = query.filter(Evaluation.status == status)
+        clauses["status"] = Evaluation.status == status
     if evaluation_type:
-        query = query.filter(Evaluation.evaluation_type == evaluation_type)
+        clauses["evaluation_type"] = Evaluation.evaluation_type == evaluation_type
     if product_names:
-        query = query.filter(
-            or_(*[Evaluation.product_name.ilike(f"%{name}%") for name in product_names])
+        clauses["product_name"] = or_(
+            *[substring_filter(Evaluation.product_name, name) for name in product_names]
         )
     if scs_charger_names:
-        query = query.filter(
-            or_(
-                *[
-                    Evaluation.scs_charger_name.ilike(f"%{name}%")
-                    for name in scs_charger_names
-                ]
-            )
+        clauses["scs_charger_name"] = or_(
+            *[
+                substring_filter(Evaluation.scs_charger_name, name)
+                for name in scs_charger_names
+            ]
         )
     if head_office_charger_names:
-        query = query.filter(
-            or_(
-                *[
-                    Evaluation.head_office_charger_name.ilike(f"%{name}%")
-                    for name in head_office_charger_names
-                ]
-            )
+        clauses["head_office_charger_name"] = or_(
+            *[
+                substring_filter(Evaluation.head_office_charger_name, name)
+                for name in head_office_charger_names
+            ]
         )
     if start_date_from:
         try:
             start_date_from_value = datetime.strptime(
                 start_date_from, "%Y-%m-%d"
             ).date()
-            query = query.filter(Evaluation.start_date >= start_date_from_value)
+            clauses["start_date_from"] = Evaluation.start_date >= start_date_from_value
         except ValueError:
             current_app.logger.warning(
                 "Invalid start_date_from parameter: %s", start_date_from
@@ -399,39 +517,47 @@ def _apply_evaluation_base_filters(query, args):
     if start_date_to:
         try:
             start_date_to_value = datetime.strptime(start_date_to, "%Y-%m-%d").date()
-            query = query.filter(Evaluation.start_date <= start_date_to_value)
+            clauses["start_date_to"] = Evaluation.start_date <= start_date_to_value
         except ValueError:
             current_app.logger.warning(
                 "Invalid start_date_to parameter: %s", start_date_to
             )
 
-    return query
+    return clauses
 
 
-def _apply_operational_view(query, operational_view: str | None):
+def _apply_evaluation_base_filters(query, args):
+    return query.filter(*_evaluation_filter_clauses(args).values())
+
+
+def _operational_view_clause(operational_view: str | None):
+    """Return the predicate of an operational view, or None for no filter."""
     now = utcnow()
     today = now.date()
 
     if not operational_view:
-        return query
+        return None
     if operational_view not in VALID_OPERATIONAL_VIEWS:
         current_app.logger.warning("Unsupported operational_view: %s", operational_view)
-        return query
-    if operational_view == "all":
-        return query
+        return None
     if operational_view == "all_active":
-        return query.filter(Evaluation.status.in_(ACTIVE_EVALUATION_STATUSES))
+        return Evaluation.status.in_(ACTIVE_EVALUATION_STATUSES)
     if operational_view == "no_update_48h":
-        return query.filter(
+        return and_(
             Evaluation.status.in_(ACTIVE_EVALUATION_STATUSES),
             Evaluation.updated_at <= now - timedelta(hours=48),
         )
     if operational_view == "open_over_10d":
-        return query.filter(
+        return and_(
             Evaluation.status.in_(ACTIVE_EVALUATION_STATUSES),
             Evaluation.start_date <= today - timedelta(days=10),
         )
-    return query
+    return None
+
+
+def _apply_operational_view(query, operational_view: str | None):
+    clause = _operational_view_clause(operational_view)
+    return query if clause is None else query.filter(clause)
 
 
 def _median(values: list[float]) -> float:
@@ -444,6 +570,362 @@ def _median(values: list[float]) -> float:
     return round((ordered[midpoint - 1] + ordered[midpoint]) / 2, 1)
 
 
+def _is_truthy(value: str | None) -> bool:
+    return str(value or "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _resolve_sort(args) -> tuple[str | None, bool]:
+    sort_by = args.get("sort_by")
+    if sort_by not in EVALUATION_SORT_COLUMNS:
+        sort_by = None
+    descending = args.get("sort_order", "desc").lower() != "asc"
+    return sort_by, descending
+
+
+def _apply_evaluation_sort(query, sort_by: str | None, descending: bool):
+    if sort_by is None:
+        return query.order_by(Evaluation.created_at.desc())
+    column = EVALUATION_SORT_COLUMNS[sort_by]
+    return query.order_by(
+        column.desc() if descending else column.asc(), Evaluation.created_at.desc()
+    )
+
+
+def _encode_cursor(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(token: str) -> dict[str, Any]:
+    padded = token + "=" * (-len(token) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error, UnicodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+    return payload
+
+
+def _cursor_value(value: object) -> object:
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    return value
+
+
+def _parse_cursor_value(column, value: object) -> object:
+    if value is None:
+        return None
+    column_type = column.property.columns[0].type
+    if isinstance(column_type, db.DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column_type, db.Date):
+        return date.fromisoformat(value)
+    return value
+
+
+def _keyset_sort_expression(sort_by: str):
+    """Return the sort expression used for keyset pages.
+
+    Enum columns are compared as text so ORDER BY and the keyset predicate
+    agree on every dialect (MySQL/PostgreSQL order enums by declaration).
+    """
+    column = EVALUATION_SORT_COLUMNS[sort_by]
+    if isinstance(column.property.columns[0].type, db.Enum):
+        return cast(column, db.String)
+    return column
+
+
+def _apply_keyset_order(query, sort_by: str | None, descending: bool):
+    order = []
+    if sort_by is not None:
+        column = EVALUATION_SORT_COLUMNS[sort_by]
+        expression = _keyset_sort_expression(sort_by)
+        if column.property.columns[0].nullable:
+            # Portable NULLS LAST for both directions.
+            order.append(column.is_(None).asc())
+        order.append(expression.desc() if descending else expression.asc())
+    order.extend([Evaluation.created_at.desc(), Evaluation.id.desc()])
+    return query.order_by(*order)
+
+
+def _apply_keyset_position(query, sort_by: str | None, descending: bool, values):
+    sort_value, created_at_value, id_value = values
+    created_at_value = _parse_cursor_value(Evaluation.created_at, created_at_value)
+    tiebreak = or_(
+        Evaluation.created_at < created_at_value,
+        and_(
+            Evaluation.created_at == created_at_value,
+            Evaluation.id < int(id_value),
+        ),
+    )
+    if sort_by is None:
+        return query.filter(tiebreak)
+
+    column = EVALUATION_SORT_COLUMNS[sort_by]
+    expression = _keyset_sort_expression(sort_by)
+    nullable = column.property.columns[0].nullable
+    if sort_value is None:
+        if not nullable:
+            raise ValueError("Invalid cursor")
+        return query.filter(column.is_(None), tiebreak)
+
+    sort_value = _parse_cursor_value(column, sort_value)
+    beyond = expression < sort_value if descending else expression > sort_value
+    conditions = [beyond, and_(expression == sort_value, tiebreak)]
+    if nullable:
+        conditions.append(column.is_(None))
+    return query.filter(or_(*conditions))
+
+
+def _keyset_page(query, args, per_page: int):
+    """Fetch one keyset page ordered by the requested sort plus created_at/id.
+
+    Returns the page rows and the opaque cursor for the following page. The
+    cursor embeds the sort key so it cannot be replayed against another order.
+    """
+    sort_by, descending = _resolve_sort(args)
+    direction = "desc" if descending else "asc"
+    token = args.get("cursor")
+    if token:
+        cursor = _decode_cursor(token)
+        values = cursor.get("v")
+        if (
+            cursor.get("s") != (sort_by or "")
+            or cursor.get("d") != direction
+            or not isinstance(values, list)
+            or len(values) != 3
+        ):
+            raise ValueError("Cursor does not match the requested sort order")
+        try:
+            query = _apply_keyset_position(query, sort_by, descending, values)
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+
+    rows = _apply_keyset_order(query, sort_by, descending).limit(per_page + 1).all()
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        last = rows[-1]
+        sort_value = getattr(last, sort_by) if sort_by else None
+        next_cursor = _encode_cursor(
+            {
+                "s": sort_by or "",
+                "d": direction,
+                "v": [
+                    _cursor_value(sort_value),
+                    _cursor_value(last.created_at),
+                    last.id,
+                ],
+            }
+        )
+    return rows, next_cursor
+
+
+def _resolve_list_fields(args) -> list[str] | None:
+    """Return the projected field list for a list request, or None for full rows.
+
+    ``fields`` takes precedence over ``view``; ``id`` is always included.
+    """
+    requested = _parse_multi_param(None, args.getlist("fields"))
+    view = (args.get("view") or "full").strip().lower()
+    if view not in {"full", "summary"}:
+        raise ValueError(f"Unsupported view: {view}")
+    if not requested:
+        if view == "full":
+            return None
+        requested = list(Evaluation.SUMMARY_FIELDS)
+    allowed = set(Evaluation.column_fields()) | {"nand_info"}
+    unknown = [field for field in requested if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return _dedupe_preserve_order(["id", *requested])
+
+
+def _with_nand_info(query):
+    return query.options(
+        selectinload(Evaluation.nand_evaluation).options(
+            joinedload(NandEvaluation.nand_product),
+            selectinload(NandEvaluation.source_relations),
+        )
+    )
+
+
+def _project_evaluation_query(query, fields: list[str], args):
+    """Restrict the SELECT list to the requested columns.
+
+    The keyset columns (sort column, created_at, id) are selected as well so
+    cursor pages can be built from the rows; they are not serialized unless
+    requested.
+    """
+    sort_by, _ = _resolve_sort(args)
+    selected = [field for field in fields if field != "nand_info"]
+    selected = _dedupe_preserve_order(
+        [*selected, "created_at", *([sort_by] if sort_by else [])]
+    )
+    return query.with_entities(*[getattr(Evaluation, name) for name in selected])
+
+
+def _serialize_evaluation_rows(rows, fields: list[str] | None, tz) -> list[dict]:
+    if fields is None:
+        return [evaluation.to_dict(tz=tz) for evaluation in rows]
+
+    columns = [field for field in fields if field != "nand_info"]
+    evaluations = [Evaluation.row_to_dict(row, columns, tz=tz) for row in rows]
+    if "nand_info" in fields and evaluations:
+        nand_rows = (
+            NandEvaluation.query.options(
+                joinedload(NandEvaluation.nand_product),
+                selectinload(NandEvaluation.source_relations),
+            )
+            .filter(
+                NandEvaluation.evaluation_id.in_([item["id"] for item in evaluations])
+            )
+            .all()
+        )
+        nand_by_evaluation = {
+            row.evaluation_id: row.to_dict(tz=tz) for row in nand_rows
+        }
+        for item in evaluations:
+            item["nand_info"] = nand_by_evaluation.get(item["id"])
+    return evaluations
+
+
+def _change_marker(model, *criteria) -> list:
+    """Return ``count`` and ``max(updated_at)`` scalar subqueries for a table."""
+    return [
+        select(db.func.count(model.id)).where(*criteria).scalar_subquery(),
+        select(db.func.max(model.updated_at)).where(*criteria).scalar_subquery(),
+    ]
+
+
+def _nested_change_markers(evaluation_id: int) -> list:
+    # Every nested save appends a raw record, so its max id changes with it.
+    return [
+        *_change_marker(
+            EvaluationProcessLot, EvaluationProcessLot.evaluation_id == evaluation_id
+        ),
+        *_change_marker(
+            EvaluationProcessStep, EvaluationProcessStep.evaluation_id == evaluation_id
+        ),
+        *_change_marker(
+            EvaluationNestedProcess,
+            EvaluationNestedProcess.evaluation_id == evaluation_id,
+        ),
+        select(db.func.max(EvaluationProcessRaw.id))
+        .where(EvaluationProcessRaw.evaluation_id == evaluation_id)
+        .scalar_subquery(),
+    ]
+
+
+def _time_bucket(time_relative: bool) -> str | None:
+    """Minute bucket for payloads that compare against "now"."""
+    return utcnow().strftime("%Y%m%d%H%M") if time_relative else None
+
+
+def _evaluation_list_etag(tz, version: str) -> str:
+    """Validator for a list page: filter set plus the evaluations version."""
+    return compute_etag(
+        "evaluation_list",
+        request_fingerprint(request),
+        timezone_label(tz),
+        version,
+        _time_bucket(request.args.get("operational_view") in TIME_RELATIVE_VIEWS),
+    )
+
+
+def _cached_payload(namespace: str, version: str, tz, build, bucket=None):
+    """Return ``build()`` through the response cache.
+
+    ``version`` must be read before building so a concurrent write can only
+    make the cached payload newer than its key, never older.
+    """
+    key = ResponseCache.key(
+        namespace, version, request_fingerprint(request), timezone_label(tz), bucket
+    )
+    payload = ResponseCache.get(key)
+    if payload is None:
+        payload = build()
+        ResponseCache.set(key, payload)
+    return payload
+
+
+def _evaluation_detail_etag(evaluation: Evaluation, includes: set[str], tz) -> str:
+    """Validator for ``GET /<id>``.
+
+    VIEW logs are left out on purpose: every read writes one, so including
+    them would make each response unique. The validator is therefore weak.
+    """
+    evaluation_id = evaluation.id
+    process_ids = select(EvaluationProcess.id).where(
+        EvaluationProcess.evaluation_id == evaluation_id
+    )
+    latest_log = (
+        select(db.func.max(OperationLog.id))
+        .where(
+            OperationLog.operation_type != OperationType.VIEW.value,
+            or_(
+                and_(
+                    OperationLog.target_type.in_(EVALUATION_LOG_TARGETS),
+                    OperationLog.target_id == evaluation_id,
+                ),
+                and_(
+                    OperationLog.target_type == "evaluation_process",
+                    OperationLog.target_id.in_(process_ids),
+                ),
+            ),
+        )
+        .scalar_subquery()
+    )
+    markers = db.session.execute(
+        select(
+            *_change_marker(
+                NandEvaluation, NandEvaluation.evaluation_id == evaluation_id
+            ),
+            *_change_marker(
+                EvaluationDetail, EvaluationDetail.evaluation_id == evaluation_id
+            ),
+            *_change_marker(
+                EvaluationResult, EvaluationResult.evaluation_id == evaluation_id
+            ),
+            *_change_marker(
+                EvaluationProcess, EvaluationProcess.evaluation_id == evaluation_id
+            ),
+            latest_log,
+            *(_nested_change_markers(evaluation_id) if "nested" in includes else []),
+        )
+    ).one()
+    return compute_etag(
+        "evaluation",
+        evaluation_id,
+        evaluation.updated_at,
+        request_fingerprint(request),
+        timezone_label(tz),
+        list(markers),
+    )
+
+
+def _nested_markers(evaluation_id: int) -> tuple:
+    return tuple(
+        db.session.execute(select(*_nested_change_markers(evaluation_id))).one()
+    )
+
+
+def _nested_state(markers: tuple) -> str:
+    """Token of the nested tables' state, recorded with each snapshot."""
+    return compute_etag("evaluation_nested_state", list(markers))
+
+
+def _nested_process_etag(evaluation: Evaluation, tz, markers: tuple) -> str:
+    return compute_etag(
+        "evaluation_nested_process",
+        evaluation.id,
+        request_fingerprint(request),
+        timezone_label(tz),
+        list(markers),
+    )
+
+
 STEP_CODE_CANONICAL = {
     "M010": "M010",
     "M031": "M031",
@@ -466,46 +948,6 @@ def _canonical_step_code(value: str) -> str:
     return canonical
 
 
-def _ensure_fail_code_record(
-    code_text: str | None,
-    provided_id: int | None,
-    snapshot: str | None,
-    warnings: list[str],
-) -> FailCode | None:
-    normalized = (code_text or "").strip().upper()
-    if not normalized and not provided_id:
-        return None
-
-    fail_code = None
-    if provided_id is not None:
-        fail_code = FailCode.query.get(provided_id)
-        if fail_code and normalized and fail_code.code != normalized:
-            warnings.append(
-                f"Fail code id {provided_id} does not match provided text '{normalized}', using text value."
-            )
-            fail_code = None
-
-    if fail_code is None and normalized:
-        fail_code = FailCode.query.filter_by(code=normalized).first()
-
-    if fail_code is None and normalized:
-        fail_code = FailCode(
-            code=normalized,
-            short_name=(snapshot or None),
-            is_provisional=True,
-            source="nested-ui",
-        )
-        db.session.add(fail_code)
-        db.session.flush()
-    elif fail_code is not None:
-        if snapshot and not fail_code.short_name:
-            fail_code.short_name = snapshot
-        if not fail_code.source:
-            fail_code.source = "nested-ui"
-
-    return fail_code
-
-
 def _normalize_process_key(raw_key: str | None, index: int, seen: set[str]) -> str:
     candidate = (raw_key or "").strip()
     if not candidate:
@@ -1044,6 +1486,60 @@ def generate_evaluation_number() -> str:
     return f"EVAL-{date_str}-{next_number:04d}"
 
 
+def _build_evaluation_list_page(args, tz) -> dict[str, Any]:
+    """Run the list query for ``GET /api/evaluations``.
+
+    Raises:
+        ValueError: For an unknown field/view or an invalid cursor.
+    """
+    page = args.get("page", 1, type=int)
+    per_page = args.get("per_page", 10, type=int)
+
+    # Build query
+    query = _apply_evaluation_base_filters(Evaluation.query, args)
+    query = _apply_operational_view(query, args.get("operational_view"))
+
+    fields = _resolve_list_fields(args)
+    if fields is None:
+        query = _with_nand_info(query)
+    else:
+        query = _project_evaluation_query(query, fields, args)
+
+    cursor_mode = args.get("pagination") == "cursor" or "cursor" in args
+    if cursor_mode:
+        per_page = max(1, min(per_page, MAX_CURSOR_PAGE_SIZE))
+        rows, next_cursor = _keyset_page(query, args, per_page)
+        total = (
+            query.order_by(None).count()
+            if _is_truthy(args.get("include_total"))
+            else None
+        )
+        return {
+            "evaluations": _serialize_evaluation_rows(rows, fields, tz),
+            "per_page": per_page,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+            "total": total,
+        }
+
+    sort_by, descending = _resolve_sort(args)
+    query = _apply_evaluation_sort(query, sort_by, descending)
+
+    # Paginate results
+    paginated_evaluations = query.paginate(
+        page=page, per_page=per_page, error_out=False
+    )
+    return {
+        "evaluations": _serialize_evaluation_rows(
+            paginated_evaluations.items, fields, tz
+        ),
+        "total": paginated_evaluations.total,
+        "page": page,
+        "per_page": per_page,
+        "pages": paginated_evaluations.pages,
+    }
+
+
 @evaluation_bp.route("", methods=["GET"])
 def get_evaluations() -> tuple[Response, int]:
     """Get a list of evaluations with optional filtering.
@@ -1059,11 +1555,17 @@ def get_evaluations() -> tuple[Response, int]:
         head_office_charger_name (str, optional): Filter by Head Office Charger name.
         start_date_from (str, optional): Filter evaluations starting on or after this date (YYYY-MM-DD).
         start_date_to (str, optional): Filter evaluations starting on or before this date (YYYY-MM-DD).
+        pagination (str, optional): Set to ``cursor`` for keyset pagination.
+        cursor (str, optional): Opaque ``next_cursor`` from the previous page; implies cursor mode.
+        include_total (bool, optional): In cursor mode, also run the COUNT query.
+        view (str, optional): ``summary`` returns only the list columns (Evaluation.SUMMARY_FIELDS).
+        fields (str, optional): Comma-separated columns to return; ``nand_info`` is batch-loaded on request.
 
     Returns:
         Tuple[Response, int]: JSON response with evaluation list and HTTP status code.
 
     Raises:
+        400: If the cursor is malformed or does not match the requested sort.
         500: If database operation fails.
     ---
     tags:
@@ -1127,6 +1629,42 @@ def get_evaluations() -> tuple[Response, int]:
           type: string
           format: date
         description: Filter evaluations starting on or before this date
+      - name: pagination
+        in: query
+        schema:
+          type: string
+          enum: [offset, cursor]
+          default: offset
+        description: >-
+          Pagination mode. Cursor mode uses keyset seeks ordered by the sort
+          column, created_at and id, and skips the COUNT query.
+      - name: cursor
+        in: query
+        schema:
+          type: string
+        description: Opaque next_cursor returned by the previous cursor page
+      - name: include_total
+        in: query
+        schema:
+          type: boolean
+          default: false
+        description: Include the total count in cursor mode
+      - name: view
+        in: query
+        schema:
+          type: string
+          enum: [full, summary]
+          default: full
+        description: >-
+          summary selects only the list columns at the SQL level and omits
+          remarks, process notes, the PGM login image and nand_info
+      - name: fields
+        in: query
+        schema:
+          type: string
+        description: >-
+          Comma-separated evaluation columns to return (overrides view); id is
+          always included and nand_info may be requested explicitly
     responses:
       200:
         description: List of evaluations
@@ -1179,6 +1717,15 @@ def get_evaluations() -> tuple[Response, int]:
                       type: integer
                     pages:
                       type: integer
+                    next_cursor:
+                      type: string
+                      nullable: true
+                      description: Cursor mode only
+                    has_more:
+                      type: boolean
+                      description: Cursor mode only
+      400:
+        description: Invalid cursor, view or field name
       401:
         description: Unauthorized
       500:
@@ -1186,52 +1733,26 @@ def get_evaluations() -> tuple[Response, int]:
 
     """
     try:
-        # Get query parameters
-        page = request.args.get("page", 1, type=int)
-        per_page = request.args.get("per_page", 10, type=int)
-        operational_view = request.args.get("operational_view")
-
         tz = resolve_timezone_from_request(request.args)
 
-        # Build query
-        query = _apply_evaluation_base_filters(Evaluation.query, request.args)
-        query = _apply_operational_view(query, operational_view)
-
-        # Sorting
-        sort_by = request.args.get("sort_by")
-        sort_order = request.args.get("sort_order", "desc").lower()
-        allowed_sorts = {
-            "evaluation_number": Evaluation.evaluation_number,
-            "evaluation_name": Evaluation.evaluation_name,
-            "evaluation_type": Evaluation.evaluation_type,
-            "product_name": Evaluation.product_name,
-            "part_number": Evaluation.part_number,
-            "status": Evaluation.status,
-            "start_date": Evaluation.start_date,
-            "actual_end_date": Evaluation.actual_end_date,
-            "scs_charger_name": Evaluation.scs_charger_name,
-            "head_office_charger_name": Evaluation.head_office_charger_name,
-        }
-
-        if sort_by in allowed_sorts:
-            column = allowed_sorts[sort_by]
-            if sort_order == "asc":
-                query = query.order_by(column.asc(), Evaluation.created_at.desc())
-            else:
-                query = query.order_by(column.desc(), Evaluation.created_at.desc())
-        else:
-            query = query.order_by(Evaluation.created_at.desc())
-
-        # Paginate results
-        paginated_evaluations = query.paginate(
-            page=page, per_page=per_page, error_out=False
-        )
+        version = version_token()
+        etag = _evaluation_list_etag(tz, version)
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
 
-        # Format response
-        evaluations = []
-        for evaluation in paginated_evaluations.items:
-            evaluation_data = evaluation.to_dict(tz=tz)
-            evaluations.append(evaluation_data)
+        try:
+            page_data = _cached_payload(
+                "evaluation_list",
+                version,
+                tz,
+                lambda: _build_evaluation_list_page(request.args, tz),
+                _time_bucket(
+                    request.args.get("operational_view") in TIME_RELATIVE_VIEWS
+                ),
+            )
+        except ValueError as e:
+            return jsonify({"success": False, "message": str(e)}), 400
 
         # Log operation
         log = OperationLog(
@@ -1250,23 +1771,16 @@ def get_evaluations() -> tuple[Response, int]:
             status_code=200,
             success=True,
         )
-        db.session.add(log)
-        db.session.commit()
+        OperationLogWriter.record(log)
 
         response = jsonify(
             {
                 "success": True,
-                "data": {
-                    "evaluations": evaluations,
-                    "total": paginated_evaluations.total,
-                    "page": page,
-                    "per_page": per_page,
-                    "pages": paginated_evaluations.pages,
-                },
+                "data": page_data,
             }
         )
         response.headers["X-Server-Timezone"] = timezone_label(tz)
-        return response
+        return apply_etag(response, etag)
     except Exception as e:
         current_app.logger.error(f"Error getting evaluations: {str(e)}")
         return jsonify(
@@ -1274,85 +1788,779 @@ def get_evaluations() -> tuple[Response, int]:
         ), 500
 
 
-@evaluation_bp.route("/kpis", methods=["GET"])
-def get_evaluation_kpis() -> tuple[Response, int]:
-    """Get aggregate KPI metrics for the evaluation list console."""
-    try:
-        tz = resolve_timezone_from_request(request.args)
-        now = utcnow()
-        today = now.date()
-        month_start = today.replace(day=1)
-        month_start_at = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        if month_start.month == 12:
-            next_month_start = month_start.replace(year=month_start.year + 1, month=1)
-            next_month_start_at = month_start_at.replace(
-                year=month_start_at.year + 1, month=1
-            )
-        else:
-            next_month_start = month_start.replace(month=month_start.month + 1)
-            next_month_start_at = month_start_at.replace(month=month_start_at.month + 1)
+KPI_GROUP_COLUMNS = {
+    "evaluation_type": Evaluation.evaluation_type,
+    "product_name": Evaluation.product_name,
+    "scs_charger_name": Evaluation.scs_charger_name,
+}
+KPI_COUNT_FIELDS = (
+    "open_evaluations",
+    "stale_open_evaluations",
+    "open_over_10d",
+    "created_this_month",
+    "total_evaluations",
+    "completed_this_month",
+)
+# Filters and groupings the daily rollup has no dimension for.
+KPI_LIVE_ONLY_FILTERS = (
+    "evaluation_number",
+    "status",
+    "scs_charger_name",
+    "head_office_charger_name",
+    "start_date_from",
+    "start_date_to",
+)
+KPI_ROLLUP_GROUPS = {"evaluation_type", "product_name"}
+KPI_STALE_AFTER = timedelta(hours=48)
+
+
+def _count_when(*conditions):
+    return db.func.sum(case((and_(*conditions), 1), else_=0))
+
+
+def _sum_when(column, *conditions):
+    return db.func.sum(case((and_(*conditions), column), else_=0))
+
 
-        base_query = _apply_evaluation_base_filters(Evaluation.query, request.args)
-        open_query = base_query.filter(
-            Evaluation.status.in_(ACTIVE_EVALUATION_STATUSES)
+def _month_bounds(now: datetime) -> tuple[datetime, datetime]:
+    month_start_at = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if month_start_at.month == 12:
+        return month_start_at, month_start_at.replace(
+            year=month_start_at.year + 1, month=1
         )
+    return month_start_at, month_start_at.replace(month=month_start_at.month + 1)
+
+
+def _middle_values(histogram: dict[int, int]) -> list[int]:
+    """Return the one or two middle values of a ``{value: count}`` histogram."""
+    size = sum(histogram.values())
+    if size <= 0:
+        return []
+    positions = sorted({(size + 1) // 2, (size + 2) // 2})
+    values = []
+    seen = 0
+    for value in sorted(histogram):
+        count = histogram[value]
+        values.extend(
+            value for position in positions if seen < position <= seen + count
+        )
+        seen += count
+    return values
 
-        open_start_dates = [
-            row.start_date
-            for row in open_query.with_entities(Evaluation.start_date).all()
-            if row.start_date
-        ]
-        open_ages = [
-            max((today - start_date).days, 0) for start_date in open_start_dates
-        ]
 
-        data = {
-            "open_evaluations": open_query.count(),
-            "stale_open_evaluations": open_query.filter(
-                Evaluation.updated_at <= now - timedelta(hours=48)
-            ).count(),
-            "open_over_10d": open_query.filter(
-                Evaluation.start_date <= today - timedelta(days=10)
-            ).count(),
-            "median_open_age_days": _median(open_ages),
-            "created_this_month": base_query.filter(
-                Evaluation.created_at >= month_start_at,
-                Evaluation.created_at < next_month_start_at,
-            ).count(),
-            "total_evaluations": base_query.count(),
-            "completed_this_month": base_query.filter(
-                Evaluation.status == EvaluationStatus.COMPLETED.value,
-                Evaluation.actual_end_date >= month_start,
-                Evaluation.actual_end_date < next_month_start,
-            ).count(),
+def _kpi_payload(group_by: str | None, groups: list[dict], overall_median) -> dict:
+    """Shape per-group metrics into the ``/kpis`` response data."""
+    if group_by is None:
+        metrics = groups[0] if groups else {}
+        return {
+            **{field: metrics.get(field, 0) for field in KPI_COUNT_FIELDS},
+            "median_open_age_days": overall_median,
         }
+    groups.sort(key=lambda group: (-group["total_evaluations"], str(group["key"])))
+    return {
+        **{field: sum(group[field] for group in groups) for field in KPI_COUNT_FIELDS},
+        "median_open_age_days": overall_median,
+        "group_by": group_by,
+        "groups": groups,
+    }
 
-        response = jsonify({"success": True, "data": data})
-        response.headers["X-Server-Timezone"] = timezone_label(tz)
-        return response
-    except Exception as e:
-        current_app.logger.error(f"Error getting evaluation KPIs: {str(e)}")
-        return jsonify(
-            {
-                "success": False,
-                "message": "Failed to get evaluation KPIs",
-                "error": str(e),
-            }
-        ), 500
 
+def _kpi_median_open_ages(base_query, group_column, today) -> tuple[float, dict]:
+    """Median open age overall and per group, computed in the database.
 
-@evaluation_bp.route("/<int:evaluation_id>", methods=["GET"])
-def get_evaluation(evaluation_id: int) -> tuple[Response, int]:
-    """Get details of a specific evaluation.
+    Window functions rank open start dates; only the one or two middle rows
+    of each partition are returned, so no full column reaches Python.
+    """
+    is_open = Evaluation.status.in_(ACTIVE_EVALUATION_STATUSES)
+    group_key = group_column if group_column is not None else literal(None)
+    partition = [group_column] if group_column is not None else None
+    ranked = (
+        base_query.filter(is_open, Evaluation.start_date.isnot(None))
+        .with_entities(
+            group_key.label("group_key"),
+            Evaluation.start_date.label("start_date"),
+            db.func.row_number()
+            .over(order_by=Evaluation.start_date)
+            .label("overall_position"),
+            db.func.count().over().label("overall_size"),
+            db.func.row_number()
+            .over(partition_by=partition, order_by=Evaluation.start_date)
+            .label("group_position"),
+            db.func.count().over(partition_by=partition).label("group_size"),
+        )
+        .subquery()
+    )
 
-    Args:
-        evaluation_id (int): ID of the evaluation to retrieve.
+    def _is_middle(position, size):
+        return position.in_([(size + 1) // 2, (size + 2) // 2])
 
-    Returns:
-        Tuple[Response, int]: JSON response with evaluation details and HTTP status code.
+    rows = db.session.execute(
+        select(ranked).where(
+            or_(
+                _is_middle(ranked.c.overall_position, ranked.c.overall_size),
+                _is_middle(ranked.c.group_position, ranked.c.group_size),
+            )
+        )
+    ).all()
+
+    overall: list[int] = []
+    groups: dict[Any, list[int]] = {}
+    for row in rows:
+        age = max((today - row.start_date).days, 0)
+        if row.overall_position in {
+            (row.overall_size + 1) // 2,
+            (row.overall_size + 2) // 2,
+        }:
+            overall.append(age)
+        if row.group_position in {
+            (row.group_size + 1) // 2,
+            (row.group_size + 2) // 2,
+        }:
+            groups.setdefault(row.group_key, []).append(age)
+    return _median(overall), {key: _median(ages) for key, ages in groups.items()}
+
+
+def _build_live_kpis(args, group_by: str | None, now: datetime) -> dict[str, Any]:
+    """KPIs from one conditional-aggregate query over ``evaluations``."""
+    group_column = KPI_GROUP_COLUMNS.get(group_by)
+    today = now.date()
+    month_start_at, next_month_start_at = _month_bounds(now)
+
+    base_query = _apply_evaluation_base_filters(Evaluation.query, args)
+    is_open = Evaluation.status.in_(ACTIVE_EVALUATION_STATUSES)
+    group_key = group_column if group_column is not None else literal(None)
+    query = base_query.with_entities(
+        group_key.label("group_key"),
+        _count_when(is_open).label("open_evaluations"),
+        _count_when(is_open, Evaluation.updated_at <= now - KPI_STALE_AFTER).label(
+            "stale_open_evaluations"
+        ),
+        _count_when(is_open, Evaluation.start_date <= today - timedelta(days=10)).label(
+            "open_over_10d"
+        ),
+        _count_when(
+            Evaluation.created_at >= month_start_at,
+            Evaluation.created_at < next_month_start_at,
+        ).label("created_this_month"),
+        db.func.count(Evaluation.id).label("total_evaluations"),
+        _count_when(
+            Evaluation.status == EvaluationStatus.COMPLETED.value,
+            Evaluation.actual_end_date >= month_start_at.date(),
+            Evaluation.actual_end_date < next_month_start_at.date(),
+        ).label("completed_this_month"),
+    )
+    if group_column is not None:
+        query = query.group_by(group_column)
+    overall_median, group_medians = _kpi_median_open_ages(
+        base_query, group_column, today
+    )
 
-    Raises:
-        404: If evaluation not found.
+    groups = [
+        {
+            "key": row.group_key,
+            **{field: int(getattr(row, field) or 0) for field in KPI_COUNT_FIELDS},
+            "median_open_age_days": group_medians.get(row.group_key, 0),
+        }
+        for row in query.all()
+    ]
+    return _kpi_payload(group_by, groups, overall_median)
+
+
+def _kpi_rollup_applies(args, group_by: str | None) -> bool:
+    if not current_app.config.get("KPI_ROLLUP_ENABLED", True):
+        return False
+    if group_by is not None and group_by not in KPI_ROLLUP_GROUPS:
+        return False
+    return not any(
+        value for key in KPI_LIVE_ONLY_FILTERS for value in args.getlist(key)
+    )
+
+
+def _build_rollup_kpis(args, group_by: str | None, now: datetime) -> dict[str, Any]:
+    """KPIs from the ``evaluation_kpi_daily`` rollup.
+
+    Day buckets answer every card exactly except the partial day at the
+    48-hour stale cutoff, which is counted live through the
+    ``(status, updated_at)`` index.
+    """
+    rollup = EvaluationKpiDaily
+    today = now.date()
+    month_start_at, next_month_start_at = _month_bounds(now)
+    stale_cutoff = now - KPI_STALE_AFTER
+    stale_day_start = stale_cutoff.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    criteria = []
+    if args.get("evaluation_type"):
+        criteria.append(rollup.evaluation_type == args.get("evaluation_type"))
+    product_names = _product_filter_terms(args)
+    if product_names:
+        criteria.append(
+            or_(*[rollup.product_name.ilike(f"%{name}%") for name in product_names])
+        )
+    group_column = getattr(rollup, group_by) if group_by else None
+    group_key = group_column if group_column is not None else literal(None)
+    group_columns = [group_column] if group_column is not None else []
+
+    in_month = and_(
+        rollup.day >= month_start_at.date(), rollup.day < next_month_start_at.date()
+    )
+    counters = (
+        select(
+            group_key.label("group_key"),
+            db.func.sum(rollup.open_updated_count).label("open_evaluations"),
+            _sum_when(
+                rollup.open_updated_count, rollup.day < stale_cutoff.date()
+            ).label("stale_open_evaluations"),
+            _sum_when(
+                rollup.open_started_count, rollup.day <= today - timedelta(days=10)
+            ).label("open_over_10d"),
+            _sum_when(rollup.created_count, in_month).label("created_this_month"),
+            db.func.sum(rollup.created_count).label("total_evaluations"),
+            _sum_when(rollup.completed_count, in_month).label("completed_this_month"),
+        )
+        .where(*criteria)
+        .group_by(*group_columns)
+    )
+    histogram_rows = db.session.execute(
+        select(
+            group_key.label("group_key"),
+            rollup.day,
+            db.func.sum(rollup.open_started_count).label("open_started"),
+        )
+        .where(*criteria, rollup.open_started_count != 0)
+        .group_by(*group_columns, rollup.day)
+    ).all()
+
+    live_group_column = KPI_GROUP_COLUMNS.get(group_by)
+    boundary_query = (
+        _apply_evaluation_base_filters(Evaluation.query, args)
+        .filter(
+            Evaluation.status.in_(ACTIVE_EVALUATION_STATUSES),
+            Evaluation.updated_at >= stale_day_start,
+            Evaluation.updated_at <= stale_cutoff,
+        )
+        .with_entities(
+            (
+                live_group_column if live_group_column is not None else literal(None)
+            ).label("group_key"),
+            db.func.count(Evaluation.id).label("stale"),
+        )
+    )
+    if live_group_column is not None:
+        boundary_query = boundary_query.group_by(live_group_column)
+    stale_boundary = {row.group_key: row.stale for row in boundary_query.all()}
+
+    overall_ages: dict[int, int] = {}
+    group_ages: dict[Any, dict[int, int]] = {}
+    for row in histogram_rows:
+        age = max((today - row.day).days, 0)
+        count = int(row.open_started or 0)
+        overall_ages[age] = overall_ages.get(age, 0) + count
+        ages = group_ages.setdefault(row.group_key, {})
+        ages[age] = ages.get(age, 0) + count
+
+    groups = []
+    for row in db.session.execute(counters).all():
+        metrics = {field: int(getattr(row, field) or 0) for field in KPI_COUNT_FIELDS}
+        if group_by is not None and not metrics["total_evaluations"]:
+            # Counter rows can outlive the last evaluation of their group.
+            continue
+        metrics["stale_open_evaluations"] += stale_boundary.get(row.group_key, 0)
+        groups.append(
+            {
+                "key": row.group_key,
+                **metrics,
+                "median_open_age_days": _median(
+                    _middle_values(group_ages.get(row.group_key, {}))
+                ),
+            }
+        )
+    return _kpi_payload(group_by, groups, _median(_middle_values(overall_ages)))
+
+
+def _build_evaluation_kpis(args) -> dict[str, Any]:
+    """Compute the KPI cards for ``GET /api/evaluations/kpis``.
+
+    Answers from the daily rollup when the filters map onto its dimensions
+    (evaluation type, product) and from live aggregates otherwise.
+
+    Raises:
+        ValueError: For an unsupported ``group_by`` column.
+    """
+    group_by = args.get("group_by") or None
+    if group_by is not None and group_by not in KPI_GROUP_COLUMNS:
+        raise ValueError(f"Unsupported group_by: {group_by}")
+
+    now = utcnow()
+    if _kpi_rollup_applies(args, group_by):
+        return _build_rollup_kpis(args, group_by, now)
+    return _build_live_kpis(args, group_by, now)
+
+
+@evaluation_bp.route("/kpis", methods=["GET"])
+def get_evaluation_kpis() -> tuple[Response, int]:
+    """Get aggregate KPI metrics for the evaluation list console.
+
+    Accepts every list filter plus ``group_by`` (evaluation_type,
+    product_name or scs_charger_name) for per-group KPIs in the same pass.
+    """
+    try:
+        tz = resolve_timezone_from_request(request.args)
+        version = version_token()
+        # KPIs compare against "now", so cached values roll over each minute.
+        try:
+            data = _cached_payload(
+                "evaluation_kpis",
+                version,
+                tz,
+                lambda: _build_evaluation_kpis(request.args),
+                _time_bucket(True),
+            )
+        except ValueError as e:
+            return jsonify({"success": False, "message": str(e)}), 400
+
+        response = jsonify({"success": True, "data": data})
+        response.headers["X-Server-Timezone"] = timezone_label(tz)
+        return response
+    except Exception as e:
+        current_app.logger.error(f"Error getting evaluation KPIs: {str(e)}")
+        return jsonify(
+            {
+                "success": False,
+                "message": "Failed to get evaluation KPIs",
+                "error": str(e),
+            }
+        ), 500
+
+
+FACET_COLUMNS = {
+    "status": Evaluation.status,
+    "evaluation_type": Evaluation.evaluation_type,
+    "product_name": Evaluation.product_name,
+    "scs_charger_name": Evaluation.scs_charger_name,
+    "head_office_charger_name": Evaluation.head_office_charger_name,
+}
+# Values listed with a zero count when no evaluation matches them.
+FACET_FIXED_VALUES = {
+    "status": ALLOWED_EVALUATION_STATUSES,
+    "evaluation_type": ALLOWED_EVALUATION_TYPES,
+    "operational_view": ("all_active", "no_update_48h", "open_over_10d"),
+}
+
+
+def _build_evaluation_facets(args) -> dict[str, Any]:
+    """Count every console facet value in one UNION ALL statement.
+
+    Each facet is counted under all active filters except its own, so the
+    console can show how many rows selecting another value would return.
+    """
+    clauses = _evaluation_filter_clauses(args)
+    view_clause = _operational_view_clause(args.get("operational_view"))
+    count = db.func.count(Evaluation.id).label("count")
+
+    def _criteria(excluded: str | None = None, view=view_clause) -> list:
+        criteria = [clause for key, clause in clauses.items() if key != excluded]
+        return criteria + ([view] if view is not None else [])
+
+    branches = [
+        select(
+            literal("total").label("facet"),
+            cast(literal(None), db.String).label("value"),
+            count,
+        ).where(*_criteria())
+    ]
+    for facet, column in FACET_COLUMNS.items():
+        branches.append(
+            select(literal(facet), cast(column, db.String), count)
+            .where(*_criteria(facet))
+            .group_by(column)
+        )
+    for view in FACET_FIXED_VALUES["operational_view"]:
+        branches.append(
+            select(literal("operational_view"), literal(view), count).where(
+                *_criteria(view=_operational_view_clause(view))
+            )
+        )
+
+    facets: dict[str, dict] = {
+        facet: dict.fromkeys(FACET_FIXED_VALUES.get(facet, ()), 0)
+        for facet in (*FACET_COLUMNS, "operational_view")
+    }
+    total = 0
+    for row in db.session.execute(union_all(*branches)).all():
+        if row.facet == "total":
+            total = row.count
+        else:
+            facets[row.facet][row.value] = row.count
+
+    return {
+        "total": total,
+        "facets": {
+            facet: [
+                {"value": value, "count": value_count}
+                for value, value_count in sorted(
+                    counts.items(), key=lambda item: (-item[1], str(item[0]))
+                )
+            ]
+            for facet, counts in facets.items()
+        },
+    }
+
+
+@evaluation_bp.route("/facets", methods=["GET"])
+def get_evaluation_facets() -> tuple[Response, int]:
+    """Get filter facet counts for the evaluation console.
+
+    Query Parameters:
+        Every list filter plus ``operational_view``.
+
+    Returns:
+        Tuple[Response, int]: ``total`` plus ``facets`` mapping status,
+        evaluation_type, product_name, scs_charger_name,
+        head_office_charger_name and operational_view to ``{value, count}``
+        lists, each counted without its own filter.
+    ---
+    tags:
+      - Evaluations
+    responses:
+      200:
+        description: Facet counts
+      304:
+        description: Not modified since the supplied ETag
+      500:
+        description: Internal server error
+    """
+    try:
+        tz = resolve_timezone_from_request(request.args)
+        version = version_token()
+        # View facets compare against "now", so they roll over each minute.
+        bucket = _time_bucket(True)
+        etag = compute_etag(
+            "evaluation_facets",
+            request_fingerprint(request),
+            timezone_label(tz),
+            version,
+            bucket,
+        )
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        data = _cached_payload(
+            "evaluation_facets",
+            version,
+            tz,
+            lambda: _build_evaluation_facets(request.args),
+            bucket,
+        )
+
+        response = jsonify({"success": True, "data": data})
+        response.headers["X-Server-Timezone"] = timezone_label(tz)
+        return apply_etag(response, etag)
+    except Exception as e:
+        current_app.logger.error(f"Error getting evaluation facets: {str(e)}")
+        return jsonify(
+            {
+                "success": False,
+                "message": "Failed to get evaluation facets",
+                "error": str(e),
+            }
+        ), 500
+
+
+MAX_SUGGESTIONS = 50
+
+
+@evaluation_bp.route("/suggest", methods=["GET"])
+def suggest_filter_values() -> tuple[Response, int]:
+    """Suggest filter values for the typeahead of the evaluation console.
+
+    Query Parameters:
+        field (str): ``product`` (alias ``product_name``), ``scs_charger_name``
+            or ``head_office_charger_name``.
+        prefix (str, optional): Start of the value or of any word in it.
+        limit (int, optional): Maximum suggestions, default 10, at most 50.
+
+    Returns:
+        Tuple[Response, int]: ``suggestions`` as ``{value, count}`` ordered by
+        how many evaluations use the value. Served from the per-worker
+        in-memory index, so no VIEW log is written per keystroke.
+    ---
+    tags:
+      - Evaluations
+    responses:
+      200:
+        description: Suggestions
+      400:
+        description: Unsupported field or invalid limit
+      500:
+        description: Internal server error
+    """
+    try:
+        prefix = (request.args.get("prefix") or "").strip()
+        try:
+            field = SuggestionIndex.resolve_field(request.args.get("field"))
+            limit = int(request.args.get("limit", 10))
+        except ValueError as e:
+            return jsonify({"success": False, "message": str(e)}), 400
+        limit = max(1, min(limit, MAX_SUGGESTIONS))
+
+        return jsonify(
+            {
+                "success": True,
+                "data": {
+                    "field": field,
+                    "prefix": prefix,
+                    "suggestions": SuggestionIndex.suggest(field, prefix, limit),
+                },
+            }
+        )
+    except Exception as e:
+        current_app.logger.error(f"Error suggesting filter values: {str(e)}")
+        return jsonify(
+            {
+                "success": False,
+                "message": "Failed to suggest filter values",
+                "error": str(e),
+            }
+        ), 500
+
+
+@evaluation_bp.route("/export", methods=["GET"])
+def export_evaluations() -> Response | tuple[Response, int]:
+    """Stream evaluations with legacy results and nested processes.
+
+    Query Parameters:
+        format (str, optional): ``csv`` (default), ``ndjson`` or ``xlsx``.
+        ids (str, optional): Comma-separated evaluation ids to export.
+        All list filters and ``sort_by``/``sort_order`` are honoured.
+
+    Returns:
+        Response: Streaming attachment. NDJSON lines hold ``to_dict`` plus
+        ``results`` and the ``nested`` payload of the nested process endpoint;
+        CSV/XLSX rows hold EXPORT_COLUMNS with a nested summary.
+    ---
+    tags:
+      - Evaluations
+    parameters:
+      - name: format
+        in: query
+        schema:
+          type: string
+          enum: [csv, ndjson, xlsx]
+          default: csv
+      - name: ids
+        in: query
+        schema:
+          type: string
+        description: Restrict the export to these evaluation ids
+    responses:
+      200:
+        description: Export file stream
+      400:
+        description: Unsupported format or XLSX support not installed
+      500:
+        description: Internal server error
+    """
+    try:
+        tz = resolve_timezone_from_request(request.args)
+        export_format = (request.args.get("format") or "csv").lower()
+        if export_format not in EXPORT_FORMATS:
+            return jsonify(
+                {"success": False, "message": f"Unsupported format: {export_format}"}
+            ), 400
+
+        workbook_class = None
+        if export_format == "xlsx":
+            try:
+                from openpyxl import Workbook as workbook_class
+            except ImportError:
+                return jsonify(
+                    {
+                        "success": False,
+                        "message": "XLSX export requires the openpyxl package",
+                    }
+                ), 400
+
+        query = _apply_evaluation_base_filters(Evaluation.query, request.args)
+        query = _apply_operational_view(query, request.args.get("operational_view"))
+        ids = [
+            _safe_int(value, default=None)
+            for value in _parse_multi_param(None, request.args.getlist("ids"))
+        ]
+        if ids:
+            query = query.filter(Evaluation.id.in_([i for i in ids if i is not None]))
+        sort_by, descending = _resolve_sort(request.args)
+        query = _apply_evaluation_sort(query, sort_by, descending).order_by(
+            Evaluation.id.desc()
+        )
+
+        log = OperationLog(
+            operation_type=OperationType.EXPORT.value,
+            target_type="evaluation_list",
+            target_id=None,
+            target_description=f"Exported evaluations as {export_format}",
+            operation_description=f"User exported evaluations with filters: {request.args}",
+            new_data={
+                "export_type": "evaluations",
+                "format": export_format,
+                "filters": request.args.to_dict(flat=False),
+            },
+            ip_address=get_client_ip(request),
+            user_agent=request.user_agent.string,
+            request_method=request.method,
+            request_path=request.path,
+            query_string=request.query_string.decode()
+            if request.query_string
+            else None,
+            status_code=200,
+            success=True,
+        )
+        OperationLogWriter.record(log, sync=True)
+
+        chunks = _iter_export_chunks(query, tz)
+        if export_format == "csv":
+            body = _stream_csv(chunks)
+        elif export_format == "ndjson":
+            body = _stream_ndjson(chunks)
+        else:
+            body = _stream_xlsx(chunks, workbook_class)
+
+        filename = f"evaluations_{utcnow().strftime('%Y%m%d_%H%M%S')}.{export_format}"
+        response = Response(
+            stream_with_context(body), mimetype=EXPORT_FORMATS[export_format]
+        )
+        response.headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response.headers["X-Server-Timezone"] = timezone_label(tz)
+        return response
+    except Exception as e:
+        db.session.rollback()
+        current_app.logger.error(f"Error exporting evaluations: {str(e)}")
+        return jsonify(
+            {
+                "success": False,
+                "message": "Failed to export evaluations",
+                "error": str(e),
+            }
+        ), 500
+
+
+@evaluation_bp.route("/batch", methods=["GET"])
+def get_evaluation_batch() -> tuple[Response, int]:
+    """Get many evaluations with optional expansions in one request.
+
+    Query Parameters:
+        ids (str): Comma-separated evaluation ids (at most MAX_BATCH_IDS).
+        include (str, optional): Any of ``details``, ``nested``, ``logs``.
+        log_limit (int, optional): Newest logs returned per evaluation.
+
+    Returns:
+        Tuple[Response, int]: Evaluations in request order plus ``missing_ids``.
+    ---
+    tags:
+      - Evaluations
+    parameters:
+      - name: ids
+        in: query
+        required: true
+        schema:
+          type: string
+        description: Comma-separated evaluation ids
+      - name: include
+        in: query
+        schema:
+          type: string
+        description: Comma-separated expansions (details, nested, logs)
+      - name: log_limit
+        in: query
+        schema:
+          type: integer
+          default: 50
+        description: Maximum logs per evaluation when include contains logs
+    responses:
+      200:
+        description: Evaluations with the requested expansions
+      400:
+        description: Missing/invalid ids, too many ids or unknown include
+      500:
+        description: Internal server error
+    """
+    try:
+        tz = resolve_timezone_from_request(request.args)
+        try:
+            ids = [
+                int(value)
+                for value in _parse_multi_param(
+                    request.args.get("ids"), request.args.getlist("ids")
+                )
+            ]
+        except ValueError:
+            return jsonify({"success": False, "message": "ids must be integers"}), 400
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return jsonify({"success": False, "message": "ids is required"}), 400
+        if len(ids) > MAX_BATCH_IDS:
+            return jsonify(
+                {
+                    "success": False,
+                    "message": f"At most {MAX_BATCH_IDS} ids per request",
+                }
+            ), 400
+        try:
+            includes = _resolve_includes(request.args)
+            log_limit = _resolve_log_limit(request.args, DEFAULT_BATCH_LOG_LIMIT)
+        except ValueError as e:
+            return jsonify({"success": False, "message": str(e)}), 400
+
+        found = {
+            evaluation.id: evaluation
+            for evaluation in _with_nand_info(Evaluation.query)
+            .filter(Evaluation.id.in_(ids))
+            .all()
+        }
+        evaluations = [found[i] for i in ids if i in found]
+        data = _expand_evaluations(evaluations, includes, tz, log_limit)
+
+        response = jsonify(
+            {
+                "success": True,
+                "data": {
+                    "evaluations": data,
+                    "missing_ids": [i for i in ids if i not in found],
+                },
+            }
+        )
+        response.headers["X-Server-Timezone"] = timezone_label(tz)
+        return response
+    except Exception as e:
+        current_app.logger.error(f"Error getting evaluation batch: {str(e)}")
+        return jsonify(
+            {
+                "success": False,
+                "message": "Failed to get evaluations",
+                "error": str(e),
+            }
+        ), 500
+
+
+@evaluation_bp.route("/<int:evaluation_id>", methods=["GET"])
+def get_evaluation(evaluation_id: int) -> tuple[Response, int]:
+    """Get details of a specific evaluation.
+
+    Args:
+        evaluation_id (int): ID of the evaluation to retrieve.
+
+    Query Parameters:
+        include (str, optional): ``nested`` adds the nested process payload and
+            ``logs`` replaces ``logs`` with the combined log timeline.
+        log_limit (int, optional): Newest logs to embed. Defaults to
+            ``DETAIL_LOG_LIMIT``; ``logs_url`` pages through the rest.
+
+    Returns:
+        Tuple[Response, int]: JSON response with evaluation details and HTTP status code.
+
+    Raises:
+        404: If evaluation not found.
         500: If database operation fails.
     ---
     tags:
@@ -1366,6 +2574,16 @@ def get_evaluation(evaluation_id: int) -> tuple[Response, int]:
         schema:
           type: integer
         description: ID of the evaluation to retrieve
+      - name: include
+        in: query
+        schema:
+          type: string
+        description: Comma-separated expansions (nested, logs)
+      - name: log_limit
+        in: query
+        schema:
+          type: integer
+        description: Maximum logs embedded (defaults to DETAIL_LOG_LIMIT)
     responses:
       200:
         description: Evaluation details
@@ -1410,6 +2628,11 @@ def get_evaluation(evaluation_id: int) -> tuple[Response, int]:
                           type: array
                           items:
                             type: object
+                        nested:
+                          type: object
+                          description: Present when include contains nested
+      400:
+        description: Unknown include or invalid log_limit
       404:
         description: Evaluation not found
       401:
@@ -1421,24 +2644,40 @@ def get_evaluation(evaluation_id: int) -> tuple[Response, int]:
     try:
         tz = resolve_timezone_from_request(request.args)
 
-        tz = resolve_timezone_from_request(request.args)
-
-        tz = resolve_timezone_from_request(request.args)
+        try:
+            includes = _resolve_includes(request.args) | {"details"}
+            log_limit = _resolve_log_limit(
+                request.args, current_app.config.get("DETAIL_LOG_LIMIT", 20)
+            )
+        except ValueError as e:
+            return jsonify({"success": False, "message": str(e)}), 400
 
         evaluation = Evaluation.query.get(evaluation_id)
 
         if not evaluation:
             return jsonify({"success": False, "message": "Evaluation not found"}), 404
 
-        # Get evaluation data with related entities
-        evaluation_data = evaluation.to_dict(include_details=True, tz=tz)
+        etag = _evaluation_detail_etag(evaluation, includes, tz)
+        cached = not_modified(request, etag, weak=True)
+        if cached is not None:
+            return cached
 
-        # Get operation logs
-        logs = []
-        for log in evaluation.operation_logs:
-            logs.append(log.to_dict(tz=tz))
+        # Get evaluation data with related entities
+        evaluation_data = _expand_evaluations([evaluation], includes, tz, log_limit)[0]
 
-        evaluation_data["logs"] = logs
+        if "logs" not in includes:
+            # Latest evaluation logs only; the timeline endpoint pages the rest
+            logs = (
+                evaluation.operation_logs.order_by(
+                    OperationLog.created_at.desc(), OperationLog.id.desc()
+                )
+                .limit(log_limit)
+                .all()
+            )
+            evaluation_data["logs"] = [log.to_dict(tz=tz) for log in logs]
+        evaluation_data["logs_url"] = url_for(
+            "evaluation.get_evaluation_logs", evaluation_id=evaluation_id
+        )
 
         # Log operation
         log = OperationLog(
@@ -1457,12 +2696,11 @@ def get_evaluation(evaluation_id: int) -> tuple[Response, int]:
             status_code=200,
             success=True,
         )
-        db.session.add(log)
-        db.session.commit()
+        OperationLogWriter.record(log)
 
         response = jsonify({"success": True, "data": {"evaluation": evaluation_data}})
         response.headers["X-Server-Timezone"] = timezone_label(tz)
-        return response
+        return apply_etag(response, etag, weak=True)
     except Exception as e:
         current_app.logger.error(f"Error getting evaluation: {str(e)}")
         return jsonify(
@@ -1608,6 +2846,11 @@ def create_evaluation() -> tuple[Response, int]:
         if nand_error:
             return jsonify({"success": False, "message": nand_error}), 400
 
+        try:
+            pgm_login_image_ref = BlobStore.resolve_ref(data.get("pgm_login_image"))
+        except (TypeError, ValueError) as e:
+            return jsonify({"success": False, "message": str(e)}), 400
+
         # Create evaluation
         tz = resolve_timezone_from_request(request.args)
 
@@ -1632,7 +2875,7 @@ def create_evaluation() -> tuple[Response, int]:
             test_process=data.get("test_process"),
             v_process=data.get("v_process"),
             pgm_login_text=data.get("pgm_login_text"),
-            pgm_login_image=data.get("pgm_login_image"),
+            pgm_login_image_ref=pgm_login_image_ref,
         )
 
         db.session.add(evaluation)
@@ -1658,8 +2901,7 @@ def create_evaluation() -> tuple[Response, int]:
             status_code=201,
             success=True,
         )
-        db.session.add(log)
-        db.session.commit()
+        OperationLogWriter.record(log, sync=True)
 
         response = jsonify(
             {
@@ -1828,7 +3070,13 @@ def update_evaluation(evaluation_id: int) -> tuple[Response, int]:
         if "pgm_login_text" in data:
             evaluation.pgm_login_text = data.get("pgm_login_text")
         if "pgm_login_image" in data:
-            evaluation.pgm_login_image = data.get("pgm_login_image")
+            try:
+                evaluation.pgm_login_image_ref = BlobStore.resolve_ref(
+                    data.get("pgm_login_image")
+                )
+            except (TypeError, ValueError) as e:
+                db.session.rollback()
+                return jsonify({"success": False, "message": str(e)}), 400
 
         # Dates
         if "start_date" in data and data["start_date"]:
@@ -1874,8 +3122,7 @@ def update_evaluation(evaluation_id: int) -> tuple[Response, int]:
             target_id=evaluation.id,
             target_description=f"Updated evaluation {evaluation.evaluation_number}",
             operation_description="User updated evaluation details",
-            old_data=old_data,
-            new_data=evaluation.to_dict(tz=tz),
+            new_data=make_patch(old_data, evaluation.to_dict(tz=tz)),
             ip_address=get_client_ip(request),
             user_agent=request.user_agent.string,
             request_method=request.method,
@@ -1886,8 +3133,7 @@ def update_evaluation(evaluation_id: int) -> tuple[Response, int]:
             status_code=200,
             success=True,
         )
-        db.session.add(log)
-        db.session.commit()
+        OperationLogWriter.record(log, sync=True)
 
         response = jsonify(
             {
@@ -1910,6 +3156,332 @@ def update_evaluation(evaluation_id: int) -> tuple[Response, int]:
         ), 500
 
 
+def _latest_nested_payload_hash(evaluation_id: int) -> str | None:
+    latest = (
+        db.session.query(EvaluationProcessRaw.id, EvaluationProcessRaw.payload_hash)
+        .filter(EvaluationProcessRaw.evaluation_id == evaluation_id)
+        .order_by(EvaluationProcessRaw.id.desc())
+        .first()
+    )
+    if latest is None:
+        return None
+    if latest.payload_hash:
+        return latest.payload_hash
+    # Raw records saved before payload hashing.
+    payload = db.session.get(EvaluationProcessRaw, latest.id).payload
+    return payload_digest(payload) if isinstance(payload, dict) else None
+
+
+def _assign_changed(record: Any, values: dict[str, Any]) -> bool:
+    """Set only the attributes that differ; returns whether any did."""
+    changed = False
+    for key, value in values.items():
+        if getattr(record, key) != value:
+            setattr(record, key, value)
+            changed = True
+    return changed
+
+
+def _pool_by(records: list, key) -> dict[Any, list]:
+    pool: dict[Any, list] = {}
+    for record in records:
+        pool.setdefault(key(record), []).append(record)
+    return pool
+
+
+def _insert_rows(
+    model, rows: list[dict[str, Any]], key: tuple[str, ...] = ()
+) -> list[int]:
+    """Insert ``rows`` in one executemany; with ``key``, return their ids.
+
+    Ids come back through a multi-row ``INSERT .. RETURNING id, *key`` and
+    are matched to the rows by their ``key`` values. Sorted RETURNING would
+    degrade to one statement per row on dialects without an implicit insert
+    sentinel (SQLite), so it is only used when keys repeat. Dialects without
+    RETURNING on executemany (MySQL) insert row by row for the ids.
+    """
+    if not rows:
+        return []
+    table = model.__table__
+    if not key:
+        db.session.execute(insert(table), rows)
+        return []
+    dialect = db.session.get_bind().dialect
+    if dialect.insert_executemany_returning:
+        keys = [tuple(row[column] for column in key) for row in rows]
+        if len(set(keys)) == len(keys):
+            statement = insert(table).returning(
+                table.c.id, *(table.c[column] for column in key)
+            )
+            ids = {
+                tuple(row[1:]): row[0] for row in db.session.execute(statement, rows)
+            }
+            return [ids[row_key] for row_key in keys]
+        if dialect.insert_executemany_returning_sort_by_parameter_order:
+            statement = insert(table).returning(
+                table.c.id, sort_by_parameter_order=True
+            )
+            return list(db.session.execute(statement, rows).scalars())
+    return [
+        db.session.execute(insert(table).values(**row)).inserted_primary_key[0]
+        for row in rows
+    ]
+
+
+def _sync_nested_rows(
+    evaluation_id: int,
+    normalized_processes: list[dict[str, Any]],
+    warnings: list[str],
+) -> dict[str, int]:
+    """Reconcile the nested process tables with a normalized payload.
+
+    Existing rows are matched by stable keys: process ``process_key``, lot
+    ``(process_key, client_id)``, step ``(process_key, order_index)`` and
+    failure ``sequence`` within its step. Matched rows are updated only when
+    a value differs, unmatched payload entries are inserted and leftover rows
+    are deleted, so editing one failure note touches one row.
+
+    New rows are written in set-based phases instead of one flush per step:
+    lots and steps as multi-row inserts returning their ids, then all new
+    step-lot links and failures as one executemany each (see
+    ``_insert_rows``).
+
+    Returns:
+        Counts of ``inserted``, ``updated`` and ``deleted`` rows.
+
+    """
+    changes = {"inserted": 0, "updated": 0, "deleted": 0}
+
+    def match(pool: dict[Any, list], key: Any, values: dict[str, Any]):
+        candidates = pool.get(key)
+        if not candidates:
+            return None
+        record = candidates.pop(0)
+        if _assign_changed(record, values):
+            changes["updated"] += 1
+        return record
+
+    def delete_leftovers(pool: dict[Any, list]) -> None:
+        for records in pool.values():
+            for record in records:
+                db.session.delete(record)
+                changes["deleted"] += 1
+
+    process_pool = _pool_by(
+        EvaluationNestedProcess.query.filter_by(evaluation_id=evaluation_id).all(),
+        lambda record: record.process_key,
+    )
+    lot_pool = _pool_by(
+        EvaluationProcessLot.query.filter_by(evaluation_id=evaluation_id)
+        .order_by(EvaluationProcessLot.id)
+        .all(),
+        lambda record: (record.process_key, record.client_id),
+    )
+    step_pool = _pool_by(
+        EvaluationProcessStep.query.filter_by(evaluation_id=evaluation_id)
+        .options(
+            selectinload(EvaluationProcessStep.failures),
+            selectinload(EvaluationProcessStep.lot_assignments),
+            noload(EvaluationProcessStep.lots),
+        )
+        .order_by(EvaluationProcessStep.id)
+        .all(),
+        lambda record: (record.process_key, record.order_index),
+    )
+
+    # Phase 1: processes and lots; new lots get their ids in one statement.
+    lots: dict[tuple[str, str], dict[str, Any]] = {}
+    new_lots: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    for process in normalized_processes:
+        process_key = process["key"]
+        values = {
+            "evaluation_id": evaluation_id,
+            "process_key": process_key,
+            "process_name": process["name"],
+            "order_index": process["order_index"],
+            "result_html": process["result_html"],
+        }
+        if match(process_pool, process_key, values) is None:
+            db.session.add(EvaluationNestedProcess(**values))
+            changes["inserted"] += 1
+        for entry in process["lots"]:
+            values = {
+                "evaluation_id": evaluation_id,
+                "lot_number": entry["lot_number"],
+                "quantity": entry["quantity"],
+                "process_key": process_key,
+                "process_name": process["name"],
+                "process_order_index": process["order_index"],
+                "client_id": entry.get("client_id"),
+            }
+            record = match(lot_pool, (process_key, entry.get("client_id")), values)
+            lot = {
+                "id": record.id if record is not None else None,
+                "lot_number": entry["lot_number"],
+                "quantity": entry["quantity"],
+            }
+            if record is None:
+                new_lots.append((lot, values))
+            lots[(process_key, entry["alias"])] = lot
+    for (lot, _), lot_id in zip(
+        new_lots,
+        _insert_rows(
+            EvaluationProcessLot,
+            [values for _, values in new_lots],
+            key=("process_key", "client_id"),
+        ),
+        strict=True,
+    ):
+        lot["id"] = lot_id
+    changes["inserted"] += len(new_lots)
+
+    # Every fail code of the payload resolved with O(1) dictionary queries.
+    fail_code_ids = FailCodeDictionary.resolve(
+        (failure["fail_code_text"], failure.get("fail_code_name_snapshot"))
+        for process in normalized_processes
+        for step_data in process["steps"]
+        for failure in step_data["failures"]
+    )
+
+    # Phase 2: steps; existing ones are diffed in place, new ones collected.
+    new_steps: list[tuple[dict[str, Any], list[int], dict[str, Any]]] = []
+    link_rows: list[dict[str, Any]] = []
+    failure_rows: list[dict[str, Any]] = []
+    for process in normalized_processes:
+        process_key = process["key"]
+        for step_data in process["steps"]:
+            mapped_lots: list[dict[str, Any]] = []
+            for alias in step_data["lot_aliases"]:
+                lot = lots.get((process_key, alias))
+                if not lot:
+                    current_app.logger.warning(
+                        "Missing lot mapping for alias %s in process %s",
+                        alias,
+                        process_key,
+                    )
+                    continue
+                mapped_lots.append(lot)
+
+            if not mapped_lots:
+                raise ValueError(
+                    f"Process {process['name']}: unable to resolve lots for step {step_data['order_index']}"
+                )
+
+            results_applicable = step_data["results_applicable"]
+            total_units_value = step_data["total_units"] if results_applicable else None
+            fail_units_value = step_data["fail_units"] if results_applicable else None
+            pass_units_value = None
+            if (
+                results_applicable
+                and total_units_value is not None
+                and fail_units_value is not None
+            ):
+                pass_units_value = max(total_units_value - fail_units_value, 0)
+
+            values = {
+                "evaluation_id": evaluation_id,
+                "lot_number": mapped_lots[0]["lot_number"]
+                if len(mapped_lots) == 1
+                else "MULTI",
+                "quantity": sum(lot["quantity"] for lot in mapped_lots),
+                "order_index": step_data["order_index"],
+                "step_code": step_data["step_code"],
+                "step_label": step_data["step_label"],
+                "eval_code": step_data["eval_code"],
+                "results_applicable": results_applicable,
+                "total_units": total_units_value,
+                "total_units_manual": step_data["total_units_manual"]
+                if results_applicable
+                else False,
+                "pass_units": pass_units_value,
+                "fail_units": fail_units_value,
+                "notes": step_data["notes"],
+                "process_key": process_key,
+                "process_name": process["name"],
+                "process_order_index": process["order_index"],
+            }
+            lot_ids = _dedupe_preserve_order([lot["id"] for lot in mapped_lots])
+            failures = [
+                _failure_values(failure, fail_code_ids, warnings)
+                for failure in step_data["failures"]
+            ]
+
+            step_record = match(
+                step_pool, (process_key, step_data["order_index"]), values
+            )
+            if step_record is None:
+                new_steps.append((values, lot_ids, failures))
+                continue
+
+            assignments = {
+                assignment.lot_id: assignment
+                for assignment in step_record.lot_assignments
+            }
+            for lot_id in lot_ids:
+                if assignments.pop(lot_id, None) is None:
+                    link_rows.append({"step_id": step_record.id, "lot_id": lot_id})
+            for assignment in assignments.values():
+                db.session.delete(assignment)
+                changes["deleted"] += 1
+
+            failure_pool = _pool_by(
+                list(step_record.failures), lambda record: record.sequence
+            )
+            for failure in failures:
+                if match(failure_pool, failure["sequence"], failure) is None:
+                    failure_rows.append({"step_id": step_record.id, **failure})
+            for records in failure_pool.values():
+                for record in records:
+                    db.session.delete(record)
+                    changes["deleted"] += 1
+
+    step_ids = _insert_rows(
+        EvaluationProcessStep,
+        [values for values, _, _ in new_steps],
+        key=("process_key", "order_index"),
+    )
+    changes["inserted"] += len(new_steps)
+    for step_id, (_, lot_ids, failures) in zip(step_ids, new_steps, strict=True):
+        link_rows.extend({"step_id": step_id, "lot_id": lot_id} for lot_id in lot_ids)
+        failure_rows.extend({"step_id": step_id, **failure} for failure in failures)
+
+    # Phase 3: every new link and failure in one executemany per table.
+    _insert_rows(
+        EvaluationStepLot,
+        [{**row, "quantity_override": None} for row in link_rows],
+    )
+    _insert_rows(EvaluationStepFailure, failure_rows)
+    changes["inserted"] += len(link_rows) + len(failure_rows)
+
+    # Steps first, so lots no longer referenced cascade only their own links.
+    delete_leftovers(step_pool)
+    db.session.flush()
+    delete_leftovers(lot_pool)
+    delete_leftovers(process_pool)
+    db.session.flush()
+    return changes
+
+
+def _failure_values(
+    failure: dict[str, Any], fail_code_ids: dict[str, int], warnings: list[str]
+) -> dict[str, Any]:
+    fail_code_text = failure.get("fail_code_text")
+    fail_code_id = fail_code_ids.get(fail_code_text)
+    provided_id = _safe_int(failure.get("fail_code_id"), default=None)
+    if provided_id is not None and provided_id != fail_code_id:
+        warnings.append(
+            f"Fail code id {provided_id} does not match provided text '{fail_code_text}', using text value."
+        )
+    return {
+        "sequence": failure.get("sequence"),
+        "serial_number": failure.get("serial_number"),
+        "fail_code_id": fail_code_id,
+        "fail_code_text": fail_code_text,
+        "fail_code_name_snapshot": failure.get("fail_code_name_snapshot"),
+        "analysis_result": failure.get("analysis_result"),
+    }
+
+
 @evaluation_bp.route("/<int:evaluation_id>/processes/nested", methods=["POST"])
 def save_nested_process(evaluation_id: int) -> tuple[Response, int]:
     """Persist nested process data submitted from the new UI."""
@@ -1929,155 +3501,32 @@ def save_nested_process(evaluation_id: int) -> tuple[Response, int]:
         return jsonify({"success": False, "message": str(exc)}), 400
 
     normalized_processes = normalized["processes"]
-    normalized_payload = normalized["payload"]
-
-    try:
-        existing_steps = EvaluationProcessStep.query.filter_by(
-            evaluation_id=evaluation.id
-        ).all()
-        for step in existing_steps:
-            db.session.delete(step)
-
-        existing_lots = EvaluationProcessLot.query.filter_by(
-            evaluation_id=evaluation.id
-        ).all()
-        for lot in existing_lots:
-            db.session.delete(lot)
-
-        existing_processes = EvaluationNestedProcess.query.filter_by(
-            evaluation_id=evaluation.id
-        ).all()
-        for process in existing_processes:
-            db.session.delete(process)
-
-        db.session.flush()
-
-        lot_records: dict[str, EvaluationProcessLot] = {}
-        for process in normalized_processes:
-            db.session.add(
-                EvaluationNestedProcess(
-                    evaluation_id=evaluation.id,
-                    process_key=process["key"],
-                    process_name=process["name"],
-                    order_index=process["order_index"],
-                    result_html=process["result_html"],
-                )
-            )
-            for entry in process["lots"]:
-                lot_record = EvaluationProcessLot(
-                    evaluation_id=evaluation.id,
-                    lot_number=entry["lot_number"],
-                    quantity=entry["quantity"],
-                    process_key=process["key"],
-                    process_name=process["name"],
-                    process_order_index=process["order_index"],
-                    client_id=entry.get("client_id"),
-                )
-                db.session.add(lot_record)
-                alias = entry["alias"]
-                client_id = entry.get("client_id") or alias
-                lot_records[alias] = lot_record
-                lot_records[client_id] = lot_record
-                if entry.get("id") is not None:
-                    lot_records[str(entry["id"])] = lot_record
-
-        db.session.flush()
-
-        for process in normalized_processes:
-            for step_data in process["steps"]:
-                mapped_records: list[EvaluationProcessLot] = []
-                for alias in step_data["lot_aliases"]:
-                    record = lot_records.get(alias)
-                    if not record:
-                        current_app.logger.warning(
-                            "Missing lot mapping for alias %s in process %s",
-                            alias,
-                            process["key"],
-                        )
-                        continue
-                    mapped_records.append(record)
-
-                if not mapped_records:
-                    raise ValueError(
-                        f"Process {process['name']}: unable to resolve lots for step {step_data['order_index']}"
-                    )
-
-                lot_quantity_sum = sum(record.quantity for record in mapped_records)
-                lot_number_value = (
-                    mapped_records[0].lot_number
-                    if len(mapped_records) == 1
-                    else "MULTI"
-                )
-
-                results_applicable = step_data["results_applicable"]
-                total_units_value = (
-                    step_data["total_units"] if results_applicable else None
-                )
-                fail_units_value = (
-                    step_data["fail_units"] if results_applicable else None
-                )
-                pass_units_value = None
-                if (
-                    results_applicable
-                    and total_units_value is not None
-                    and fail_units_value is not None
-                ):
-                    pass_units_value = max(total_units_value - fail_units_value, 0)
-
-                step_record = EvaluationProcessStep(
-                    evaluation_id=evaluation.id,
-                    lot_number=lot_number_value,
-                    quantity=lot_quantity_sum,
-                    order_index=step_data["order_index"],
-                    step_code=step_data["step_code"],
-                    step_label=step_data["step_label"],
-                    eval_code=step_data["eval_code"],
-                    results_applicable=results_applicable,
-                    total_units=total_units_value,
-                    total_units_manual=step_data["total_units_manual"]
-                    if results_applicable
-                    else False,
-                    pass_units=pass_units_value if results_applicable else None,
-                    fail_units=fail_units_value if results_applicable else None,
-                    notes=step_data["notes"],
-                    process_key=process["key"],
-                    process_name=process["name"],
-                    process_order_index=process["order_index"],
-                )
-                db.session.add(step_record)
-                db.session.flush()
-
-                for lot_record in mapped_records:
-                    db.session.add(
-                        EvaluationStepLot(
-                            step_id=step_record.id,
-                            lot_id=lot_record.id,
-                            quantity_override=None,
-                        )
-                    )
+    normalized_payload = normalized["payload"]
+    payload_hash = payload_digest(normalized_payload)
 
-                for failure in step_data["failures"]:
-                    fail_code_record = _ensure_fail_code_record(
-                        failure.get("fail_code_text"),
-                        failure.get("fail_code_id"),
-                        failure.get("fail_code_name_snapshot"),
-                        warnings,
-                    )
+    if payload_hash == _latest_nested_payload_hash(evaluation.id):
+        response = jsonify(
+            {
+                "success": True,
+                "data": {
+                    "warnings": warnings,
+                    "unchanged": True,
+                    "changes": {"inserted": 0, "updated": 0, "deleted": 0},
+                },
+            }
+        )
+        response.headers["X-Server-Timezone"] = timezone_label(tz)
+        return response
 
-                    failure_record = EvaluationStepFailure(
-                        step_id=step_record.id,
-                        sequence=failure.get("sequence"),
-                        serial_number=failure.get("serial_number"),
-                        fail_code_id=fail_code_record.id if fail_code_record else None,
-                        fail_code_text=failure.get("fail_code_text"),
-                        fail_code_name_snapshot=failure.get("fail_code_name_snapshot"),
-                        analysis_result=failure.get("analysis_result"),
-                    )
-                    db.session.add(failure_record)
+    try:
+        changes = _sync_nested_rows(evaluation.id, normalized_processes, warnings)
 
+        # Raw record and log both reference one deduplicated payload blob.
+        store_payload(normalized_payload)
         raw_record = EvaluationProcessRaw(
             evaluation_id=evaluation.id,
-            payload=normalized_payload,
+            payload=None,
+            payload_hash=payload_hash,
             source="rc0",
         )
         db.session.add(raw_record)
@@ -2088,7 +3537,7 @@ def save_nested_process(evaluation_id: int) -> tuple[Response, int]:
             target_id=evaluation.id,
             target_description=f"Nested processes updated for {evaluation.evaluation_number}",
             operation_description="Nested process payload saved",
-            new_data=normalized_payload,
+            new_data=payload_ref(payload_hash),
             ip_address=get_client_ip(request),
             user_agent=request.user_agent.string,
             request_method=request.method,
@@ -2096,11 +3545,16 @@ def save_nested_process(evaluation_id: int) -> tuple[Response, int]:
             status_code=200,
             success=True,
         )
-        db.session.add(log)
-
-        db.session.commit()
+        materialize_nested_snapshots([evaluation.id])
+        # Commits the nested rows, raw record and snapshot together with the log
+        OperationLogWriter.record(log, sync=True)
 
-        response = jsonify({"success": True, "data": {"warnings": warnings}})
+        response = jsonify(
+            {
+                "success": True,
+                "data": {"warnings": warnings, "unchanged": False, "changes": changes},
+            }
+        )
         response.headers["X-Server-Timezone"] = timezone_label(tz)
         return response
     except ValueError as exc:  # type: ignore[union-attr]
@@ -2125,37 +3579,31 @@ def save_nested_process(evaluation_id: int) -> tuple[Response, int]:
         )
 
 
-@evaluation_bp.route("/<int:evaluation_id>/processes/nested", methods=["GET"])
-def get_nested_process(evaluation_id: int) -> tuple[Response, int]:
-    """Return the nested process payload for an evaluation."""
+def _build_nested_payload(
+    lots: list,
+    steps: list,
+    nested_processes: list,
+    raw_payload: object = None,
+    step_lot_ids: dict[int, list[int]] | None = None,
+    step_failures: dict[int, list] | None = None,
+) -> tuple[dict[str, Any], list[str]]:
+    """Assemble the nested process payload from preloaded rows.
 
-    tz = resolve_timezone_from_request(request.args)
+    Rows only need attribute access, so column-only result rows work as
+    well as ORM instances.
 
-    evaluation = Evaluation.query.get(evaluation_id)
-    if not evaluation:
-        return jsonify({"success": False, "message": "Evaluation not found"}), 404
+    Args:
+        lots: Lots ordered by id.
+        steps: Steps ordered by order_index, id.
+        nested_processes: Process headers ordered by order_index, id.
+        raw_payload: Payload of the latest raw record, for legacy lot fields.
+        step_lot_ids: Linked lot ids per step id.
+        step_failures: Failures per step id, ordered by sequence.
 
-    lots = (
-        EvaluationProcessLot.query.filter_by(evaluation_id=evaluation_id)
-        .order_by(EvaluationProcessLot.id.asc())
-        .all()
-    )
-    steps = (
-        EvaluationProcessStep.query.filter_by(evaluation_id=evaluation_id)
-        .order_by(
-            EvaluationProcessStep.order_index.asc(), EvaluationProcessStep.id.asc()
-        )
-        .all()
-    )
-    nested_processes = (
-        EvaluationNestedProcess.query.filter_by(evaluation_id=evaluation_id)
-        .order_by(
-            EvaluationNestedProcess.order_index.asc(),
-            EvaluationNestedProcess.id.asc(),
-        )
-        .all()
-    )
+    Returns:
+        Tuple of (payload, warnings) as returned by the nested GET endpoint.
 
+    """
     process_groups: dict[str, dict[str, Any]] = {}
     used_output_keys: set[str] = set()
     fallback_counter = 1
@@ -2208,8 +3656,10 @@ def get_nested_process(evaluation_id: int) -> tuple[Response, int]:
         fallback_counter += 1
         return group
 
+    step_lot_ids = step_lot_ids or {}
+    step_failures = step_failures or {}
     lot_id_to_client: dict[int, str] = {}
-    lot_id_to_record: dict[int, EvaluationProcessLot] = {}
+    lot_id_to_record: dict[int, Any] = {}
 
     for process in nested_processes:
         resolve_group(
@@ -2243,13 +3693,16 @@ def get_nested_process(evaluation_id: int) -> tuple[Response, int]:
             step.process_key, step.process_name, step.process_order_index
         )
 
+        linked_lot_ids = step_lot_ids.get(step.id, ())
+        failures = step_failures.get(step.id, ())
+
         lot_refs: list[str] = []
-        if step.lot_assignments:
+        if linked_lot_ids:
             lot_refs = _dedupe_preserve_order(
                 [
-                    lot_id_to_client.get(link.lot_id)
-                    for link in step.lot_assignments
-                    if lot_id_to_client.get(link.lot_id)
+                    lot_id_to_client.get(lot_id)
+                    for lot_id in linked_lot_ids
+                    if lot_id_to_client.get(lot_id)
                 ]
             )
 
@@ -2288,15 +3741,15 @@ def get_nested_process(evaluation_id: int) -> tuple[Response, int]:
         total_units = step.total_units if results_applicable else None
         fail_units = step.fail_units if results_applicable else None
         if results_applicable and fail_units is None:
-            fail_units = len(step.failures or [])
+            fail_units = len(failures)
         pass_units = None
         if results_applicable and total_units is not None and fail_units is not None:
             pass_units = max(total_units - fail_units, 0)
 
         lot_sum = 0
-        if step.lot_assignments:
-            for link in step.lot_assignments:
-                record = lot_id_to_record.get(link.lot_id)
+        if linked_lot_ids:
+            for lot_id in linked_lot_ids:
+                record = lot_id_to_record.get(lot_id)
                 if record is not None:
                     lot_sum += record.quantity or 0
         if not lot_sum and group["lots"]:
@@ -2324,10 +3777,6 @@ def get_nested_process(evaluation_id: int) -> tuple[Response, int]:
                 f"Process {group['name']} Step {step.order_index} lot quantity mismatch: total_units={total_units}, lot_sum={lot_sum}"
             )
 
-        failures_payload = sorted(
-            step.failures, key=lambda failure: failure.sequence or 0
-        )
-
         group["steps"].append(
             {
                 "order_index": step.order_index,
@@ -2352,7 +3801,7 @@ def get_nested_process(evaluation_id: int) -> tuple[Response, int]:
                         "fail_code_name_snapshot": failure.fail_code_name_snapshot,
                         "analysis_result": failure.analysis_result,
                     }
-                    for failure in failures_payload
+                    for failure in failures
                 ],
             }
         )
@@ -2372,16 +3821,11 @@ def get_nested_process(evaluation_id: int) -> tuple[Response, int]:
         key=lambda item: (item["order_index"], item["key"]),
     )
 
-    latest_raw = (
-        EvaluationProcessRaw.query.filter_by(evaluation_id=evaluation_id)
-        .order_by(EvaluationProcessRaw.created_at.desc())
-        .first()
-    )
     legacy_lot_number = None
     legacy_quantity = None
-    if latest_raw and isinstance(latest_raw.payload, dict):
-        legacy_lot_number = latest_raw.payload.get("legacy_lot_number")
-        legacy_quantity = latest_raw.payload.get("legacy_quantity")
+    if isinstance(raw_payload, dict):
+        legacy_lot_number = raw_payload.get("legacy_lot_number")
+        legacy_quantity = raw_payload.get("legacy_quantity")
 
     response_payload: dict[str, Any] = {
         "processes": processes_payload,
@@ -2396,9 +3840,673 @@ def get_nested_process(evaluation_id: int) -> tuple[Response, int]:
         response_payload["lots"] = []
         response_payload["steps"] = []
 
-    response = jsonify(
-        {"success": True, "data": {"payload": response_payload, "warnings": warnings}}
+    return response_payload, warnings
+
+
+def _nested_columns(model, *names: str) -> list:
+    return [getattr(model, name) for name in names]
+
+
+_NESTED_LOT_COLUMNS = (
+    "id",
+    "evaluation_id",
+    "lot_number",
+    "quantity",
+    "client_id",
+    "process_key",
+    "process_name",
+    "process_order_index",
+)
+_NESTED_STEP_COLUMNS = (
+    "id",
+    "evaluation_id",
+    "lot_number",
+    "quantity",
+    "order_index",
+    "step_code",
+    "step_label",
+    "eval_code",
+    "results_applicable",
+    "total_units",
+    "total_units_manual",
+    "fail_units",
+    "notes",
+    "process_key",
+    "process_name",
+    "process_order_index",
+)
+_NESTED_FAILURE_COLUMNS = (
+    "step_id",
+    "sequence",
+    "serial_number",
+    "fail_code_id",
+    "fail_code_text",
+    "fail_code_name_snapshot",
+    "analysis_result",
+)
+_NESTED_PROCESS_COLUMNS = (
+    "evaluation_id",
+    "process_key",
+    "process_name",
+    "order_index",
+    "result_html",
+)
+
+
+def _load_nested_payloads(
+    evaluation_ids: list[int],
+) -> dict[int, tuple[dict[str, Any], list[dict[str, Any]]]]:
+    """Build nested payloads and warnings for many evaluations.
+
+    Reads lots, steps, step-lot links, failures, process headers and the
+    latest raw records with one flat column-only query each, regardless of
+    how many ids are requested. Nothing goes through the step relationships,
+    whose joined eager loading would multiply failures by lot links.
+    """
+    if not evaluation_ids:
+        return {}
+
+    lots_by_evaluation: dict[int, list] = {
+        evaluation_id: [] for evaluation_id in evaluation_ids
+    }
+    steps_by_evaluation: dict[int, list] = {
+        evaluation_id: [] for evaluation_id in evaluation_ids
+    }
+    processes_by_evaluation: dict[int, list] = {
+        evaluation_id: [] for evaluation_id in evaluation_ids
+    }
+    step_lot_ids: dict[int, list[int]] = {}
+    step_failures: dict[int, list] = {}
+    step = EvaluationProcessStep
+
+    for lot in db.session.execute(
+        select(*_nested_columns(EvaluationProcessLot, *_NESTED_LOT_COLUMNS))
+        .where(EvaluationProcessLot.evaluation_id.in_(evaluation_ids))
+        .order_by(EvaluationProcessLot.id.asc())
+    ):
+        lots_by_evaluation[lot.evaluation_id].append(lot)
+    for row in db.session.execute(
+        select(*_nested_columns(step, *_NESTED_STEP_COLUMNS))
+        .where(step.evaluation_id.in_(evaluation_ids))
+        .order_by(step.order_index.asc(), step.id.asc())
+    ):
+        steps_by_evaluation[row.evaluation_id].append(row)
+    for step_id, lot_id in db.session.execute(
+        select(EvaluationStepLot.step_id, EvaluationStepLot.lot_id)
+        .join(step, step.id == EvaluationStepLot.step_id)
+        .where(step.evaluation_id.in_(evaluation_ids))
+        .order_by(EvaluationStepLot.step_id.asc(), EvaluationStepLot.lot_id.asc())
+    ):
+        step_lot_ids.setdefault(step_id, []).append(lot_id)
+    for failure in db.session.execute(
+        select(*_nested_columns(EvaluationStepFailure, *_NESTED_FAILURE_COLUMNS))
+        .join(step, step.id == EvaluationStepFailure.step_id)
+        .where(step.evaluation_id.in_(evaluation_ids))
+        .order_by(
+            EvaluationStepFailure.step_id.asc(),
+            EvaluationStepFailure.sequence.asc(),
+            EvaluationStepFailure.id.asc(),
+        )
+    ):
+        step_failures.setdefault(failure.step_id, []).append(failure)
+    for process in db.session.execute(
+        select(*_nested_columns(EvaluationNestedProcess, *_NESTED_PROCESS_COLUMNS))
+        .where(EvaluationNestedProcess.evaluation_id.in_(evaluation_ids))
+        .order_by(
+            EvaluationNestedProcess.order_index.asc(),
+            EvaluationNestedProcess.id.asc(),
+        )
+    ):
+        processes_by_evaluation[process.evaluation_id].append(process)
+
+    latest_raw_ids = (
+        db.session.query(db.func.max(EvaluationProcessRaw.id))
+        .filter(EvaluationProcessRaw.evaluation_id.in_(evaluation_ids))
+        .group_by(EvaluationProcessRaw.evaluation_id)
+    )
+    latest_raw = (
+        db.session.query(
+            EvaluationProcessRaw.evaluation_id,
+            EvaluationProcessRaw.payload,
+            EvaluationProcessRaw.payload_hash,
+        )
+        .filter(EvaluationProcessRaw.id.in_(latest_raw_ids))
+        .all()
+    )
+    stored = load_payloads(
+        row.payload_hash for row in latest_raw if row.payload is None
+    )
+    raw_payloads = {
+        row.evaluation_id: row.payload
+        if row.payload is not None
+        else stored.get(row.payload_hash)
+        for row in latest_raw
+    }
+
+    return {
+        evaluation_id: _build_nested_payload(
+            lots_by_evaluation[evaluation_id],
+            steps_by_evaluation[evaluation_id],
+            processes_by_evaluation[evaluation_id],
+            raw_payloads.get(evaluation_id),
+            step_lot_ids,
+            step_failures,
+        )
+        for evaluation_id in evaluation_ids
+    }
+
+
+def _encode_nested_response(payload: dict[str, Any], warnings: list[str]) -> bytes:
+    return current_app.json.dumps(
+        {"success": True, "data": {"payload": payload, "warnings": warnings}}
+    ).encode("utf-8")
+
+
+def materialize_nested_snapshots(evaluation_ids: list[int]) -> int:
+    """Render the nested GET response of each evaluation into its snapshot.
+
+    Runs in the caller's transaction. Markers are read before the payloads,
+    so a save committed in between leaves the snapshot stale (ignored), never
+    newer data under an older state.
+    """
+    states = {
+        evaluation_id: _nested_state(_nested_markers(evaluation_id))
+        for evaluation_id in evaluation_ids
+    }
+    for evaluation_id, (payload, warnings) in _load_nested_payloads(
+        evaluation_ids
+    ).items():
+        store_snapshot(
+            evaluation_id,
+            states[evaluation_id],
+            _encode_nested_response(payload, warnings),
+        )
+    return len(states)
+
+
+def backfill_nested_snapshots(chunk_size: int = 200, rebuild: bool = False) -> int:
+    """Materialize missing or stale snapshots of evaluations with nested data.
+
+    Commits once per chunk of evaluations so it can run next to live
+    traffic; returns the number of snapshots written.
+    """
+    written = 0
+    last_id = 0
+    while True:
+        evaluation_ids = list(
+            db.session.execute(
+                select(Evaluation.id)
+                .where(Evaluation.id > last_id)
+                .order_by(Evaluation.id)
+                .limit(chunk_size)
+            ).scalars()
+        )
+        if not evaluation_ids:
+            return written
+        last_id = evaluation_ids[-1]
+
+        states = dict(
+            db.session.execute(
+                select(
+                    EvaluationNestedSnapshot.evaluation_id,
+                    EvaluationNestedSnapshot.state,
+                ).where(EvaluationNestedSnapshot.evaluation_id.in_(evaluation_ids))
+            ).all()
+        )
+        pending = []
+        for evaluation_id in evaluation_ids:
+            markers = _nested_markers(evaluation_id)
+            if not any(markers):
+                continue  # no nested data
+            if rebuild or states.get(evaluation_id) != _nested_state(markers):
+                pending.append(evaluation_id)
+        if pending:
+            written += materialize_nested_snapshots(pending)
+        db.session.commit()
+
+
+def _group_by_evaluation(model, evaluation_ids: list[int], *order_by) -> dict:
+    grouped: dict[int, list] = {evaluation_id: [] for evaluation_id in evaluation_ids}
+    for row in (
+        model.query.filter(model.evaluation_id.in_(evaluation_ids))
+        .order_by(*(order_by or (model.id.asc(),)))
+        .all()
+    ):
+        grouped[row.evaluation_id].append(row)
+    return grouped
+
+
+def _resolve_log_filters(args) -> dict[str, Any]:
+    """Parse the ``types`` and ``exclude_views`` log timeline filters."""
+    types = _parse_multi_param(args.get("types"), [])
+    known = {operation.value for operation in OperationType}
+    unknown = sorted(set(types) - known)
+    if unknown:
+        raise ValueError(f"Unknown log type: {', '.join(unknown)}")
+    return {
+        "types": types or None,
+        "exclude_views": _is_truthy(args.get("exclude_views")),
+    }
+
+
+def _evaluation_log_query(
+    evaluation_ids: list[int],
+    types: list[str] | None = None,
+    exclude_views: bool = False,
+    limit: int | None = None,
+):
+    """Query ``(OperationLog, evaluation_id)`` over the evaluations' timelines.
+
+    Covers evaluation, status and nested-process logs plus the logs of the
+    evaluation's legacy processes in one UNION. ``types`` and
+    ``exclude_views`` filter on the operation type; with ``limit`` only the
+    newest ``limit`` entries per evaluation are kept. Unordered.
+    """
+    conditions = []
+    if types:
+        conditions.append(OperationLog.operation_type.in_(types))
+    if exclude_views:
+        conditions.append(OperationLog.operation_type != OperationType.VIEW.value)
+
+    owned = union_all(
+        select(
+            OperationLog.id.label("log_id"),
+            OperationLog.target_id.label("evaluation_id"),
+        ).where(
+            OperationLog.target_type.in_(EVALUATION_LOG_TARGETS),
+            OperationLog.target_id.in_(evaluation_ids),
+            *conditions,
+        ),
+        select(
+            OperationLog.id.label("log_id"),
+            EvaluationProcess.evaluation_id.label("evaluation_id"),
+        )
+        .join(EvaluationProcess, EvaluationProcess.id == OperationLog.target_id)
+        .where(
+            OperationLog.target_type == "evaluation_process",
+            EvaluationProcess.evaluation_id.in_(evaluation_ids),
+            *conditions,
+        ),
+    ).subquery()
+
+    query = db.session.query(OperationLog, owned.c.evaluation_id).join(
+        owned, owned.c.log_id == OperationLog.id
+    )
+    if limit is not None:
+        ranked = (
+            select(
+                owned.c.log_id,
+                db.func.row_number()
+                .over(
+                    partition_by=owned.c.evaluation_id,
+                    order_by=(OperationLog.created_at.desc(), OperationLog.id.desc()),
+                )
+                .label("position"),
+            )
+            .join(OperationLog, OperationLog.id == owned.c.log_id)
+            .subquery()
+        )
+        query = query.join(ranked, ranked.c.log_id == OperationLog.id).filter(
+            ranked.c.position <= limit
+        )
+    return query
+
+
+def _load_evaluation_logs(
+    evaluation_ids: list[int], limit: int | None = None, **filters
+) -> dict[int, list[OperationLog]]:
+    """Return the combined operation log timeline of each evaluation.
+
+    Newest first; see ``_evaluation_log_query`` for ``limit`` and filters.
+    Runs one query.
+    """
+    logs: dict[int, list[OperationLog]] = {
+        evaluation_id: [] for evaluation_id in evaluation_ids
+    }
+    if not evaluation_ids:
+        return logs
+
+    query = _evaluation_log_query(evaluation_ids, limit=limit, **filters)
+    for log, evaluation_id in query.order_by(
+        OperationLog.created_at.desc(), OperationLog.id.desc()
+    ):
+        logs[evaluation_id].append(log)
+    return logs
+
+
+def _evaluation_log_page(
+    evaluation_id: int, args, per_page: int
+) -> tuple[list[OperationLog], str | None]:
+    """Fetch one newest-first keyset page of an evaluation's log timeline.
+
+    Returns the page and the opaque cursor for the following page.
+    """
+    filters = _resolve_log_filters(args)
+    query = _evaluation_log_query([evaluation_id], **filters)
+    position = None
+    token = args.get("cursor")
+    if token:
+        values = _decode_cursor(token).get("v")
+        if not isinstance(values, list) or len(values) != 2:
+            raise ValueError("Invalid cursor")
+        try:
+            position = (
+                _parse_cursor_value(OperationLog.created_at, values[0]),
+                int(values[1]),
+            )
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Invalid cursor") from exc
+        created_at, log_id = position
+        query = query.filter(
+            or_(
+                OperationLog.created_at < created_at,
+                and_(OperationLog.created_at == created_at, OperationLog.id < log_id),
+            )
+        )
+
+    rows = [
+        log
+        for log, _ in query.order_by(
+            OperationLog.created_at.desc(), OperationLog.id.desc()
+        ).limit(per_page + 1)
+    ]
+    # Rows past the retention boundary live in the archive; consult it only
+    # when this page could reach them.
+    archived_through = LogArchive.archived_through()
+    if archived_through is not None and (
+        len(rows) <= per_page or _naive_utc(rows[-1].created_at) <= archived_through
+    ):
+        process_ids = db.session.scalars(
+            select(EvaluationProcess.id).where(
+                EvaluationProcess.evaluation_id == evaluation_id
+            )
+        ).all()
+        targets = [(target, evaluation_id) for target in EVALUATION_LOG_TARGETS]
+        targets += [("evaluation_process", process_id) for process_id in process_ids]
+        archived = LogArchive.query(targets, per_page + 1, before=position, **filters)
+        rows = LogArchive.merge_newest(rows, archived, per_page + 1)
+
+    logs = rows[:per_page]
+    next_cursor = None
+    if len(rows) > per_page:
+        last = logs[-1]
+        next_cursor = _encode_cursor({"v": [_cursor_value(last.created_at), last.id]})
+    return logs, next_cursor
+
+
+def _load_view_activity(evaluation_id: int, tz) -> dict[str, Any]:
+    """Summarize the view counters of an evaluation and its processes.
+
+    Returns total views, distinct client IPs and per-hour, per-target
+    buckets, newest first.
+    """
+    process_ids = select(EvaluationProcess.id).where(
+        EvaluationProcess.evaluation_id == evaluation_id
+    )
+    owned = or_(
+        and_(
+            ViewCounter.target_type.in_(EVALUATION_VIEW_TARGETS),
+            ViewCounter.target_id == evaluation_id,
+        ),
+        and_(
+            ViewCounter.target_type == "evaluation_process",
+            ViewCounter.target_id.in_(process_ids),
+        ),
+    )
+    buckets = (
+        db.session.query(
+            ViewCounter.bucket_start,
+            ViewCounter.target_type,
+            db.func.sum(ViewCounter.view_count).label("views"),
+            db.func.count(db.distinct(ViewCounter.ip_address)).label("unique_ips"),
+            db.func.max(ViewCounter.last_viewed_at).label("last_viewed_at"),
+        )
+        .filter(owned)
+        .group_by(ViewCounter.bucket_start, ViewCounter.target_type)
+        .order_by(ViewCounter.bucket_start.desc(), ViewCounter.target_type)
+        .all()
+    )
+    unique_ips = (
+        db.session.query(db.func.count(db.distinct(ViewCounter.ip_address)))
+        .filter(owned)
+        .scalar()
+    )
+    return {
+        "total_views": sum(int(row.views or 0) for row in buckets),
+        "unique_ips": int(unique_ips or 0),
+        "hourly": [
+            {
+                "hour": iso_local(row.bucket_start, tz),
+                "target_type": row.target_type,
+                "views": int(row.views or 0),
+                "unique_ips": int(row.unique_ips or 0),
+                "last_viewed_at": iso_local(row.last_viewed_at, tz),
+            }
+            for row in buckets
+        ],
+    }
+
+
+def _resolve_includes(args) -> set[str]:
+    requested = set(_parse_multi_param(args.get("include"), args.getlist("include")))
+    unknown = sorted(requested - set(EVALUATION_INCLUDES))
+    if unknown:
+        raise ValueError(f"Unknown include: {', '.join(unknown)}")
+    return requested
+
+
+def _resolve_log_limit(args, default: int | None) -> int | None:
+    value = args.get("log_limit")
+    if value in (None, ""):
+        return default
+    limit = _safe_int(value, -1)
+    if limit < 0:
+        raise ValueError("log_limit must be a non-negative integer")
+    return limit
+
+
+def _expand_evaluations(
+    evaluations: list[Evaluation],
+    includes: set[str],
+    tz,
+    log_limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Serialize evaluations with the requested ``include`` expansions.
+
+    Every expansion is loaded for all evaluations at once, so the number of
+    queries does not depend on ``len(evaluations)``.
+    """
+    evaluation_ids = [evaluation.id for evaluation in evaluations]
+    if "details" in includes:
+        details = _group_by_evaluation(EvaluationDetail, evaluation_ids)
+        results = _group_by_evaluation(EvaluationResult, evaluation_ids)
+        processes = _group_by_evaluation(EvaluationProcess, evaluation_ids)
+    if "nested" in includes:
+        nested_payloads = _load_nested_payloads(evaluation_ids)
+    if "logs" in includes:
+        logs = _load_evaluation_logs(evaluation_ids, log_limit)
+
+    expanded = []
+    for evaluation in evaluations:
+        data = evaluation.to_dict(tz=tz)
+        if "details" in includes:
+            data["details"] = [row.to_dict(tz=tz) for row in details[evaluation.id]]
+            data["results"] = [row.to_dict(tz=tz) for row in results[evaluation.id]]
+            data["processes"] = [row.to_dict(tz=tz) for row in processes[evaluation.id]]
+        if "nested" in includes:
+            payload, warnings = nested_payloads[evaluation.id]
+            data["nested"] = {"payload": payload, "warnings": warnings}
+        if "logs" in includes:
+            data["logs"] = [log.to_dict(tz=tz) for log in logs[evaluation.id]]
+        expanded.append(data)
+    return expanded
+
+
+def _iter_export_chunks(query, tz, chunk_size: int = EXPORT_CHUNK_SIZE):
+    """Yield export records chunk by chunk in the query's order.
+
+    Evaluation ids are streamed through a server-side cursor on a dedicated
+    connection (``stream_results`` + ``yield_per``) so the session stays free
+    for the per-chunk batch loads of rows, legacy results and nested steps.
+    """
+    id_statement = query.with_entities(Evaluation.id).statement
+    with db.engine.connect() as connection:
+        result = connection.execution_options(
+            stream_results=True, yield_per=chunk_size
+        ).execute(id_statement)
+        for partition in result.partitions():
+            ids = [row[0] for row in partition]
+            evaluations = {
+                evaluation.id: evaluation
+                for evaluation in _with_nand_info(Evaluation.query)
+                .filter(Evaluation.id.in_(ids))
+                .all()
+            }
+            results_by_evaluation: dict[int, list] = {}
+            for result_row in (
+                EvaluationResult.query.filter(EvaluationResult.evaluation_id.in_(ids))
+                .order_by(EvaluationResult.id.asc())
+                .all()
+            ):
+                results_by_evaluation.setdefault(result_row.evaluation_id, []).append(
+                    result_row.to_dict(tz=tz)
+                )
+            nested_payloads = _load_nested_payloads(list(evaluations))
+
+            records = []
+            for evaluation_id in ids:
+                evaluation = evaluations.get(evaluation_id)
+                if evaluation is None:
+                    continue
+                record = evaluation.to_dict(tz=tz)
+                record["results"] = results_by_evaluation.get(evaluation_id, [])
+                record["nested"] = nested_payloads[evaluation_id][0]
+                records.append(record)
+            # Drop this chunk's objects so memory stays flat across chunks.
+            db.session.expunge_all()
+            yield records
+
+
+def _summarize_nested(payload: dict[str, Any]) -> dict[str, Any]:
+    processes = payload.get("processes") or []
+    steps = [step for process in processes for step in process["steps"]]
+    fail_codes = _dedupe_preserve_order(
+        [
+            failure.get("fail_code_text") or ""
+            for step in steps
+            for failure in step["failures"]
+            if failure.get("fail_code_text")
+        ]
     )
+    segments = []
+    for process in processes:
+        step_parts = []
+        for step in process["steps"]:
+            label = (
+                step.get("step_code") or step.get("step_label") or step["order_index"]
+            )
+            if step.get("results_applicable"):
+                step_parts.append(
+                    f"{label} {step.get('total_units') or 0}"
+                    f"/{step.get('pass_units') or 0}/{step.get('fail_units') or 0}"
+                )
+            else:
+                step_parts.append(str(label))
+        segments.append(f"{process['name']}: {', '.join(step_parts)}")
+    return {
+        "process_count": len(processes),
+        "step_count": len(steps),
+        "total_units": sum(step.get("total_units") or 0 for step in steps),
+        "fail_units": sum(step.get("fail_units") or 0 for step in steps),
+        "fail_codes": ", ".join(fail_codes),
+        "nested_summary": "; ".join(segments),
+    }
+
+
+def _export_row(record: dict[str, Any]) -> list[object]:
+    values = {**record, **_summarize_nested(record["nested"])}
+    row = []
+    for column in EXPORT_COLUMNS:
+        value = values.get(column)
+        if isinstance(value, str) and value[:1] in ("=", "+", "-", "@"):
+            # Keep spreadsheet apps from evaluating user text as formulas.
+            value = f"'{value}"
+        row.append("" if value is None else value)
+    return row
+
+
+def _stream_csv(chunks):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_COLUMNS)
+    for records in chunks:
+        for record in records:
+            writer.writerow(_export_row(record))
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def _stream_ndjson(chunks):
+    for records in chunks:
+        yield "".join(
+            json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            for record in records
+        )
+
+
+def _stream_xlsx(chunks, workbook_class):
+    workbook = workbook_class(write_only=True)
+    sheet = workbook.create_sheet("Evaluations")
+    sheet.append(list(EXPORT_COLUMNS))
+    for records in chunks:
+        for record in records:
+            sheet.append(_export_row(record))
+
+    fd, path = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        workbook.save(path)
+        with open(path, "rb") as stream:
+            while block := stream.read(64 * 1024):
+                yield block
+    finally:
+        os.unlink(path)
+
+
+@evaluation_bp.route("/<int:evaluation_id>/processes/nested", methods=["GET"])
+def get_nested_process(evaluation_id: int) -> tuple[Response, int]:
+    """Return the nested process payload for an evaluation."""
+
+    tz = resolve_timezone_from_request(request.args)
+
+    evaluation = Evaluation.query.get(evaluation_id)
+    if not evaluation:
+        return jsonify({"success": False, "message": "Evaluation not found"}), 404
+
+    markers = _nested_markers(evaluation_id)
+    etag = _nested_process_etag(evaluation, tz, markers)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    snapshot = db.session.get(EvaluationNestedSnapshot, evaluation_id)
+    if snapshot is not None and snapshot.state == _nested_state(markers):
+        response = current_app.response_class(
+            snapshot.body, mimetype="application/json"
+        )
+        response.headers["X-Nested-Snapshot-Version"] = str(snapshot.version)
+    else:
+        response_payload, warnings = _load_nested_payloads([evaluation_id])[
+            evaluation_id
+        ]
+        response = jsonify(
+            {
+                "success": True,
+                "data": {"payload": response_payload, "warnings": warnings},
+            }
+        )
 
     log = OperationLog(
         operation_type=OperationType.VIEW.value,
@@ -2414,11 +4522,10 @@ def get_nested_process(evaluation_id: int) -> tuple[Response, int]:
         status_code=200,
         success=True,
     )
-    db.session.add(log)
-    db.session.commit()
+    OperationLogWriter.record(log)
 
     response.headers["X-Server-Timezone"] = timezone_label(tz)
-    return response
+    return apply_etag(response, etag)
 
 
 @evaluation_bp.route("/<int:evaluation_id>/processes", methods=["POST"])
@@ -2548,8 +4655,7 @@ def create_evaluation_process(evaluation_id: int) -> tuple[Response, int]:
             status_code=201,
             success=True,
         )
-        db.session.add(log)
-        db.session.commit()
+        OperationLogWriter.record(log, sync=True)
 
         response = jsonify(
             {
@@ -2673,8 +4779,7 @@ def get_evaluation_processes(evaluation_id: int) -> tuple[Response, int]:
             else None,
             success=True,
         )
-        db.session.add(log)
-        db.session.commit()
+        OperationLogWriter.record(log)
 
         response = jsonify(
             {
@@ -2807,8 +4912,7 @@ def get_evaluation_process(evaluation_id: int, process_id: int) -> tuple[Respons
             else None,
             success=True,
         )
-        db.session.add(log)
-        db.session.commit()
+        OperationLogWriter.record(log)
 
         response = jsonify(
             {
@@ -2957,8 +5061,7 @@ def update_evaluation_process(
             target_id=process_id,
             target_description=f"Updated process {process.eval_code} for evaluation {evaluation.evaluation_number}",
             operation_description="User updated an evaluation process",
-            old_data=old_data,
-            new_data=process.to_dict(tz=tz),
+            new_data=make_patch(old_data, process.to_dict(tz=tz)),
             ip_address=get_client_ip(request),
             user_agent=request.user_agent.string,
             request_method=request.method,
@@ -2969,8 +5072,7 @@ def update_evaluation_process(
             status_code=200,
             success=True,
         )
-        db.session.add(log)
-        db.session.commit()
+        OperationLogWriter.record(log, sync=True)
 
         response = jsonify(
             {
@@ -3078,8 +5180,7 @@ def delete_evaluation_process(
             status_code=200,
             success=True,
         )
-        db.session.add(log)
-        db.session.commit()
+        OperationLogWriter.record(log, sync=True)
 
         response = jsonify(
             {
@@ -3227,8 +5328,7 @@ def update_evaluation_status(evaluation_id: int) -> tuple[Response, int]:
             status_code=200,
             success=True,
         )
-        db.session.add(log)
-        db.session.commit()
+        OperationLogWriter.record(log, sync=True)
 
         response = jsonify(
             {
@@ -3258,10 +5358,19 @@ def get_evaluation_logs(evaluation_id: int) -> tuple[Response, int]:
     Args:
         evaluation_id (int): ID of the evaluation to get logs for.
 
+    Query Parameters:
+        per_page (int, optional): Logs per page. Defaults to 50.
+        cursor (str, optional): Opaque ``next_cursor`` from the previous page.
+        types (str, optional): Comma-separated operation types to keep.
+        exclude_views (bool, optional): Leave out VIEW logs.
+        snapshots (str, optional): ``full`` rebuilds complete before/after
+            records for update logs instead of only the changed fields.
+
     Returns:
         Tuple[Response, int]: JSON response with operation logs and HTTP status code.
 
     Raises:
+        400: If the cursor or a log type is invalid.
         404: If evaluation not found.
         500: If database operation fails.
     ---
@@ -3277,9 +5386,38 @@ def get_evaluation_logs(evaluation_id: int) -> tuple[Response, int]:
         schema:
           type: integer
         description: ID of the evaluation to get logs for
+      - name: per_page
+        in: query
+        schema:
+          type: integer
+          default: 50
+        description: Logs per page, newest first
+      - name: cursor
+        in: query
+        schema:
+          type: string
+        description: Opaque next_cursor returned by the previous page
+      - name: types
+        in: query
+        schema:
+          type: string
+        description: Comma-separated operation types (create, update, view, ...)
+      - name: exclude_views
+        in: query
+        schema:
+          type: boolean
+        description: Leave out VIEW logs
+      - name: snapshots
+        in: query
+        schema:
+          type: string
+          enum: [changes, full]
+        description: Return changed fields only (default) or full snapshots
     responses:
       200:
-        description: Operation logs for the evaluation
+        description: Operation logs and aggregated view activity for the evaluation
+      400:
+        description: Invalid cursor or log type
       401:
         description: Unauthorized
       404:
@@ -3295,61 +5433,30 @@ def get_evaluation_logs(evaluation_id: int) -> tuple[Response, int]:
             return jsonify({"success": False, "message": "Evaluation not found"}), 404
 
         tz = resolve_timezone_from_request(request.args)
+        per_page = request.args.get("per_page", DEFAULT_BATCH_LOG_LIMIT, type=int)
+        per_page = max(1, min(per_page, MAX_CURSOR_PAGE_SIZE))
+        snapshots = request.args.get("snapshots") == "full"
 
-        # Collect related process IDs
-        process_ids = [
-            p.id
-            for p in EvaluationProcess.query.with_entities(EvaluationProcess.id)
-            .filter_by(evaluation_id=evaluation_id)
-            .all()
-        ]
-        process_ids = (
-            [pid for (pid,) in process_ids]
-            if process_ids and isinstance(process_ids[0], tuple)
-            else process_ids
-        )
-
-        # Compose logs across evaluation, status, and processes
-        logs = []
-        logs += [
-            log.to_dict(tz=tz)
-            for log in OperationLog.query.filter_by(
-                target_type="evaluation", target_id=evaluation_id
-            )
-            .order_by(OperationLog.created_at.desc())
-            .all()
-        ]
-        logs += [
-            log.to_dict(tz=tz)
-            for log in OperationLog.query.filter_by(
-                target_type="evaluation_status", target_id=evaluation_id
-            )
-            .order_by(OperationLog.created_at.desc())
-            .all()
-        ]
-        logs += [
-            log.to_dict(tz=tz)
-            for log in OperationLog.query.filter_by(
-                target_type="evaluation_nested_process", target_id=evaluation_id
+        # Compose logs across evaluation, status, nested and legacy processes
+        try:
+            logs, next_cursor = _evaluation_log_page(
+                evaluation_id, request.args, per_page
             )
-            .order_by(OperationLog.created_at.desc())
-            .all()
-        ]
-        if process_ids:
-            logs += [
-                log.to_dict(tz=tz)
-                for log in OperationLog.query.filter(
-                    OperationLog.target_type == "evaluation_process",
-                    OperationLog.target_id.in_(process_ids),
-                )
-                .order_by(OperationLog.created_at.desc())
-                .all()
-            ]
-
-        # Sort logs by created_at descending
-        logs.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+        except ValueError as e:
+            return jsonify({"success": False, "message": str(e)}), 400
 
-        response = jsonify({"success": True, "data": {"logs": logs}})
+        response = jsonify(
+            {
+                "success": True,
+                "data": {
+                    "logs": [log.to_dict(tz=tz, snapshots=snapshots) for log in logs],
+                    "per_page": per_page,
+                    "next_cursor": next_cursor,
+                    "has_more": next_cursor is not None,
+                    "view_activity": _load_view_activity(evaluation_id, tz),
+                },
+            }
+        )
         response.headers["X-Server-Timezone"] = timezone_label(tz)
         return response
     except Exception as e:
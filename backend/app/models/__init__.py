@@ -2,6 +2,7 @@
 
 from app import db
 
+from .data_version import DataVersion, current_version, version_token
 from .evaluation import (
     Evaluation,
     EvaluationDetail,
@@ -18,20 +19,29 @@ from .evaluation import (
     NandProduct,
     NandTimelineRelation,
 )
+from .kpi_rollup import EvaluationKpiDaily
+from .nested_snapshot import EvaluationNestedSnapshot
 from .operation_log import OperationLog
+from .payload_blob import PayloadBlob
+from .search_index import EvaluationSearchToken
 from .system_config import SystemConfig
+from .view_counter import ViewCounter
 
 # Export all models for easy importing
 __all__ = [
     "db",
+    "DataVersion",
     "Evaluation",
     "EvaluationDetail",
+    "EvaluationKpiDaily",
     "EvaluationNestedProcess",
+    "EvaluationNestedSnapshot",
     "EvaluationProcess",
     "EvaluationProcessRaw",
     "EvaluationProcessStep",
     "EvaluationStepFailure",
     "EvaluationResult",
+    "EvaluationSearchToken",
     "FailCode",
     "NandAppliedProduct",
     "NandEvaluation",
@@ -39,5 +49,9 @@ __all__ = [
     "NandProduct",
     "NandTimelineRelation",
     "OperationLog",
+    "PayloadBlob",
     "SystemConfig",
+    "ViewCounter",
+    "current_version",
+    "version_token",
 ]
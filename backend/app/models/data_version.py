@@ -0,0 +1,141 @@
+"""Global data version counters.
+
+Each counter is a single row that is incremented inside the same transaction
+as the write it describes. Readers in any worker process can compare the
+counter with the one they cached against, so invalidation needs neither
+TTLs nor cross-process messaging.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+
+from app import db
+from app.utils.timezone import utcnow
+
+from .evaluation import (
+    Evaluation,
+    EvaluationDetail,
+    EvaluationNestedProcess,
+    EvaluationProcess,
+    EvaluationProcessLot,
+    EvaluationProcessRaw,
+    EvaluationProcessStep,
+    EvaluationResult,
+    EvaluationStepFailure,
+    EvaluationStepLot,
+    FailCode,
+    NandAppliedProduct,
+    NandEvaluation,
+    NandGrade,
+    NandProduct,
+    NandTimelineRelation,
+)
+
+EVALUATIONS_VERSION = "evaluations"
+# Bumped when an existing fail code changes or disappears; new codes do not
+# invalidate cached code -> id entries.
+FAIL_CODES_VERSION = "fail_codes"
+
+# Rows whose changes can alter any evaluation list, KPI or detail payload.
+EVALUATION_VERSIONED_MODELS = (
+    Evaluation,
+    EvaluationDetail,
+    EvaluationNestedProcess,
+    EvaluationProcess,
+    EvaluationProcessLot,
+    EvaluationProcessRaw,
+    EvaluationProcessStep,
+    EvaluationResult,
+    EvaluationStepFailure,
+    EvaluationStepLot,
+    FailCode,
+    NandAppliedProduct,
+    NandEvaluation,
+    NandGrade,
+    NandProduct,
+    NandTimelineRelation,
+)
+
+
+class DataVersion(db.Model):
+    """Monotonic change counter for a family of tables."""
+
+    __tablename__ = "data_versions"
+
+    name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime(timezone=True), default=utcnow)
+
+    def __repr__(self) -> str:
+        return f"<DataVersion {self.name}={self.version}>"
+
+
+def current_version(name: str = EVALUATIONS_VERSION) -> int:
+    """Return the committed counter value (0 before the first write)."""
+    version = db.session.execute(
+        select(DataVersion.version).where(DataVersion.name == name)
+    ).scalar()
+    return version or 0
+
+
+def version_token(
+    name: str = EVALUATIONS_VERSION, session: Session | None = None
+) -> str:
+    """Return an opaque token that changes whenever the counter is bumped.
+
+    The bump time is part of the token so a counter value reused after a
+    rolled-back transaction cannot match entries cached against it. Pass
+    ``session`` to read the counter inside that session's transaction.
+    """
+    session = session or db.session
+    row = session.execute(
+        select(DataVersion.version, DataVersion.updated_at).where(
+            DataVersion.name == name
+        )
+    ).first()
+    if row is None:
+        return "0"
+    return f"{row.version}:{row.updated_at.isoformat() if row.updated_at else ''}"
+
+
+def bump_version(connection, name: str = EVALUATIONS_VERSION) -> None:
+    table = DataVersion.__table__
+    result = connection.execute(
+        update(table)
+        .where(table.c.name == name)
+        .values(version=table.c.version + 1, updated_at=utcnow())
+    )
+    if result.rowcount == 0:
+        connection.execute(
+            insert(table).values(name=name, version=1, updated_at=utcnow())
+        )
+
+
+def touches_evaluations(session: Session) -> bool:
+    if any(isinstance(obj, EVALUATION_VERSIONED_MODELS) for obj in session.new):
+        return True
+    if any(isinstance(obj, EVALUATION_VERSIONED_MODELS) for obj in session.deleted):
+        return True
+    return any(
+        isinstance(obj, EVALUATION_VERSIONED_MODELS) and session.is_modified(obj)
+        for obj in session.dirty
+    )
+
+
+def _touches_fail_codes(session: Session) -> bool:
+    if any(isinstance(obj, FailCode) for obj in session.deleted):
+        return True
+    return any(
+        isinstance(obj, FailCode) and session.is_modified(obj) for obj in session.dirty
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_evaluations_version(session: Session, flush_context) -> None:
+    # new/dirty/deleted still describe the flushed changes at this point.
+    if touches_evaluations(session):
+        bump_version(session.connection(), EVALUATIONS_VERSION)
+    if _touches_fail_codes(session):
+        bump_version(session.connection(), FAIL_CODES_VERSION)
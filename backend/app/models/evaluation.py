@@ -368,6 +368,13 @@ class Evaluation(db.Model):
     """
 
     __tablename__ = "evaluations"
+    __table_args__ = (
+        # Operational views filter status together with a date column.
+        db.Index("ix_evaluations_status_updated_at", "status", "updated_at"),
+        db.Index("ix_evaluations_status_start_date", "status", "start_date"),
+        # Default list order and keyset pagination: created_at DESC, id DESC.
+        db.Index("ix_evaluations_created_at_id", "created_at", "id"),
+    )
 
     # Primary key
     id = db.Column(db.Integer, primary_key=True)
@@ -393,7 +400,7 @@ class Evaluation(db.Model):
     test_process = db.Column(db.Text)  # Test process notes
     v_process = db.Column(db.Text)  # V process notes
     pgm_login_text = db.Column(db.Text)  # PGM login description
-    pgm_login_image = db.Column(db.Text)  # PGM login image (base64 or data URL)
+    pgm_login_image_ref = db.Column(db.String(64))  # BlobStore digest of PGM image
 
     # Status and workflow
     status = db.Column(
@@ -598,6 +605,54 @@ class Evaluation(db.Model):
 
         return None
 
+    # Columns returned by ``view=summary`` on list endpoints: everything a
+    # table row needs, without the large free-text and image columns.
+    SUMMARY_FIELDS = (
+        "id",
+        "evaluation_number",
+        "evaluation_name",
+        "evaluation_type",
+        "product_name",
+        "part_number",
+        "status",
+        "start_date",
+        "actual_end_date",
+        "process_step",
+        "scs_charger_name",
+        "head_office_charger_name",
+        "created_at",
+        "updated_at",
+    )
+
+    @classmethod
+    def column_fields(cls) -> tuple[str, ...]:
+        """Return the plain column names that ``to_dict`` exposes."""
+        return tuple(column.key for column in cls.__table__.columns)
+
+    @classmethod
+    def row_to_dict(cls, row: Any, fields: list[str], tz=None) -> dict[str, Any]:
+        """Serialize a column-only result row the same way ``to_dict`` would.
+
+        Args:
+            row: Result row exposing the requested columns as attributes.
+            fields: Column names to emit, in output order.
+
+        Returns:
+            Evaluation data dictionary restricted to ``fields``.
+
+        """
+        columns = cls.__table__.columns
+        data = {}
+        for field in fields:
+            value = getattr(row, field)
+            column_type = columns[field].type
+            if isinstance(column_type, db.DateTime):
+                value = iso_local(value, tz)
+            elif isinstance(column_type, db.Date):
+                value = iso_date(value, tz)
+            data[field] = value
+        return data
+
     def to_dict(self, include_details: bool = False, tz=None) -> dict[str, Any]:
         """Convert evaluation to dictionary.
 
@@ -608,6 +663,8 @@ class Evaluation(db.Model):
             Evaluation data dictionary.
 
         """
+        from app.services.blob_store import BlobStore
+
         data = {
             "id": self.id,
             "evaluation_number": self.evaluation_number,
@@ -621,7 +678,8 @@ class Evaluation(db.Model):
             "test_process": self.test_process,
             "v_process": self.v_process,
             "pgm_login_text": self.pgm_login_text,
-            "pgm_login_image": self.pgm_login_image,
+            "pgm_login_image": BlobStore.url_for(self.pgm_login_image_ref),
+            "pgm_login_image_ref": self.pgm_login_image_ref,
             "status": self.status,
             "start_date": iso_date(self.start_date, tz),
             "actual_end_date": iso_date(self.actual_end_date, tz),
@@ -661,7 +719,7 @@ class EvaluationDetail(db.Model):
 
     # Foreign key
     evaluation_id = db.Column(
-        db.Integer, db.ForeignKey("evaluations.id"), nullable=False
+        db.Integer, db.ForeignKey("evaluations.id"), nullable=False, index=True
     )
 
     # Detail type and information
@@ -733,7 +791,7 @@ class EvaluationResult(db.Model):
 
     # Foreign key
     evaluation_id = db.Column(
-        db.Integer, db.ForeignKey("evaluations.id"), nullable=False
+        db.Integer, db.ForeignKey("evaluations.id"), nullable=False, index=True
     )
 
     # Result type and data
@@ -807,7 +865,7 @@ class EvaluationProcess(db.Model):
 
     # Foreign key
     evaluation_id = db.Column(
-        db.Integer, db.ForeignKey("evaluations.id"), nullable=False
+        db.Integer, db.ForeignKey("evaluations.id"), nullable=False, index=True
     )
 
     # Process identification
@@ -882,7 +940,11 @@ class EvaluationProcessRaw(db.Model):
     evaluation_id = db.Column(
         db.Integer, db.ForeignKey("evaluations.id"), nullable=False, index=True
     )
-    payload = db.Column(db.JSON, nullable=False)
+    # Inline payload of rows saved before the payload store; newer rows keep
+    # NULL here and reference the ``payload_blobs`` row by ``payload_hash``.
+    payload = db.Column(db.JSON(none_as_null=True), nullable=True)
+    # SHA-256 of the canonical JSON payload; an identical resubmission is a no-op.
+    payload_hash = db.Column(db.String(64))
     source = db.Column(db.String(32), nullable=False, default="rc0")
 
     created_at = db.Column(
@@ -954,7 +1016,7 @@ class EvaluationProcessLot(db.Model):
     evaluation_id = db.Column(
         db.Integer, db.ForeignKey("evaluations.id"), nullable=False, index=True
     )
-    lot_number = db.Column(db.String(100), nullable=False)
+    lot_number = db.Column(db.String(100), nullable=False, index=True)
     quantity = db.Column(db.Integer, nullable=False, default=0)
     client_id = db.Column(db.String(64))
     process_key = db.Column(db.String(64))
@@ -1062,6 +1124,7 @@ class EvaluationStepLot(db.Model):
         db.Integer,
         db.ForeignKey("evaluation_process_lots.id", ondelete="CASCADE"),
         primary_key=True,
+        index=True,
     )
     quantity_override = db.Column(db.Integer)
 
@@ -1090,12 +1153,15 @@ class EvaluationStepFailure(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     step_id = db.Column(
-        db.Integer, db.ForeignKey("evaluation_process_steps.id"), nullable=False
+        db.Integer,
+        db.ForeignKey("evaluation_process_steps.id"),
+        nullable=False,
+        index=True,
     )
     sequence = db.Column(db.Integer, nullable=False, default=1)
     serial_number = db.Column(db.String(100))
 
-    fail_code_id = db.Column(db.Integer, db.ForeignKey("fail_codes.id"))
+    fail_code_id = db.Column(db.Integer, db.ForeignKey("fail_codes.id"), index=True)
     fail_code_text = db.Column(db.String(32), nullable=False)
     fail_code_name_snapshot = db.Column(db.String(255))
     analysis_result = db.Column(db.Text)
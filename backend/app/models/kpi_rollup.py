@@ -0,0 +1,222 @@
+"""Daily KPI rollup for the evaluation console.
+
+``evaluation_kpi_daily`` holds one row per day, evaluation type and product
+with the counters the KPI cards are built from:
+
+- ``created_count``: evaluations created on ``day`` (UTC)
+- ``completed_count``: completed evaluations whose ``actual_end_date`` is ``day``
+- ``open_started_count``: open evaluations started on ``day`` (the age histogram)
+- ``open_updated_count``: open evaluations last updated on ``day`` (stale basis)
+
+Mapper events adjust the counters on the flush connection, so the rollup
+changes in the same transaction as the evaluation row it describes.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import delete, event, insert, inspect, select, update
+
+from app import db
+
+from .evaluation import Evaluation, EvaluationStatus
+
+ROLLUP_COUNTERS = (
+    "created_count",
+    "completed_count",
+    "open_started_count",
+    "open_updated_count",
+)
+# Mirrors ACTIVE_EVALUATION_STATUSES in app.api.evaluation.
+ROLLUP_OPEN_STATUSES = (EvaluationStatus.IN_PROGRESS.value,)
+ROLLUP_SOURCE_FIELDS = (
+    "evaluation_type",
+    "product_name",
+    "status",
+    "start_date",
+    "actual_end_date",
+    "created_at",
+    "updated_at",
+)
+_STATE_KEY = "kpi_rollup_before"
+
+RollupKey = tuple[date, str, str]
+
+
+class EvaluationKpiDaily(db.Model):
+    """KPI counters for one day, evaluation type and product."""
+
+    __tablename__ = "evaluation_kpi_daily"
+
+    day = db.Column(db.Date, primary_key=True)
+    evaluation_type = db.Column(db.String(32), primary_key=True)
+    product_name = db.Column(db.String(100), primary_key=True)
+    created_count = db.Column(db.Integer, nullable=False, default=0)
+    completed_count = db.Column(db.Integer, nullable=False, default=0)
+    open_started_count = db.Column(db.Integer, nullable=False, default=0)
+    open_updated_count = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<EvaluationKpiDaily {self.day} {self.evaluation_type} "
+            f"{self.product_name}>"
+        )
+
+
+def _day(value: date | datetime | None) -> date | None:
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def contributions(values: Mapping[str, Any]) -> list[tuple[RollupKey, str]]:
+    """Return the ``(key, counter)`` pairs one evaluation adds to the rollup."""
+    evaluation_type = values["evaluation_type"]
+    product_name = values["product_name"]
+    pairs = []
+
+    def _add(day, counter):
+        day = _day(day)
+        if day is not None:
+            pairs.append(((day, evaluation_type, product_name), counter))
+
+    _add(values["created_at"], "created_count")
+    if values["status"] == EvaluationStatus.COMPLETED.value:
+        _add(values["actual_end_date"], "completed_count")
+    if values["status"] in ROLLUP_OPEN_STATUSES:
+        _add(values["start_date"], "open_started_count")
+        _add(values["updated_at"], "open_updated_count")
+    return pairs
+
+
+def rollup_rows(counts: Mapping[tuple[RollupKey, str], int]) -> list[dict]:
+    """Turn ``{(key, counter): n}`` into insertable rollup rows."""
+    rows: dict[RollupKey, dict] = {}
+    for (key, counter), count in counts.items():
+        if not count:
+            continue
+        day, evaluation_type, product_name = key
+        row = rows.setdefault(
+            key,
+            {
+                "day": day,
+                "evaluation_type": evaluation_type,
+                "product_name": product_name,
+                **dict.fromkeys(ROLLUP_COUNTERS, 0),
+            },
+        )
+        row[counter] += count
+    return list(rows.values())
+
+
+def _apply(connection, deltas: Counter) -> None:
+    table = EvaluationKpiDaily.__table__
+    by_key: dict[RollupKey, dict[str, int]] = defaultdict(dict)
+    for (key, counter), delta in deltas.items():
+        if delta:
+            by_key[key][counter] = delta
+    for key, changes in by_key.items():
+        day, evaluation_type, product_name = key
+        result = connection.execute(
+            update(table)
+            .where(
+                table.c.day == day,
+                table.c.evaluation_type == evaluation_type,
+                table.c.product_name == product_name,
+            )
+            .values(
+                {
+                    counter: table.c[counter] + delta
+                    for counter, delta in changes.items()
+                }
+            )
+        )
+        if result.rowcount == 0:
+            connection.execute(
+                insert(table).values(
+                    day=day,
+                    evaluation_type=evaluation_type,
+                    product_name=product_name,
+                    **{counter: changes.get(counter, 0) for counter in ROLLUP_COUNTERS},
+                )
+            )
+
+
+def _stored_values(connection, evaluation_id: int) -> dict[str, Any] | None:
+    columns = [getattr(Evaluation, field) for field in ROLLUP_SOURCE_FIELDS]
+    row = connection.execute(
+        select(*columns).where(Evaluation.id == evaluation_id)
+    ).first()
+    return dict(row._mapping) if row is not None else None
+
+
+def _current_values(target: Evaluation) -> dict[str, Any]:
+    return {field: getattr(target, field) for field in ROLLUP_SOURCE_FIELDS}
+
+
+def _adjust(connection, added: Iterable, removed: Iterable) -> None:
+    deltas = Counter(added)
+    deltas.subtract(removed)
+    _apply(connection, deltas)
+
+
+@event.listens_for(Evaluation, "after_insert")
+def _rollup_inserted_evaluation(mapper, connection, target) -> None:
+    _adjust(connection, contributions(_current_values(target)), [])
+
+
+@event.listens_for(Evaluation, "before_update")
+def _remember_rollup_before_update(mapper, connection, target) -> None:
+    # ``updated_at`` is assigned by onupdate during the flush and has no
+    # history, so the stored row is the reliable "before" picture.
+    state = inspect(target)
+    if not state.session.is_modified(target, include_collections=False):
+        return
+    state.info[_STATE_KEY] = _stored_values(connection, target.id)
+
+
+@event.listens_for(Evaluation, "after_update")
+def _rollup_updated_evaluation(mapper, connection, target) -> None:
+    before = inspect(target).info.pop(_STATE_KEY, None)
+    if before is None:
+        return
+    _adjust(connection, contributions(_current_values(target)), contributions(before))
+
+
+@event.listens_for(Evaluation, "before_delete")
+def _rollup_deleted_evaluation(mapper, connection, target) -> None:
+    before = _stored_values(connection, target.id)
+    if before is not None:
+        _adjust(connection, [], contributions(before))
+
+
+def rebuild_kpi_rollup(chunk_size: int = 1000) -> int:
+    """Recompute every rollup row from ``evaluations``; returns rows read."""
+    table = EvaluationKpiDaily.__table__
+    db.session.execute(delete(table))
+    columns = [getattr(Evaluation, field) for field in ROLLUP_SOURCE_FIELDS]
+    counts: Counter = Counter()
+    last_id = 0
+    scanned = 0
+    while True:
+        rows = db.session.execute(
+            select(Evaluation.id, *columns)
+            .where(Evaluation.id > last_id)
+            .order_by(Evaluation.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+        for row in rows:
+            counts.update(contributions(row._mapping))
+        scanned += len(rows)
+        last_id = rows[-1].id
+    rows = rollup_rows(counts)
+    for start in range(0, len(rows), chunk_size):
+        db.session.execute(insert(table), rows[start : start + chunk_size])
+    db.session.commit()
+    return scanned
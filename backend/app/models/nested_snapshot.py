@@ -0,0 +1,81 @@
+"""Materialized nested process responses.
+
+``GET /api/evaluations/<id>/processes/nested`` assembles its payload from the
+nested tables on every call, although they only change through the nested
+save. The save therefore renders the complete response body (payload and
+warnings) into ``evaluation_nested_snapshots`` as encoded JSON, and reads
+return those bytes as they are.
+
+Each snapshot keeps the ``state`` token of the nested change markers it was
+rendered from (the markers behind the nested ETag). A write that bypasses the
+nested save changes the markers, so reads fall back to live assembly until
+the next save or ``flask backfill-nested-snapshots`` renders it again.
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import func
+from sqlalchemy.dialects import mysql
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.utils.timezone import utcnow
+
+
+class EvaluationNestedSnapshot(db.Model):
+    """Encoded nested process response of one evaluation."""
+
+    __tablename__ = "evaluation_nested_snapshots"
+
+    evaluation_id = db.Column(
+        db.Integer,
+        db.ForeignKey("evaluations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Incremented each time a different body is stored.
+    version = db.Column(db.Integer, nullable=False, default=1)
+    state = db.Column(db.String(64), nullable=False)
+    body = db.Column(
+        db.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql"), nullable=False
+    )
+
+    created_at = db.Column(
+        db.DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
+    )
+    updated_at = db.Column(
+        db.DateTime(timezone=True),
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<EvaluationNestedSnapshot eval={self.evaluation_id} v{self.version}>"
+
+
+def store_snapshot(evaluation_id: int, state: str, body: bytes) -> int:
+    """Insert or replace the snapshot in the session's transaction.
+
+    Returns the stored version.
+    """
+    snapshot = db.session.get(EvaluationNestedSnapshot, evaluation_id)
+    if snapshot is None:
+        try:
+            with db.session.begin_nested():
+                snapshot = EvaluationNestedSnapshot(
+                    evaluation_id=evaluation_id, version=1, state=state, body=body
+                )
+                db.session.add(snapshot)
+            return snapshot.version
+        except IntegrityError:
+            # Stored concurrently by another transaction.
+            snapshot = db.session.get(EvaluationNestedSnapshot, evaluation_id)
+    if snapshot.body != body:
+        snapshot.version += 1
+        snapshot.body = body
+    snapshot.state = state
+    return snapshot.version
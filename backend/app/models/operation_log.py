@@ -3,6 +3,8 @@ from enum import Enum
 from sqlalchemy import func
 
 from app import db
+from app.models.payload_blob import is_payload_ref, resolve_payload
+from app.utils.audit_diff import changed_fields, expand_patch, is_patch, make_patch
 from app.utils.timezone import iso_local, utcnow
 
 
@@ -32,6 +34,15 @@ class OperationLog(db.Model):
     """
 
     __tablename__ = "operation_logs"
+    __table_args__ = (
+        # Per-target timelines: WHERE target_type/target_id ORDER BY created_at.
+        db.Index(
+            "ix_operation_logs_target_type_target_id_created_at",
+            "target_type",
+            "target_id",
+            "created_at",
+        ),
+    )
 
     # Primary key
     id = db.Column(db.Integer, primary_key=True)
@@ -75,6 +86,12 @@ class OperationLog(db.Model):
     query_string = db.Column(db.Text)
     status_code = db.Column(db.Integer)
 
+    # Request cost, filled in once the response has been sent
+    duration_ms = db.Column(db.Float)  # Wall time including the response body
+    db_time_ms = db.Column(db.Float)  # Time spent executing SQL
+    db_statements = db.Column(db.Integer)
+    response_bytes = db.Column(db.Integer)
+
     # Result and status
     success = db.Column(db.Boolean, default=True, nullable=False)
     error_message = db.Column(db.Text)  # Error details if operation failed
@@ -186,6 +203,13 @@ class OperationLog(db.Model):
             "view": f"Viewed evaluation {evaluation.evaluation_number}",
         }
 
+        new_data = (
+            evaluation.to_dict() if operation_type in ["create", "update"] else None
+        )
+        if operation_type == "update" and old_data is not None:
+            # Updates keep only the changed fields; see app.utils.audit_diff
+            new_data, old_data = make_patch(old_data, new_data), None
+
         log = OperationLog(
             operation_type=operation_type,
             target_type="evaluation",
@@ -195,9 +219,7 @@ class OperationLog(db.Model):
                 operation_type, f"{operation_type} evaluation"
             ),
             old_data=old_data,
-            new_data=evaluation.to_dict()
-            if operation_type in ["create", "update"]
-            else None,
+            new_data=new_data,
             ip_address=ip_address,
             success=success,
             error_message=error_message,
@@ -277,13 +299,30 @@ class OperationLog(db.Model):
         db.session.commit()
         return log
 
-    def to_dict(self, tz=None):
+    def to_dict(self, tz=None, snapshots=False):
         """Convert operation log to dictionary
 
+        Update logs stored as a field patch return only the changed fields in
+        ``old_data``/``new_data`` unless ``snapshots`` asks for the full
+        before/after records. Payloads kept in the payload store are returned
+        as their ``{"$payload": digest}`` reference unless ``snapshots`` is set.
+
+        Args:
+            tz: Timezone for ``created_at``
+            snapshots (bool): Rebuild full snapshots from a stored patch and
+                inline stored payloads
+
         Returns:
             dict: Operation log data dictionary
 
         """
+        old_data, new_data = self.old_data, self.new_data
+        if snapshots and is_payload_ref(new_data):
+            new_data = resolve_payload(new_data)
+        elif is_patch(new_data):
+            old_data, new_data = (expand_patch if snapshots else changed_fields)(
+                new_data
+            )
         return {
             "id": self.id,
             "operation_type": self.operation_type,
@@ -291,14 +330,18 @@ class OperationLog(db.Model):
             "target_id": self.target_id,
             "target_description": self.target_description,
             "operation_description": self.operation_description,
-            "old_data": self.old_data,
-            "new_data": self.new_data,
+            "old_data": old_data,
+            "new_data": new_data,
             "ip_address": self.ip_address,
             "user_agent": self.user_agent,
             "request_method": self.request_method,
             "request_path": self.request_path,
             "query_string": self.query_string,
             "status_code": self.status_code,
+            "duration_ms": self.duration_ms,
+            "db_time_ms": self.db_time_ms,
+            "db_statements": self.db_statements,
+            "response_bytes": self.response_bytes,
             "success": self.success,
             "error_message": self.error_message,
             "created_at": iso_local(self.created_at, tz),
@@ -0,0 +1,160 @@
+"""Deduplicated, compressed JSON payloads.
+
+``payload_blobs`` stores each distinct JSON document once, keyed by the
+SHA-256 of its canonical encoding (sorted keys, no whitespace) and
+compressed with zlib. Rows that used to embed large payloads reference it
+instead:
+
+- ``EvaluationProcessRaw`` keeps ``payload`` NULL and the digest in
+  ``payload_hash``
+- nested-save operation logs keep ``{"$payload": digest}`` in ``new_data``
+
+Saving the same payload again, from any evaluation, adds no blob; it only
+moves ``last_used_at`` forward, which keeps the blob out of garbage
+collection while that save is in flight.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import zlib
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from app import db
+from app.utils.timezone import utcnow
+
+PAYLOAD_REF_KEY = "$payload"
+COMPRESSION_LEVEL = 6
+
+
+class PayloadBlob(db.Model):
+    """One canonical JSON payload, zlib-compressed."""
+
+    __tablename__ = "payload_blobs"
+
+    digest = db.Column(db.String(64), primary_key=True)
+    data = db.Column(
+        db.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql"), nullable=False
+    )
+    # Canonical JSON bytes before compression.
+    size = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(
+        db.DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
+    )
+    # Last save that stored or reused the payload; GC spares recent ones.
+    last_used_at = db.Column(
+        db.DateTime(timezone=True),
+        default=utcnow,
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<PayloadBlob {self.digest[:12]} {self.size}B>"
+
+
+def canonical_json(payload: Any) -> bytes:
+    return json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+
+
+def payload_digest(payload: Any) -> str:
+    return hashlib.sha256(canonical_json(payload)).hexdigest()
+
+
+def encode_payload(payload: Any) -> tuple[str, bytes, int]:
+    """Return ``(digest, compressed bytes, canonical size)``."""
+    encoded = canonical_json(payload)
+    return (
+        hashlib.sha256(encoded).hexdigest(),
+        zlib.compress(encoded, COMPRESSION_LEVEL),
+        len(encoded),
+    )
+
+
+def decode_payload(data: bytes) -> Any:
+    return json.loads(zlib.decompress(data))
+
+
+def payload_ref(digest: str) -> dict[str, str]:
+    return {PAYLOAD_REF_KEY: digest}
+
+
+def is_payload_ref(value: Any) -> bool:
+    return isinstance(value, dict) and set(value) == {PAYLOAD_REF_KEY}
+
+
+def store_payload(payload: Any) -> str:
+    """Upsert ``payload`` in the session's transaction; returns its digest.
+
+    An existing blob is never skipped on a prior read: the upsert bumps its
+    ``last_used_at`` and holds its row lock until commit, so a concurrent
+    ``PayloadStore.collect_garbage`` either re-checks the bumped row or has
+    already deleted it and the insert recreates it.
+    """
+    digest, data, size = encode_payload(payload)
+    now = utcnow()
+    table = PayloadBlob.__table__
+    values = {
+        "digest": digest,
+        "data": data,
+        "size": size,
+        "created_at": now,
+        "last_used_at": now,
+    }
+    dialect = db.session.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        statement = (sqlite if dialect == "sqlite" else postgresql).insert(table)
+        statement = statement.values(values).on_conflict_do_update(
+            index_elements=["digest"],
+            set_={"last_used_at": statement.excluded.last_used_at},
+        )
+    elif dialect in ("mysql", "mariadb"):
+        statement = mysql.insert(table).values(values)
+        statement = statement.on_duplicate_key_update(
+            last_used_at=statement.inserted.last_used_at
+        )
+    else:
+        bumped = db.session.execute(
+            update(table).where(table.c.digest == digest).values(last_used_at=now)
+        )
+        if bumped.rowcount:
+            return digest
+        statement = insert(table).values(values)
+    db.session.execute(statement)
+    return digest
+
+
+def load_payloads(digests: Iterable[str]) -> dict[str, Any]:
+    """Return ``{digest: payload}`` for the stored ones among ``digests``."""
+    wanted = list({digest for digest in digests if digest})
+    if not wanted:
+        return {}
+    rows = db.session.execute(
+        select(PayloadBlob.digest, PayloadBlob.data).where(
+            PayloadBlob.digest.in_(wanted)
+        )
+    ).all()
+    return {digest: decode_payload(data) for digest, data in rows}
+
+
+def load_payload(digest: str | None) -> Any:
+    return load_payloads([digest]).get(digest) if digest else None
+
+
+def resolve_payload(value: Any, digest: str | None = None) -> Any:
+    """Inline value, or the stored payload it (or ``digest``) refers to."""
+    if is_payload_ref(value):
+        return load_payload(value[PAYLOAD_REF_KEY])
+    if value is None and digest:
+        return load_payload(digest)
+    return value
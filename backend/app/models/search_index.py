@@ -0,0 +1,228 @@
+"""Trigram search index for substring filters on evaluations.
+
+``ILIKE '%term%'`` cannot use a B-tree index, so every filtered list/KPI
+request used to scan ``evaluations``. This module keeps a token table with the
+distinct lower-cased trigrams of each searchable column. A substring filter
+first selects the evaluations that contain the term's rarest trigrams (an
+indexed lookup) and then applies the original ILIKE to those candidates only,
+so results are identical to the plain predicate on every dialect.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from sqlalchemy import (
+    and_,
+    delete,
+    distinct,
+    event,
+    false,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+)
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from app import db
+
+from .evaluation import Evaluation
+
+SEARCH_FIELDS = (
+    "evaluation_number",
+    "product_name",
+    "scs_charger_name",
+    "head_office_charger_name",
+)
+TRIGRAM_SIZE = 3
+SELECTIVE_TRIGRAMS = 3
+CANDIDATE_LIMIT = 5000
+
+
+class EvaluationSearchToken(db.Model):
+    """One trigram of one searchable evaluation column."""
+
+    __tablename__ = "evaluation_search_tokens"
+
+    field = db.Column(db.String(32), primary_key=True)
+    token = db.Column(db.String(16), primary_key=True)
+    evaluation_id = db.Column(
+        db.Integer,
+        db.ForeignKey("evaluations.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<EvaluationSearchToken {self.field}:{self.token}>"
+
+
+def trigrams(value: str | None) -> set[str]:
+    """Return the distinct lower-cased trigrams of ``value``."""
+    if not value:
+        return set()
+    text = value.lower()
+    return {
+        text[index : index + TRIGRAM_SIZE]
+        for index in range(len(text) - TRIGRAM_SIZE + 1)
+    }
+
+
+def token_rows(evaluation_id: int, values: dict[str, str | None]) -> list[dict]:
+    return [
+        {"field": field, "token": token, "evaluation_id": evaluation_id}
+        for field, value in values.items()
+        for token in sorted(trigrams(value))
+    ]
+
+
+def substring_filter(column, term: str):
+    """Return ``column ILIKE '%term%'`` narrowed through the trigram index.
+
+    Terms shorter than a trigram, or containing LIKE wildcards, fall back to
+    the plain predicate.
+    """
+    predicate = column.ilike(f"%{term}%")
+    grams = trigrams(term)
+    if not grams or "%" in term or "_" in term:
+        return predicate
+
+    counts = _capped_trigram_counts(column.key, grams)
+    if min(counts.values()) == 0:
+        # Some trigram never occurs, so nothing can match.
+        return false()
+    ranked = sorted(grams, key=lambda token: (counts[token], token))
+    if counts[ranked[0]] >= CANDIDATE_LIMIT:
+        # Even the rarest trigram is common: a scan is cheaper than the join.
+        return predicate
+
+    # The ILIKE re-check keeps the result exact, so intersecting the rarest
+    # few trigrams prunes as well as all of them at a fraction of the cost.
+    selective = ranked[:SELECTIVE_TRIGRAMS]
+    candidates = (
+        select(EvaluationSearchToken.evaluation_id)
+        .where(
+            EvaluationSearchToken.field == column.key,
+            EvaluationSearchToken.token.in_(selective),
+        )
+        .group_by(EvaluationSearchToken.evaluation_id)
+        .having(func.count(distinct(EvaluationSearchToken.token)) == len(selective))
+    )
+    return and_(Evaluation.id.in_(candidates), predicate)
+
+
+def _capped_trigram_counts(field: str, grams: set[str]) -> dict[str, int]:
+    """Count index entries per trigram, stopping at ``CANDIDATE_LIMIT``.
+
+    Each count is a bounded range scan on the primary key, so common trigrams
+    (``ev-``, ``202``) cost no more than rare ones. All counts are fetched in
+    one statement.
+    """
+    ordered = sorted(grams)
+    probes = []
+    for token in ordered:
+        matches = (
+            select(literal(1))
+            .where(
+                EvaluationSearchToken.field == field,
+                EvaluationSearchToken.token == token,
+            )
+            .limit(CANDIDATE_LIMIT)
+            .subquery()
+        )
+        probes.append(select(func.count()).select_from(matches).scalar_subquery())
+    row = db.session.execute(select(*probes)).one()
+    return dict(zip(ordered, row, strict=True))
+
+
+def _replace_tokens(connection, evaluation_id: int, fields: Iterable[str], target):
+    fields = list(fields)
+    if not fields:
+        return
+    table = EvaluationSearchToken.__table__
+    connection.execute(
+        delete(table).where(
+            table.c.evaluation_id == evaluation_id, table.c.field.in_(fields)
+        )
+    )
+    rows = token_rows(
+        evaluation_id, {field: getattr(target, field) for field in fields}
+    )
+    if rows:
+        _insert_tokens(connection, rows)
+
+
+def _insert_tokens(connection, rows: list[dict]) -> None:
+    """Insert token rows, skipping keys the column collation deems equal.
+
+    Tokens are de-duplicated in Python after lower-casing, but MySQL's
+    default utf8mb4 collation is also accent-insensitive (``afe`` equals
+    ``afé``). Dropping such a duplicate is harmless: lookups compare under
+    the same collation, and candidates are re-checked with the ILIKE.
+    """
+    table = EvaluationSearchToken.__table__
+    dialect = connection.dialect.name
+    keys = ["field", "token", "evaluation_id"]
+    if dialect == "sqlite":
+        statement = sqlite.insert(table).on_conflict_do_nothing(index_elements=keys)
+    elif dialect == "postgresql":
+        statement = postgresql.insert(table).on_conflict_do_nothing(index_elements=keys)
+    elif dialect in ("mysql", "mariadb"):
+        statement = mysql.insert(table).prefix_with("IGNORE")
+    else:
+        statement = insert(table)
+    connection.execute(statement, rows)
+
+
+@event.listens_for(Evaluation, "after_insert")
+def _index_inserted_evaluation(mapper, connection, target) -> None:
+    _replace_tokens(connection, target.id, SEARCH_FIELDS, target)
+
+
+@event.listens_for(Evaluation, "after_update")
+def _index_updated_evaluation(mapper, connection, target) -> None:
+    state = inspect(target)
+    changed = [
+        field for field in SEARCH_FIELDS if state.attrs[field].history.has_changes()
+    ]
+    _replace_tokens(connection, target.id, changed, target)
+
+
+@event.listens_for(Evaluation, "after_delete")
+def _unindex_deleted_evaluation(mapper, connection, target) -> None:
+    # ON DELETE CASCADE is not enforced by SQLite unless foreign keys are on.
+    table = EvaluationSearchToken.__table__
+    connection.execute(delete(table).where(table.c.evaluation_id == target.id))
+
+
+def rebuild_search_index(chunk_size: int = 1000) -> int:
+    """Recreate every token row from ``evaluations``; returns rows indexed."""
+    table = EvaluationSearchToken.__table__
+    db.session.execute(delete(table))
+    columns = [Evaluation.id, *[getattr(Evaluation, field) for field in SEARCH_FIELDS]]
+    last_id = 0
+    indexed = 0
+    while True:
+        rows = db.session.execute(
+            select(*columns)
+            .where(Evaluation.id > last_id)
+            .order_by(Evaluation.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+        tokens = []
+        for row in rows:
+            tokens.extend(
+                token_rows(
+                    row.id, {field: getattr(row, field) for field in SEARCH_FIELDS}
+                )
+            )
+        if tokens:
+            _insert_tokens(db.session.connection(), tokens)
+        indexed += len(rows)
+        last_id = rows[-1].id
+    db.session.commit()
+    return indexed
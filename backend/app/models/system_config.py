@@ -297,6 +297,23 @@ class SystemConfig(db.Model):
                 "evaluation",
                 False,
             ),
+            # Operation log settings
+            (
+                "view_log_mode",
+                "aggregate",
+                "string",
+                "VIEW log rows to keep besides view counters (full/sample/aggregate)",
+                "logging",
+                False,
+            ),
+            (
+                "view_log_sample_rate",
+                0.1,
+                "float",
+                "Share of VIEW log rows kept when view_log_mode is sample",
+                "logging",
+                False,
+            ),
             # Security settings
             (
                 "session_timeout_minutes",
@@ -0,0 +1,129 @@
+"""Hourly view counters for read endpoints.
+
+``view_counters`` holds one row per target, hour and client IP with the
+number of VIEW events seen in that hour. Read endpoints upsert into it
+instead of (or as well as) writing one ``operation_logs`` row per request,
+depending on the ``view_log_mode`` system setting:
+
+- ``full``: keep every VIEW row
+- ``sample``: keep a ``view_log_sample_rate`` share of VIEW rows
+- ``aggregate``: keep counters only
+
+Counters are maintained in every mode, so view activity stays complete
+whatever share of rows is kept.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping
+from datetime import UTC, datetime
+
+from sqlalchemy import insert, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+from app import db
+from app.utils.timezone import utcnow
+
+VIEW_LOG_MODES = ("full", "sample", "aggregate")
+
+# target_type, target_id (0 when the view has no target), hour bucket, IP
+ViewKey = tuple[str, int, datetime, str]
+_KEY_COLUMNS = ("target_type", "target_id", "bucket_start", "ip_address")
+
+
+class ViewCounter(db.Model):
+    """VIEW events for one target, hour and client IP."""
+
+    __tablename__ = "view_counters"
+
+    target_type = db.Column(db.String(50), primary_key=True)
+    target_id = db.Column(db.Integer, primary_key=True, default=0)
+    bucket_start = db.Column(db.DateTime(timezone=True), primary_key=True)
+    ip_address = db.Column(db.String(45), primary_key=True, default="")
+    view_count = db.Column(db.Integer, nullable=False, default=0)
+    last_viewed_at = db.Column(db.DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ViewCounter {self.target_type} #{self.target_id} "
+            f"{self.bucket_start} {self.ip_address}>"
+        )
+
+
+def hour_bucket(moment: datetime | None = None) -> datetime:
+    """Start of the UTC hour containing ``moment`` (now by default)."""
+    moment = moment or utcnow()
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(UTC)
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def view_key(
+    target_type: str,
+    target_id: int | None,
+    ip_address: str | None,
+    moment: datetime | None = None,
+) -> ViewKey:
+    return (target_type, target_id or 0, hour_bucket(moment), ip_address or "")
+
+
+def record_views(
+    connection, hits: Mapping[ViewKey, int], seen_at: datetime | None = None
+) -> None:
+    """Add ``hits`` to the counters on ``connection``.
+
+    SQLite, PostgreSQL and MySQL add to existing rows with one upsert, so a
+    key another writer inserted meanwhile is incremented rather than
+    failing the transaction. Other dialects update first and insert the
+    missing rows.
+    """
+    table = ViewCounter.__table__
+    seen_at = seen_at or utcnow()
+    rows = [
+        {
+            "target_type": target_type,
+            "target_id": target_id,
+            "bucket_start": bucket_start,
+            "ip_address": ip_address,
+            "view_count": count,
+            "last_viewed_at": seen_at,
+        }
+        for (target_type, target_id, bucket_start, ip_address), count in Counter(
+            hits
+        ).items()
+        if count > 0
+    ]
+    if not rows:
+        return
+
+    dialect = connection.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        statement = (sqlite if dialect == "sqlite" else postgresql).insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=list(_KEY_COLUMNS),
+            set_={
+                "view_count": table.c.view_count + statement.excluded.view_count,
+                "last_viewed_at": statement.excluded.last_viewed_at,
+            },
+        )
+    elif dialect in ("mysql", "mariadb"):
+        statement = mysql.insert(table)
+        statement = statement.on_duplicate_key_update(
+            view_count=table.c.view_count + statement.inserted.view_count,
+            last_viewed_at=statement.inserted.last_viewed_at,
+        )
+    else:
+        for row in rows:
+            increment = (
+                update(table)
+                .where(*(table.c[column] == row[column] for column in _KEY_COLUMNS))
+                .values(
+                    view_count=table.c.view_count + row["view_count"],
+                    last_viewed_at=seen_at,
+                )
+            )
+            if not connection.execute(increment).rowcount:
+                connection.execute(insert(table), row)
+        return
+    connection.execute(statement, rows)
@@ -5,7 +5,23 @@ and workflows for the evaluation management system.
 """
 
 from .backup_service import BackupService
+from .blob_store import BlobStore
+from .fail_code_dictionary import FailCodeDictionary
+from .index_advisor import IndexAdvisor
+from .log_archive import LogArchive
+from .operation_log_writer import OperationLogWriter
+from .payload_store import PayloadStore
+from .response_cache import ResponseCache
+from .suggestion_index import SuggestionIndex
 
 __all__ = [
     "BackupService",
+    "BlobStore",
+    "FailCodeDictionary",
+    "IndexAdvisor",
+    "LogArchive",
+    "OperationLogWriter",
+    "PayloadStore",
+    "ResponseCache",
+    "SuggestionIndex",
 ]
@@ -0,0 +1,287 @@
+"""Content-addressed blob storage for Solution Evaluation System
+
+Binary attachments (currently the PGM login image) are stored as files under
+``UPLOAD_FOLDER/blobs`` named by the SHA-256 of their content, so identical
+uploads share one file and database rows only carry the 64-character digest.
+
+Files are written before the row referencing them commits, so a failed or
+rolled back save leaves an unreferenced file behind; ``flask prune-blobs``
+removes those once they are older than a grace window.
+"""
+
+import base64
+import binascii
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from collections.abc import Iterator
+
+from flask import current_app, has_request_context, url_for
+
+BLOB_URL_PREFIX = "/api/blobs"
+BLOB_REF_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+BLOB_URL_PATTERN = re.compile(r"/api/blobs/([0-9a-f]{64})/?$")
+DIGEST_PATTERN = re.compile(r"[0-9a-f]{64}")
+DATA_URL_PATTERN = re.compile(r"^data:([\w.+-]+/[\w.+-]+)?(;[^,]*)?,", re.DOTALL)
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+
+_MAGIC_TYPES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+)
+
+
+class BlobStore:
+    """Service class for SHA-256 addressed file blobs
+
+    Handles:
+    - Deduplicated, atomic writes
+    - Content type metadata sidecars
+    - Conversion from/to data URLs
+    - Public URLs served by the blob blueprint
+    - Garbage collection of unreferenced blobs
+    """
+
+    @staticmethod
+    def root(base_folder: str | None = None) -> str:
+        """Return the blob directory, defaulting to ``UPLOAD_FOLDER/blobs``."""
+        base_folder = base_folder or current_app.config.get("UPLOAD_FOLDER", "uploads")
+        return os.path.join(base_folder, "blobs")
+
+    @staticmethod
+    def is_ref(value: object) -> bool:
+        return isinstance(value, str) and bool(BLOB_REF_PATTERN.match(value))
+
+    @staticmethod
+    def path_for(digest: str, base_folder: str | None = None) -> str:
+        """Return the file path for a digest (two-level fan-out by prefix)."""
+        if not BlobStore.is_ref(digest):
+            raise ValueError(f"Invalid blob reference: {digest!r}")
+        return os.path.join(BlobStore.root(base_folder), digest[:2], digest)
+
+    @staticmethod
+    def exists(digest: str, base_folder: str | None = None) -> bool:
+        return BlobStore.is_ref(digest) and os.path.isfile(
+            BlobStore.path_for(digest, base_folder)
+        )
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def put(
+        data: bytes,
+        content_type: str | None = None,
+        base_folder: str | None = None,
+    ) -> str:
+        """Store ``data`` and return its digest.
+
+        Identical content is written only once. The metadata sidecar is written
+        before the blob itself so a visible blob always has its content type.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = BlobStore.path_for(digest, base_folder)
+        if os.path.isfile(path):
+            # Restart the grace window so pruning spares a blob being reused.
+            with contextlib.suppress(FileNotFoundError):
+                os.utime(path)
+                return digest
+
+        metadata = {
+            "content_type": content_type or BlobStore.sniff_content_type(data),
+            "size": len(data),
+        }
+        BlobStore._write_atomic(f"{path}.json", json.dumps(metadata).encode("utf-8"))
+        BlobStore._write_atomic(path, data)
+        return digest
+
+    @staticmethod
+    def read(digest: str, base_folder: str | None = None) -> bytes:
+        with open(BlobStore.path_for(digest, base_folder), "rb") as handle:
+            return handle.read()
+
+    @staticmethod
+    def content_type(digest: str, base_folder: str | None = None) -> str:
+        try:
+            with open(f"{BlobStore.path_for(digest, base_folder)}.json") as handle:
+                return json.load(handle).get("content_type") or DEFAULT_CONTENT_TYPE
+        except (OSError, ValueError):
+            return DEFAULT_CONTENT_TYPE
+
+    @staticmethod
+    def sniff_content_type(data: bytes) -> str:
+        for magic, content_type in _MAGIC_TYPES:
+            if data.startswith(magic):
+                return content_type
+        if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+            return "image/webp"
+        return DEFAULT_CONTENT_TYPE
+
+    @staticmethod
+    def decode_data_url(value: str) -> tuple[bytes, str | None]:
+        """Decode a ``data:`` URL (or bare base64) into bytes and content type."""
+        match = DATA_URL_PATTERN.match(value)
+        try:
+            if match:
+                payload = value[match.end() :]
+                if ";base64" not in (match.group(2) or ""):
+                    from urllib.parse import unquote_to_bytes
+
+                    return unquote_to_bytes(payload), match.group(1)
+                return base64.b64decode(payload, validate=False), match.group(1)
+            return base64.b64decode("".join(value.split()), validate=True), None
+        except (binascii.Error, ValueError) as exc:
+            raise ValueError("Image must be a data URL or base64 string") from exc
+
+    @staticmethod
+    def put_data_url(value: str, base_folder: str | None = None) -> str:
+        data, content_type = BlobStore.decode_data_url(value)
+        return BlobStore.put(data, content_type, base_folder)
+
+    @staticmethod
+    def to_data_url(digest: str, base_folder: str | None = None) -> str:
+        data = BlobStore.read(digest, base_folder)
+        content_type = BlobStore.content_type(digest, base_folder)
+        return f"data:{content_type};base64,{base64.b64encode(data).decode('ascii')}"
+
+    @staticmethod
+    def url_for(digest: str | None) -> str | None:
+        """Return the public URL of a blob.
+
+        Absolute inside a request; outside one (CLI, scripts) there is no host
+        to build from, so the path under ``/api/blobs`` is returned.
+        """
+        if not digest:
+            return None
+        if not has_request_context():
+            return f"{BLOB_URL_PREFIX}/{digest}"
+        return url_for("blob.get_blob", digest=digest, _external=True)
+
+    @staticmethod
+    def resolve_ref(value: object) -> str | None:
+        """Turn an API value into a blob reference.
+
+        Accepts a data URL or base64 string (stored), a blob URL or bare digest
+        previously returned by the API (kept), or an empty value (cleared).
+        """
+        if value is None:
+            return None
+        if not isinstance(value, str):
+            raise TypeError("Image must be a string")
+        value = value.strip()
+        if not value:
+            return None
+
+        match = BLOB_URL_PATTERN.search(value)
+        digest = match.group(1) if match else value
+        if BlobStore.is_ref(digest):
+            if not BlobStore.exists(digest):
+                raise ValueError(f"Unknown blob reference: {digest}")
+            return digest
+        return BlobStore.put_data_url(value)
+
+    @staticmethod
+    def stored(base_folder: str | None = None) -> Iterator[tuple[str, str]]:
+        """Yield ``(digest, path)`` for every stored blob."""
+        root = BlobStore.root(base_folder)
+        if not os.path.isdir(root):
+            return
+        for prefix in sorted(os.listdir(root)):
+            directory = os.path.join(root, prefix)
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if BlobStore.is_ref(name):
+                    yield name, os.path.join(directory, name)
+
+    @staticmethod
+    def referenced() -> set[str]:
+        """Digests evaluations, live operation logs or archived logs may use.
+
+        Log values are scanned as text for anything digest-shaped (audit
+        ``$ref`` patches, image URLs in snapshots). That can keep a few
+        unreferenced blobs but never drops a referenced one.
+        """
+        from sqlalchemy import or_, select
+
+        from app import db
+        from app.models.evaluation import Evaluation
+        from app.models.operation_log import OperationLog
+        from app.services.log_archive import LogArchive
+
+        digests = set(
+            db.session.execute(
+                select(Evaluation.pgm_login_image_ref).where(
+                    Evaluation.pgm_login_image_ref.is_not(None)
+                )
+            ).scalars()
+        )
+        logs = db.session.execute(
+            select(OperationLog.old_data, OperationLog.new_data)
+            .where(
+                or_(
+                    OperationLog.old_data.is_not(None),
+                    OperationLog.new_data.is_not(None),
+                )
+            )
+            .execution_options(yield_per=1000)
+        )
+        for old_data, new_data in logs:
+            digests.update(
+                DIGEST_PATTERN.findall(json.dumps([old_data, new_data], default=str))
+            )
+        for month in LogArchive.manifest()["segments"]:
+            path = LogArchive.segment_path(month)
+            if os.path.isfile(path):
+                with gzip.open(path, "rt", encoding="utf-8") as handle:
+                    for line in handle:
+                        digests.update(DIGEST_PATTERN.findall(line))
+        return digests
+
+    @staticmethod
+    def collect_garbage(
+        grace_seconds: int = 3600, base_folder: str | None = None
+    ) -> tuple[int, int]:
+        """Delete unreferenced blobs; returns ``(blobs, bytes)``.
+
+        Blobs written or reused within ``grace_seconds`` are kept, since the
+        save that references them may not have committed yet.
+        """
+        keep = BlobStore.referenced()
+        cutoff = time.time() - grace_seconds
+        deleted = freed = 0
+        for digest, path in list(BlobStore.stored(base_folder)):
+            if digest in keep:
+                continue
+            try:
+                stat = os.stat(path)
+                if stat.st_mtime > cutoff:
+                    continue
+                # Blob before sidecar, so a visible blob keeps its content type.
+                os.unlink(path)
+            except FileNotFoundError:
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(f"{path}.json")
+            deleted += 1
+            freed += stat.st_size
+        return deleted, freed
@@ -0,0 +1,232 @@
+"""Batched fail-code resolution with a per-worker cache
+
+A nested save may carry thousands of failure rows over a few dozen fail
+codes. ``FailCodeDictionary.resolve`` maps all of them to ids at once:
+
+- codes cached by this worker are answered from an LRU of code -> id
+- the rest are read with one ``IN`` query per ``LOOKUP_CHUNK`` codes
+- codes that do not exist are created as provisional entries by one
+  insert-or-ignore executemany, then read back with the same lookup
+
+The cache is valid while the ``fail_codes`` data version is unchanged. That
+counter is bumped whenever a flush updates or deletes a fail code; creating
+codes does not affect existing code -> id entries and does not bump it.
+Entries read or created in a transaction are cached only once it commits,
+so a rolled-back provisional code never leaves its id behind.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from flask import current_app, has_app_context
+from sqlalchemy import and_, bindparam, event, insert, or_, select, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app import db
+from app.models.data_version import FAIL_CODES_VERSION, version_token
+from app.models.evaluation import FailCode
+
+LOOKUP_CHUNK = 500
+# (id, has short_name, has source)
+CacheEntry = tuple[int, bool, bool]
+_PENDING_KEY = "fail_code_entries"
+
+
+class FailCodeDictionary:
+    """Service class for resolving fail code texts to ids
+
+    Handles:
+    - Per-worker LRU of code -> id guarded by the fail_codes version
+    - Batched lookup and bulk creation of provisional codes
+    - Filling a missing short name or source, as single-row resolution did
+    """
+
+    EXTENSION_KEY = "fail_code_dictionary"
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.version: str | None = None
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def instance() -> FailCodeDictionary:
+        extensions = current_app.extensions
+        if FailCodeDictionary.EXTENSION_KEY not in extensions:
+            extensions[FailCodeDictionary.EXTENSION_KEY] = FailCodeDictionary(
+                int(current_app.config.get("FAIL_CODE_CACHE_SIZE") or 4096)
+            )
+        return extensions[FailCodeDictionary.EXTENSION_KEY]
+
+    @staticmethod
+    def resolve(
+        codes: Iterable[tuple[str, str | None]], source: str = "nested-ui"
+    ) -> dict[str, int]:
+        """Return ``{code: id}`` for ``(code, name_snapshot)`` pairs.
+
+        Unknown codes are created as provisional with the first non-empty
+        snapshot as short name; known codes without a short name or source
+        get them filled in.
+        """
+        snapshots: dict[str, str | None] = {}
+        for code, snapshot in codes:
+            code = (code or "").strip().upper()
+            if code and not snapshots.get(code):
+                snapshots[code] = (snapshot or "").strip() or None
+        if not snapshots:
+            return {}
+
+        dictionary = FailCodeDictionary.instance()
+        dictionary.ensure_fresh()
+        entries = dictionary.cached(snapshots)
+        missing = [code for code in snapshots if code not in entries]
+        if missing:
+            entries.update(dictionary.lookup(missing))
+            created = [code for code in missing if code not in entries]
+            if created:
+                _insert_provisional(
+                    [
+                        {
+                            "code": code,
+                            "short_name": snapshots[code],
+                            "is_provisional": True,
+                            "source": source,
+                        }
+                        for code in created
+                    ]
+                )
+                entries.update(dictionary.lookup(created))
+
+        dictionary.fill(entries, snapshots, source)
+        return {code: entry[0] for code, entry in entries.items()}
+
+    def ensure_fresh(self) -> None:
+        version = version_token(FAIL_CODES_VERSION)
+        with self._lock:
+            if version != self.version:
+                self._entries.clear()
+                self.version = version
+
+    def cached(self, codes: Iterable[str]) -> dict[str, CacheEntry]:
+        found = {}
+        with self._lock:
+            for code in codes:
+                entry = self._entries.get(code)
+                if entry is not None:
+                    self._entries.move_to_end(code)
+                    found[code] = entry
+        return found
+
+    def defer(self, entries: dict[str, CacheEntry]) -> None:
+        """Cache ``entries`` when the current transaction commits."""
+        pending = db.session.info.setdefault(_PENDING_KEY, (self.version, {}))[1]
+        pending.update(entries)
+
+    def remember(
+        self, entries: dict[str, CacheEntry], version: str | None = None
+    ) -> None:
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            for code, entry in entries.items():
+                self._entries[code] = entry
+                self._entries.move_to_end(code)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def lookup(self, codes: list[str]) -> dict[str, CacheEntry]:
+        found: dict[str, CacheEntry] = {}
+        for start in range(0, len(codes), LOOKUP_CHUNK):
+            rows = db.session.execute(
+                select(
+                    FailCode.code, FailCode.id, FailCode.short_name, FailCode.source
+                ).where(FailCode.code.in_(codes[start : start + LOOKUP_CHUNK]))
+            ).all()
+            for code, fail_code_id, short_name, source in rows:
+                found[code] = (fail_code_id, bool(short_name), bool(source))
+        self.defer(found)
+        return found
+
+    def fill(
+        self,
+        entries: dict[str, CacheEntry],
+        snapshots: dict[str, str | None],
+        source: str,
+    ) -> None:
+        table = FailCode.__table__
+        names = [
+            {"fail_code_id": entry[0], "new_short_name": snapshots[code]}
+            for code, entry in entries.items()
+            if not entry[1] and snapshots[code]
+        ]
+        sources = [entry[0] for entry in entries.values() if not entry[2]]
+        if names:
+            db.session.execute(
+                update(table)
+                .where(
+                    and_(
+                        table.c.id == bindparam("fail_code_id"),
+                        or_(table.c.short_name.is_(None), table.c.short_name == ""),
+                    )
+                )
+                .values(short_name=bindparam("new_short_name")),
+                names,
+            )
+        if sources:
+            db.session.execute(
+                update(table)
+                .where(
+                    table.c.id.in_(sources),
+                    or_(table.c.source.is_(None), table.c.source == ""),
+                )
+                .values(source=source)
+            )
+        if names or sources:
+            self.defer(
+                {
+                    code: (
+                        entry[0],
+                        entry[1] or bool(snapshots[code]),
+                        True,
+                    )
+                    for code, entry in entries.items()
+                }
+            )
+
+
+def _insert_provisional(rows: list[dict]) -> None:
+    """Insert ``rows``, skipping codes another writer created meanwhile."""
+    table = FailCode.__table__
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "sqlite":
+        statement = sqlite.insert(table).on_conflict_do_nothing(index_elements=["code"])
+    elif dialect == "postgresql":
+        statement = postgresql.insert(table).on_conflict_do_nothing(
+            index_elements=["code"]
+        )
+    elif dialect in ("mysql", "mariadb"):
+        statement = mysql.insert(table).prefix_with("IGNORE")
+    else:
+        statement = insert(table)
+    db.session.execute(statement, rows)
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_fail_code_entries(session: Session) -> None:
+    if _PENDING_KEY not in session.info:
+        return
+    version, entries = session.info.pop(_PENDING_KEY)
+    if not has_app_context():
+        return
+    dictionary = current_app.extensions.get(FailCodeDictionary.EXTENSION_KEY)
+    if dictionary is not None and entries:
+        dictionary.remember(entries, version)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_fail_code_entries(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,233 @@
+"""Index advisor for Solution Evaluation System
+
+Runs the database's EXPLAIN on the statements behind the hottest API paths
+and reports which of them fall back to a full table scan on the current
+dialect (SQLite, MySQL or PostgreSQL).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app import db
+from app.models.evaluation import (
+    Evaluation,
+    EvaluationProcess,
+    EvaluationProcessLot,
+    EvaluationProcessStep,
+    EvaluationResult,
+    EvaluationStepFailure,
+)
+from app.models.operation_log import OperationLog
+from app.utils.timezone import utcnow
+
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN",
+    "mysql": "EXPLAIN",
+    "mariadb": "EXPLAIN",
+    "postgresql": "EXPLAIN",
+}
+
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)")
+_POSTGRES_SEQ_SCAN = re.compile(r"Seq Scan on (\w+)")
+
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN <statement>`` with the statement's own bind parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement, prefix: str):
+        self.statement = statement
+        self.prefix = prefix
+
+
+@compiles(Explain)
+def _compile_explain(element, compiler, **kw):
+    return f"{element.prefix} {compiler.process(element.statement, **kw)}"
+
+
+@dataclass
+class QueryPlan:
+    name: str
+    description: str
+    plan: list[str] = field(default_factory=list)
+    full_scans: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.full_scans
+
+
+class IndexAdvisor:
+    """Service class for EXPLAIN-based index checks
+
+    Handles:
+    - Building representative statements for hot API queries
+    - Running EXPLAIN for the current dialect
+    - Flagging full table scans in the resulting plans
+    """
+
+    @staticmethod
+    def hot_queries() -> list[tuple[str, str, object]]:
+        """Return ``(name, description, statement)`` for each hot path."""
+        # app.api imports app.services, so the status list is imported here.
+        from app.api.evaluation import ACTIVE_EVALUATION_STATUSES
+
+        now = utcnow()
+        evaluation_id = 1
+        return [
+            (
+                "evaluation_logs",
+                "GET /<id>/logs: logs of one evaluation target, newest first",
+                select(OperationLog)
+                .where(
+                    OperationLog.target_type == "evaluation",
+                    OperationLog.target_id == evaluation_id,
+                )
+                .order_by(OperationLog.created_at.desc()),
+            ),
+            (
+                "evaluation_process_logs",
+                "GET /<id>/logs: logs of the evaluation's legacy processes",
+                select(OperationLog).where(
+                    OperationLog.target_type == "evaluation_process",
+                    OperationLog.target_id.in_(
+                        select(EvaluationProcess.id).where(
+                            EvaluationProcess.evaluation_id == evaluation_id
+                        )
+                    ),
+                ),
+            ),
+            (
+                "list_default_order",
+                "GET /: default order (created_at DESC, id DESC) first page",
+                select(Evaluation.id)
+                .order_by(Evaluation.created_at.desc(), Evaluation.id.desc())
+                .limit(20),
+            ),
+            (
+                "list_keyset_page",
+                "GET /?pagination=cursor: seek after the previous page",
+                select(Evaluation.id)
+                .where(
+                    or_(
+                        Evaluation.created_at < now,
+                        and_(Evaluation.created_at == now, Evaluation.id < 1000),
+                    )
+                )
+                .order_by(Evaluation.created_at.desc(), Evaluation.id.desc())
+                .limit(20),
+            ),
+            (
+                "operational_view_no_update_48h",
+                "operational_view=no_update_48h: active and not updated for 48h",
+                select(Evaluation.id).where(
+                    Evaluation.status.in_(ACTIVE_EVALUATION_STATUSES),
+                    Evaluation.updated_at <= now - timedelta(hours=48),
+                ),
+            ),
+            (
+                "operational_view_open_over_10d",
+                "operational_view=open_over_10d: active and started 10+ days ago",
+                select(Evaluation.id).where(
+                    Evaluation.status.in_(ACTIVE_EVALUATION_STATUSES),
+                    Evaluation.start_date <= (now - timedelta(days=10)).date(),
+                ),
+            ),
+            (
+                "nested_steps",
+                "GET /<id>/processes/nested: steps of one evaluation",
+                select(EvaluationProcessStep).where(
+                    EvaluationProcessStep.evaluation_id == evaluation_id
+                ),
+            ),
+            (
+                "step_failures",
+                "Nested payload: failures of the loaded steps",
+                select(EvaluationStepFailure).where(
+                    EvaluationStepFailure.step_id.in_([1, 2, 3])
+                ),
+            ),
+            (
+                "failures_by_fail_code",
+                "Fail-code usage lookups",
+                select(EvaluationStepFailure.id).where(
+                    EvaluationStepFailure.fail_code_id == 1
+                ),
+            ),
+            (
+                "lots_by_lot_number",
+                "Lot number lookups across evaluations",
+                select(EvaluationProcessLot.evaluation_id).where(
+                    EvaluationProcessLot.lot_number == "LOT-0001"
+                ),
+            ),
+            (
+                "results_by_evaluation",
+                "Detail and export: legacy results per evaluation",
+                select(EvaluationResult).where(
+                    EvaluationResult.evaluation_id.in_([evaluation_id])
+                ),
+            ),
+        ]
+
+    @staticmethod
+    def explain(statement) -> list[str]:
+        """Run EXPLAIN for ``statement`` and return one string per plan row."""
+        dialect = db.engine.dialect.name
+        prefix = EXPLAIN_PREFIXES.get(dialect)
+        if prefix is None:
+            raise ValueError(f"EXPLAIN is not supported for dialect {dialect}")
+        result = db.session.execute(Explain(statement, prefix))
+        keys = list(result.keys())
+        return IndexAdvisor.format_plan(dialect, keys, [tuple(r) for r in result])
+
+    @staticmethod
+    def format_plan(dialect: str, keys: list[str], rows: list[tuple]) -> list[str]:
+        if dialect == "sqlite":
+            return [str(row[keys.index("detail")]) for row in rows]
+        if dialect == "postgresql":
+            return [str(row[0]) for row in rows]
+        return [
+            " ".join(f"{key}={value}" for key, value in zip(keys, row, strict=True))
+            for row in rows
+        ]
+
+    @staticmethod
+    def full_scans(dialect: str, plan: list[str]) -> list[str]:
+        """Return the tables the plan reads with a full table scan."""
+        tables = []
+        for line in plan:
+            if dialect == "sqlite":
+                match = _SQLITE_SCAN.match(line)
+                if match and "USING" not in line:
+                    tables.append(match.group(1))
+            elif dialect == "postgresql":
+                tables.extend(_POSTGRES_SEQ_SCAN.findall(line))
+            elif " type=ALL" in f" {line}":
+                match = re.search(r"\btable=(\S+)", line)
+                tables.append(match.group(1) if match else "?")
+        return tables
+
+    @staticmethod
+    def report() -> list[QueryPlan]:
+        dialect = db.engine.dialect.name
+        plans = []
+        for name, description, statement in IndexAdvisor.hot_queries():
+            plan = IndexAdvisor.explain(statement)
+            plans.append(
+                QueryPlan(
+                    name=name,
+                    description=description,
+                    plan=plan,
+                    full_scans=IndexAdvisor.full_scans(dialect, plan),
+                )
+            )
+        return plans
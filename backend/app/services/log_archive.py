@@ -0,0 +1,314 @@
+"""Monthly archive segments for old operation logs
+
+``operation_logs`` only grows. The archiver moves rows older than
+``LOG_RETENTION_DAYS`` out of the database into append-only NDJSON segment
+files under ``LOG_ARCHIVE_FOLDER``, one per calendar month (UTC):
+
+- ``operation_logs-YYYY-MM.ndjson.gz``: gzip members, one per archived chunk;
+  gzip readers treat the concatenation as one stream
+- ``operation_logs-YYYY-MM.index.json``: byte range and time span of every
+  member plus the members holding each ``target_type:target_id``
+- ``manifest.json``: the archived segments and ``archived_through``, the
+  newest ``created_at`` moved so far
+
+Each chunk is written and fsynced before its rows are deleted, in its own
+short transaction. A crash in between can archive a row twice, so readers
+drop duplicate ids. Payload store references in ``new_data`` are inlined on
+the way out, so segments stay readable after the store drops the payload.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import tempfile
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from flask import current_app
+from sqlalchemy import delete, select
+
+from app import db
+from app.models.operation_log import OperationLog, OperationType
+from app.models.payload_blob import PAYLOAD_REF_KEY, is_payload_ref, load_payloads
+from app.utils.timezone import utcnow
+
+SEGMENT_PREFIX = "operation_logs-"
+MANIFEST_NAME = "manifest.json"
+
+Target = tuple[str, int | None]
+
+# Parsed manifests by path, keyed on the file's stat so every GET /logs does
+# not re-read it; the manifest is replaced atomically, which changes the stat.
+_manifests: dict[str, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
+
+def _naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
+
+def _target_key(target_type: str, target_id: int | None) -> str:
+    return f"{target_type}:{'' if target_id is None else target_id}"
+
+
+def _inline_payloads(rows: list[dict[str, Any]]) -> None:
+    refs = [row["new_data"] for row in rows if is_payload_ref(row["new_data"])]
+    if not refs:
+        return
+    stored = load_payloads(ref[PAYLOAD_REF_KEY] for ref in refs)
+    for row in rows:
+        if is_payload_ref(row["new_data"]):
+            digest = row["new_data"][PAYLOAD_REF_KEY]
+            row["new_data"] = stored.get(digest, row["new_data"])
+
+
+def _write_json_atomic(path: str, payload: dict[str, Any]) -> None:
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class LogArchive:
+    """Service class for operation log archive segments
+
+    Handles:
+    - Moving expired rows into monthly segments in chunked transactions
+    - Per-segment target indexes for selective reads
+    - Reading archived timelines newest first with keyset positions
+    """
+
+    @staticmethod
+    def root(base_folder: str | None = None) -> str:
+        return base_folder or current_app.config.get(
+            "LOG_ARCHIVE_FOLDER", os.path.join("archive", "operation_logs")
+        )
+
+    @staticmethod
+    def segment_path(month: str, base_folder: str | None = None) -> str:
+        return os.path.join(
+            LogArchive.root(base_folder), f"{SEGMENT_PREFIX}{month}.ndjson.gz"
+        )
+
+    @staticmethod
+    def index_path(month: str, base_folder: str | None = None) -> str:
+        return os.path.join(
+            LogArchive.root(base_folder), f"{SEGMENT_PREFIX}{month}.index.json"
+        )
+
+    @staticmethod
+    def manifest(base_folder: str | None = None) -> dict[str, Any]:
+        path = os.path.join(LogArchive.root(base_folder), MANIFEST_NAME)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            _manifests.pop(path, None)
+            return {"segments": [], "archived_through": None}
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = _manifests.get(path)
+        if cached is None or cached[0] != signature:
+            with open(path, encoding="utf-8") as handle:
+                cached = (signature, json.load(handle))
+            _manifests[path] = cached
+        # Callers update the manifest they get back before writing it.
+        return dict(cached[1])
+
+    @staticmethod
+    def archived_through(base_folder: str | None = None) -> datetime | None:
+        """Newest ``created_at`` in the archive (naive UTC), if any."""
+        value = LogArchive.manifest(base_folder).get("archived_through")
+        return datetime.fromisoformat(value) if value else None
+
+    @staticmethod
+    def archive(
+        retention_days: int | None = None,
+        chunk_size: int | None = None,
+        base_folder: str | None = None,
+    ) -> int:
+        """Move rows older than the retention window; returns rows moved."""
+        config = current_app.config
+        if retention_days is None:
+            retention_days = int(config.get("LOG_RETENTION_DAYS") or 180)
+        chunk_size = max(
+            1, int(chunk_size or config.get("LOG_ARCHIVE_CHUNK_SIZE") or 1000)
+        )
+        cutoff = utcnow() - timedelta(days=retention_days)
+        root = LogArchive.root(base_folder)
+        os.makedirs(root, exist_ok=True)
+
+        table = OperationLog.__table__
+        moved = 0
+        while True:
+            rows = [
+                dict(row._mapping)
+                for row in db.session.execute(
+                    select(table)
+                    .where(table.c.created_at < cutoff)
+                    .order_by(table.c.id)
+                    .limit(chunk_size)
+                )
+            ]
+            if not rows:
+                db.session.commit()
+                break
+            _inline_payloads(rows)
+            LogArchive._append(rows, base_folder)
+            db.session.execute(
+                delete(table).where(table.c.id.in_([row["id"] for row in rows]))
+            )
+            db.session.commit()
+            moved += len(rows)
+        return moved
+
+    @staticmethod
+    def _append(rows: list[dict[str, Any]], base_folder: str | None = None) -> None:
+        by_month: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            row["created_at"] = _naive_utc(row["created_at"])
+            by_month.setdefault(row["created_at"].strftime("%Y-%m"), []).append(row)
+
+        manifest = LogArchive.manifest(base_folder)
+        for month, month_rows in sorted(by_month.items()):
+            LogArchive._append_member(month, month_rows, base_folder)
+            if month not in manifest["segments"]:
+                manifest["segments"] = sorted([*manifest["segments"], month])
+        newest = max(row["created_at"] for row in rows)
+        previous = manifest.get("archived_through")
+        if previous is None or datetime.fromisoformat(previous) < newest:
+            manifest["archived_through"] = newest.isoformat()
+        _write_json_atomic(
+            os.path.join(LogArchive.root(base_folder), MANIFEST_NAME), manifest
+        )
+
+    @staticmethod
+    def _append_member(
+        month: str, rows: list[dict[str, Any]], base_folder: str | None = None
+    ) -> None:
+        lines = "".join(
+            json.dumps(
+                {**row, "created_at": row["created_at"].isoformat()},
+                default=str,
+                separators=(",", ":"),
+            )
+            + "\n"
+            for row in rows
+        )
+        data = gzip.compress(lines.encode("utf-8"))
+        with open(LogArchive.segment_path(month, base_folder), "ab") as handle:
+            offset = handle.tell()
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+        index = LogArchive._load_index(month, base_folder)
+        member = len(index["members"])
+        oldest = min(row["created_at"] for row in rows).isoformat()
+        newest = max(row["created_at"] for row in rows).isoformat()
+        index["members"].append([offset, len(data), oldest, newest])
+        index["rows"] += len(rows)
+        for key in {_target_key(row["target_type"], row["target_id"]) for row in rows}:
+            index["targets"].setdefault(key, []).append(member)
+        _write_json_atomic(LogArchive.index_path(month, base_folder), index)
+
+    @staticmethod
+    def _load_index(month: str, base_folder: str | None = None) -> dict[str, Any]:
+        path = LogArchive.index_path(month, base_folder)
+        if not os.path.isfile(path):
+            return {"month": month, "rows": 0, "members": [], "targets": {}}
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    @staticmethod
+    def query(
+        targets: Iterable[Target],
+        limit: int,
+        before: tuple[datetime, int] | None = None,
+        types: list[str] | None = None,
+        exclude_views: bool = False,
+        base_folder: str | None = None,
+    ) -> list[OperationLog]:
+        """Return up to ``limit`` archived logs of ``targets``, newest first.
+
+        ``before`` is a ``(created_at, id)`` keyset position; only older
+        entries are returned. Results are transient ``OperationLog`` objects.
+        """
+        keys = {
+            _target_key(target_type, target_id) for target_type, target_id in targets
+        }
+        if before is not None:
+            before = (_naive_utc(before[0]), before[1])
+        found: dict[int, dict[str, Any]] = {}
+        for month in sorted(LogArchive.manifest(base_folder)["segments"], reverse=True):
+            if len(found) >= limit:
+                break
+            index = LogArchive._load_index(month, base_folder)
+            members = sorted(
+                {member for key in keys for member in index["targets"].get(key, [])}
+            )
+            if before is not None:
+                members = [
+                    member
+                    for member in members
+                    if datetime.fromisoformat(index["members"][member][2]) <= before[0]
+                ]
+            if not members:
+                continue
+            with open(LogArchive.segment_path(month, base_folder), "rb") as handle:
+                for member in members:
+                    offset, length = index["members"][member][:2]
+                    handle.seek(offset)
+                    for line in gzip.decompress(handle.read(length)).splitlines():
+                        row = json.loads(line)
+                        if (
+                            _target_key(row["target_type"], row["target_id"])
+                            not in keys
+                        ):
+                            continue
+                        if types and row["operation_type"] not in types:
+                            continue
+                        if (
+                            exclude_views
+                            and row["operation_type"] == OperationType.VIEW.value
+                        ):
+                            continue
+                        row["created_at"] = datetime.fromisoformat(row["created_at"])
+                        if (
+                            before is not None
+                            and (row["created_at"], row["id"]) >= before
+                        ):
+                            continue
+                        found[row["id"]] = row
+        ordered = sorted(
+            found.values(), key=lambda row: (row["created_at"], row["id"]), reverse=True
+        )
+        return [_archived_log(row) for row in ordered[:limit]]
+
+    @staticmethod
+    def merge_newest(
+        live: Iterable[OperationLog], archived: Iterable[OperationLog], limit: int
+    ) -> list[OperationLog]:
+        """Merge database and archived logs newest first, dropping duplicates."""
+        merged: dict[int, OperationLog] = {log.id: log for log in archived}
+        merged.update((log.id, log) for log in live)
+        return sorted(
+            merged.values(),
+            key=lambda log: (_naive_utc(log.created_at), log.id),
+            reverse=True,
+        )[:limit]
+
+
+def _archived_log(row: dict[str, Any]) -> OperationLog:
+    log = OperationLog(row.pop("operation_type"), row.pop("target_type"))
+    for key, value in row.items():
+        setattr(log, key, value)
+    return log
@@ -0,0 +1,365 @@
+"""Background writer for operation logs
+
+Read endpoints record a VIEW log on every request. Writing it inline puts
+an INSERT and a commit on the read path, so GET latency follows database
+write latency. The writer instead keeps log rows in a bounded in-process
+queue and a daemon thread flushes them as multi-row INSERTs on its own
+connection.
+
+Modes (``OPERATION_LOG_MODE``):
+- ``async`` (default): queue and flush every ``OPERATION_LOG_FLUSH_INTERVAL``
+  seconds or ``OPERATION_LOG_BATCH_SIZE`` rows, whichever comes first
+- ``sync``: add the log to the request session and commit (tests)
+
+VIEW events also bump the hourly ``view_counters`` row of their target;
+the ``view_log_mode`` system setting decides whether their full log row is
+kept, sampled or dropped (see ``app.models.view_counter``).
+
+Audit-critical writes pass ``sync=True`` so their log commits with the
+change it describes. When the queue is full a request waits at most
+``OPERATION_LOG_ENQUEUE_TIMEOUT`` seconds, then the row is dropped and
+counted rather than slowing the request any further.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import queue
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+from flask import Flask, current_app
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from app import db
+from app.models.operation_log import OperationLog, OperationType
+from app.models.system_config import SystemConfig
+from app.models.view_counter import VIEW_LOG_MODES, ViewKey, record_views, view_key
+from app.services.request_metrics import METRIC_COLUMNS, RequestMetrics
+from app.utils.timezone import utcnow
+
+LOG_MODES = ("async", "sync")
+
+
+class _FlushRequest:
+    """Queue marker asking the worker to write what it holds and report back."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class OperationLogWriter:
+    """Service class for batched operation log writes
+
+    Handles:
+    - Bounded queueing with backpressure and drop counting
+    - Periodic multi-row INSERTs from a per-process daemon thread
+    - Synchronous writes for tests and audit-critical operations
+    - Folding VIEW events into hourly view counters
+    - Draining the queue on interpreter shutdown
+    """
+
+    EXTENSION_KEY = "operation_log_writer"
+
+    def __init__(
+        self,
+        app: Flask,
+        mode: str = "async",
+        flush_interval: float = 1.0,
+        batch_size: int = 200,
+        queue_size: int = 10000,
+        enqueue_timeout: float = 0.05,
+        policy_refresh_seconds: float = 30.0,
+    ):
+        if mode not in LOG_MODES:
+            raise ValueError(
+                f"Unsupported OPERATION_LOG_MODE: {mode}. Use one of: {', '.join(LOG_MODES)}"
+            )
+        self.app = app
+        self.mode = mode
+        self.flush_interval = flush_interval
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(1, queue_size)
+        self.enqueue_timeout = enqueue_timeout
+        self.policy_refresh_seconds = policy_refresh_seconds
+        self.counters = dict.fromkeys(
+            ("enqueued", "written", "dropped", "failed", "batches", "views"), 0
+        )
+        self._policy: tuple[str, float] | None = None
+        self._policy_checked_at = 0.0
+        self._queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def instance() -> OperationLogWriter:
+        extensions = current_app.extensions
+        if OperationLogWriter.EXTENSION_KEY not in extensions:
+            config = current_app.config
+            writer = OperationLogWriter(
+                current_app._get_current_object(),
+                mode=config.get("OPERATION_LOG_MODE") or "async",
+                flush_interval=float(config.get("OPERATION_LOG_FLUSH_INTERVAL") or 1.0),
+                batch_size=int(config.get("OPERATION_LOG_BATCH_SIZE") or 200),
+                queue_size=int(config.get("OPERATION_LOG_QUEUE_SIZE") or 10000),
+                enqueue_timeout=float(
+                    config.get("OPERATION_LOG_ENQUEUE_TIMEOUT") or 0.0
+                ),
+                policy_refresh_seconds=float(
+                    config.get("VIEW_LOG_POLICY_REFRESH_SECONDS") or 0.0
+                ),
+            )
+            extensions[OperationLogWriter.EXTENSION_KEY] = writer
+            atexit.register(writer.flush)
+        return extensions[OperationLogWriter.EXTENSION_KEY]
+
+    @staticmethod
+    def record(log: OperationLog, sync: bool = False) -> None:
+        """Persist ``log``, in the background unless ``sync`` is requested.
+
+        The synchronous path adds the log to the request session and commits,
+        so it is written together with any change the request made. VIEW
+        logs count towards their view counter and are kept as rows only as
+        ``view_log_mode`` allows.
+        """
+        writer = OperationLogWriter.instance()
+        inline = sync or writer.mode == "sync"
+        keep = True
+        if log.operation_type == OperationType.VIEW.value:
+            key = view_key(log.target_type, log.target_id, log.ip_address)
+            keep = writer.keep_view_row()
+            if inline:
+                record_views(db.session.connection(), {key: 1})
+                writer._count("views")
+            else:
+                writer.enqueue_view(key)
+        metrics = RequestMetrics.current()
+        if inline:
+            if keep:
+                db.session.add(log)
+            db.session.commit()
+            if keep and metrics is not None:
+                metrics.logged_ids.append(log.id)
+        elif keep:
+            if metrics is not None:
+                # Queued once the response is sent, with its timings filled in
+                metrics.pending_rows.append(_log_row(log))
+            else:
+                writer.enqueue(_log_row(log))
+
+    @staticmethod
+    def attach_metrics(metrics: RequestMetrics, values: dict[str, Any]) -> None:
+        """Store a finished request's timings on the logs it recorded."""
+        writer = OperationLogWriter.instance()
+        for row in metrics.pending_rows:
+            row.update(values)
+            writer.enqueue(row)
+        updates = [{"log_id": log_id, **values} for log_id in metrics.logged_ids]
+        if not updates:
+            return
+        if writer.mode == "sync":
+            # Same session and connection the inline log rows went through.
+            db.session.execute(_metrics_update(), updates)
+            db.session.commit()
+        else:
+            for update_row in updates:
+                writer._put(("metrics", update_row))
+
+    @staticmethod
+    def stats() -> dict[str, Any]:
+        writer = OperationLogWriter.instance()
+        with writer._lock:
+            counters = dict(writer.counters)
+        return {
+            "mode": writer.mode,
+            "queued": writer._queue.qsize(),
+            "capacity": writer.queue_size,
+            **counters,
+        }
+
+    def view_log_policy(self) -> tuple[str, float]:
+        """Return ``(view_log_mode, view_log_sample_rate)``.
+
+        Read from ``SystemConfig`` at most every ``policy_refresh_seconds``.
+        """
+        now = time.monotonic()
+        if (
+            self._policy is not None
+            and now - self._policy_checked_at < self.policy_refresh_seconds
+        ):
+            return self._policy
+        mode = SystemConfig.get_config("view_log_mode", "aggregate")
+        if mode not in VIEW_LOG_MODES:
+            mode = "aggregate"
+        try:
+            rate = float(SystemConfig.get_config("view_log_sample_rate", 0.1))
+        except (TypeError, ValueError):
+            rate = 0.1
+        self._policy = (mode, min(max(rate, 0.0), 1.0))
+        self._policy_checked_at = now
+        return self._policy
+
+    def keep_view_row(self) -> bool:
+        mode, rate = self.view_log_policy()
+        if mode == "full":
+            return True
+        if mode == "sample":
+            return random.random() < rate
+        return False
+
+    def enqueue(self, row: dict[str, Any]) -> bool:
+        """Queue one row; returns False when it was dropped."""
+        return self._put(("log", row))
+
+    def enqueue_view(self, key: ViewKey) -> bool:
+        """Queue one view counter increment; returns False when dropped."""
+        return self._put(("view", key))
+
+    def _put(self, item: tuple[str, Any]) -> bool:
+        self._ensure_worker()
+        try:
+            if self.enqueue_timeout > 0:
+                self._queue.put(item, timeout=self.enqueue_timeout)
+            else:
+                self._queue.put_nowait(item)
+        except queue.Full:
+            self._count("dropped")
+            return False
+        self._count("enqueued")
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Write everything queued so far; returns False on timeout."""
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+        marker = _FlushRequest()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.done.wait(timeout)
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[counter] += amount
+
+    def _ensure_worker(self) -> None:
+        # A forked worker inherits the queue but not the thread; start afresh.
+        if self._pid == os.getpid() and self._thread is not None:
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._thread is not None:
+                return
+            if self._pid is not None:
+                self._queue = queue.Queue(maxsize=self.queue_size)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(
+                target=self._run, name="operation-log-writer", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            rows, hits, updates, markers = self._next_batch()
+            if rows:
+                self._write(rows)
+            if hits:
+                self._write_views(hits)
+            if updates:
+                self._write_metrics(updates)
+            for marker in markers:
+                marker.done.set()
+
+    def _next_batch(
+        self,
+    ) -> tuple[list[dict], Counter, list[dict], list[_FlushRequest]]:
+        rows: list[dict] = []
+        hits: Counter = Counter()
+        updates: list[dict] = []
+        markers: list[_FlushRequest] = []
+        taken = 0
+        item = self._queue.get()
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            if isinstance(item, _FlushRequest):
+                markers.append(item)
+                return rows, hits, updates, markers
+            kind, payload = item
+            if kind == "view":
+                hits[payload] += 1
+            elif kind == "metrics":
+                updates.append(payload)
+            else:
+                rows.append(payload)
+            taken += 1
+            if taken >= self.batch_size:
+                return rows, hits, updates, markers
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return rows, hits, updates, markers
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                return rows, hits, updates, markers
+
+    def _write(self, rows: list[dict]) -> None:
+        try:
+            with self.app.app_context(), db.engine.begin() as connection:
+                connection.execute(insert(OperationLog.__table__), rows)
+        except SQLAlchemyError as e:
+            self._count("failed", len(rows))
+            self.app.logger.error(f"Error writing {len(rows)} operation logs: {e!s}")
+            return
+        self._count("written", len(rows))
+        self._count("batches")
+
+    def _write_views(self, hits: Counter) -> None:
+        views = sum(hits.values())
+        try:
+            with self.app.app_context(), db.engine.begin() as connection:
+                record_views(connection, hits)
+        except SQLAlchemyError as e:
+            self._count("failed", views)
+            self.app.logger.error(f"Error writing {views} view counts: {e!s}")
+            return
+        self._count("views", views)
+
+    def _write_metrics(self, updates: list[dict]) -> None:
+        try:
+            with self.app.app_context(), db.engine.begin() as connection:
+                connection.execute(_metrics_update(), updates)
+        except SQLAlchemyError as e:
+            self._count("failed", len(updates))
+            self.app.logger.error(
+                f"Error writing metrics for {len(updates)} operation logs: {e!s}"
+            )
+
+
+def _metrics_update():
+    table = OperationLog.__table__
+    return (
+        update(table)
+        .where(table.c.id == bindparam("log_id"))
+        .values({column: bindparam(column) for column in METRIC_COLUMNS})
+    )
+
+
+def _log_row(log: OperationLog) -> dict[str, Any]:
+    row = {
+        column.key: getattr(log, column.key)
+        for column in OperationLog.__table__.columns
+        if column.key != "id"
+    }
+    # Column defaults only fire for omitted keys; every row carries all keys
+    # so the batch stays a single executemany.
+    if row["created_at"] is None:
+        row["created_at"] = utcnow()
+    if row["success"] is None:
+        row["success"] = True
+    return row
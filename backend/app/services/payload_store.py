@@ -0,0 +1,144 @@
+"""Retention for nested process raw records and their payload blobs
+
+Every changed nested save appends an ``EvaluationProcessRaw`` row, and only
+the latest one is read back. ``PayloadStore.compact`` keeps the newest
+``NESTED_RAW_KEEP`` raw records per evaluation, then drops payload blobs
+that neither a remaining raw record nor a live operation log references and
+that no save has used within the grace window.
+
+Archived operation logs carry their payloads inline (see ``LogArchive``),
+so they do not hold blobs alive.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from flask import current_app
+from sqlalchemy import delete, exists, func, select
+
+from app import db
+from app.models.evaluation import EvaluationProcessRaw
+from app.models.operation_log import OperationLog
+from app.models.payload_blob import PAYLOAD_REF_KEY, PayloadBlob, is_payload_ref
+from app.utils.timezone import utcnow
+
+# Operation log targets whose ``new_data`` may reference the payload store.
+PAYLOAD_LOG_TARGETS = ("evaluation_nested_process",)
+
+
+class PayloadStore:
+    """Service class for payload store maintenance
+
+    Handles:
+    - Per-evaluation retention of raw nested process records
+    - Garbage collection of unreferenced payload blobs
+    """
+
+    @staticmethod
+    def compact(
+        keep: int | None = None, chunk_size: int = 500, grace_seconds: int = 3600
+    ) -> dict[str, int]:
+        """Apply the retention policy; returns rows removed and bytes freed."""
+        if keep is None:
+            keep = int(current_app.config.get("NESTED_RAW_KEEP") or 20)
+        keep = max(1, keep)
+        raw = EvaluationProcessRaw
+
+        raw_deleted = 0
+        crowded = db.session.execute(
+            select(raw.evaluation_id)
+            .group_by(raw.evaluation_id)
+            .having(func.count(raw.id) > keep)
+        ).scalars()
+        for evaluation_id in list(crowded):
+            stale = list(
+                db.session.execute(
+                    select(raw.id)
+                    .where(raw.evaluation_id == evaluation_id)
+                    .order_by(raw.id.desc())
+                    .offset(keep)
+                ).scalars()
+            )
+            for start in range(0, len(stale), chunk_size):
+                db.session.execute(
+                    delete(raw).where(raw.id.in_(stale[start : start + chunk_size]))
+                )
+                db.session.commit()
+            raw_deleted += len(stale)
+
+        blobs_deleted, bytes_freed = PayloadStore.collect_garbage(
+            chunk_size, grace_seconds
+        )
+        return {
+            "raw_deleted": raw_deleted,
+            "blobs_deleted": blobs_deleted,
+            "bytes_freed": bytes_freed,
+        }
+
+    @staticmethod
+    def referenced_by_logs() -> set[str]:
+        digests = set()
+        for new_data in db.session.execute(
+            select(OperationLog.new_data).where(
+                OperationLog.target_type.in_(PAYLOAD_LOG_TARGETS)
+            )
+        ).scalars():
+            if is_payload_ref(new_data):
+                digests.add(new_data[PAYLOAD_REF_KEY])
+        return digests
+
+    @staticmethod
+    def collect_garbage(
+        chunk_size: int = 500, grace_seconds: int = 3600
+    ) -> tuple[int, int]:
+        """Delete unreferenced blobs; returns ``(blobs, compressed bytes)``.
+
+        A save upserts its blob before the raw record referencing it commits,
+        so blobs used within ``grace_seconds`` are kept.
+        """
+        keep = PayloadStore.referenced_by_logs()
+        collectable = (
+            ~exists().where(EvaluationProcessRaw.payload_hash == PayloadBlob.digest),
+            PayloadBlob.last_used_at < utcnow() - timedelta(seconds=grace_seconds),
+        )
+        candidates = [
+            (digest, stored)
+            for digest, stored in db.session.execute(
+                select(PayloadBlob.digest, func.length(PayloadBlob.data)).where(
+                    *collectable
+                )
+            ).all()
+            if digest not in keep
+        ]
+        deleted = freed = 0
+        for start in range(0, len(candidates), chunk_size):
+            chunk = dict(candidates[start : start + chunk_size])
+            # Re-checked in the DELETE: a save that reused a blob meanwhile has
+            # bumped last_used_at (or holds its row lock until it commits).
+            db.session.execute(
+                delete(PayloadBlob).where(PayloadBlob.digest.in_(chunk), *collectable)
+            )
+            spared = set(
+                db.session.execute(
+                    select(PayloadBlob.digest).where(PayloadBlob.digest.in_(chunk))
+                ).scalars()
+            )
+            db.session.commit()
+            for digest, stored in chunk.items():
+                if digest not in spared:
+                    deleted += 1
+                    freed += stored or 0
+        return deleted, freed
+
+    @staticmethod
+    def stats() -> dict[str, Any]:
+        blobs, stored, size = db.session.execute(
+            select(
+                func.count(PayloadBlob.digest),
+                func.coalesce(func.sum(func.length(PayloadBlob.data)), 0),
+                func.coalesce(func.sum(PayloadBlob.size), 0),
+            )
+        ).one()
+        return {"blobs": blobs, "stored_bytes": stored, "payload_bytes": size}
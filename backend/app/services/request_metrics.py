@@ -0,0 +1,221 @@
+"""Per-request latency, SQL time and response size capture
+
+``RequestMetricsMiddleware`` wraps the WSGI app and times every request from
+the first byte of ``environ`` to the last byte of the response body, so
+streamed exports count in full. SQLAlchemy cursor events add the statement
+count and SQL time of whatever ran on the request's thread meanwhile.
+
+On completion the numbers go to:
+- the request's operation log row (``duration_ms``, ``db_time_ms``,
+  ``db_statements``, ``response_bytes``), via ``OperationLogWriter``
+- ``EndpointStats``, a rolling per-endpoint window of the latest samples
+
+Queries of the background log writer run on its own thread and are not
+attributed to any request.
+"""
+
+from __future__ import annotations
+
+import bisect
+import contextvars
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from flask import Flask, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+METRIC_COLUMNS = ("duration_ms", "db_time_ms", "db_statements", "response_bytes")
+
+_current: contextvars.ContextVar[RequestMetrics | None] = contextvars.ContextVar(
+    "request_metrics", default=None
+)
+_STATEMENT_START_KEY = "request_metrics_started"
+
+
+class RequestMetrics:
+    """Measurements of one in-flight request."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.endpoint: str | None = None
+        self.db_statements = 0
+        self.db_time = 0.0
+        self.response_bytes = 0
+        # Async log rows wait for the final numbers before they are queued;
+        # rows committed inline are updated by id afterwards.
+        self.pending_rows: list[dict[str, Any]] = []
+        self.logged_ids: list[int] = []
+
+    @staticmethod
+    def current() -> RequestMetrics | None:
+        return _current.get()
+
+    def values(self) -> dict[str, Any]:
+        return {
+            "duration_ms": round((time.perf_counter() - self.started) * 1000, 3),
+            "db_time_ms": round(self.db_time * 1000, 3),
+            "db_statements": self.db_statements,
+            "response_bytes": self.response_bytes,
+        }
+
+
+class EndpointStats:
+    """Rolling window of request samples per endpoint."""
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._samples: dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def add(self, endpoint: str, values: dict[str, Any]) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(
+                (
+                    values["duration_ms"],
+                    values["db_time_ms"],
+                    values["db_statements"],
+                    values["response_bytes"],
+                )
+            )
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Per-endpoint histogram and percentiles, slowest p95 first."""
+        with self._lock:
+            snapshot = {
+                endpoint: list(rows) for endpoint, rows in self._samples.items()
+            }
+        summaries = []
+        for endpoint, rows in snapshot.items():
+            durations = sorted(row[0] for row in rows)
+            histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+            for duration in durations:
+                histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, duration)] += 1
+            count = len(rows)
+            summaries.append(
+                {
+                    "endpoint": endpoint,
+                    "count": count,
+                    "p50_ms": _percentile(durations, 0.50),
+                    "p95_ms": _percentile(durations, 0.95),
+                    "p99_ms": _percentile(durations, 0.99),
+                    "max_ms": durations[-1],
+                    "avg_db_time_ms": round(sum(row[1] for row in rows) / count, 3),
+                    "avg_db_statements": round(sum(row[2] for row in rows) / count, 2),
+                    "avg_response_bytes": round(sum(row[3] for row in rows) / count),
+                    "histogram": {
+                        f"le_{bound}" if bound is not None else "inf": histogram[index]
+                        for index, bound in enumerate((*LATENCY_BUCKETS_MS, None))
+                    },
+                }
+            )
+        return sorted(summaries, key=lambda summary: summary["p95_ms"], reverse=True)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class _MeteredBody:
+    """Response iterable counting body bytes; the server's ``close()`` ends the
+    measurement, even when the body was never iterated."""
+
+    def __init__(self, body, metrics: RequestMetrics, finish):
+        self.body = body
+        self.metrics = metrics
+        self.finish = finish
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self.body:
+            self.metrics.response_bytes += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            if hasattr(self.body, "close"):
+                self.body.close()
+        finally:
+            _current.set(None)
+            self.finish(self.metrics)
+
+
+class RequestMetricsMiddleware:
+    """WSGI middleware measuring each request until its body is sent."""
+
+    def __init__(self, wsgi_app, app: Flask, stats: EndpointStats):
+        self.wsgi_app = wsgi_app
+        self.app = app
+        self.stats = stats
+
+    def __call__(self, environ, start_response):
+        metrics = RequestMetrics()
+        _current.set(metrics)
+        try:
+            body = self.wsgi_app(environ, start_response)
+        except BaseException:
+            _current.set(None)
+            raise
+        return _MeteredBody(body, metrics, self._finish)
+
+    def _finish(self, metrics: RequestMetrics) -> None:
+        values = metrics.values()
+        if metrics.endpoint is not None:
+            self.stats.add(metrics.endpoint, values)
+        if not metrics.pending_rows and not metrics.logged_ids:
+            return
+        from app.services.operation_log_writer import OperationLogWriter
+
+        try:
+            with self.app.app_context():
+                OperationLogWriter.attach_metrics(metrics, values)
+        except SQLAlchemyError as e:
+            self.app.logger.error(f"Error attaching request metrics: {e!s}")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None:
+        conn.info.setdefault(_STATEMENT_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    metrics = _current.get()
+    starts = conn.info.get(_STATEMENT_START_KEY)
+    if metrics is None or not starts:
+        return
+    metrics.db_time += time.perf_counter() - starts.pop()
+    metrics.db_statements += 1
+
+
+def _remember_endpoint() -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        rule = request.url_rule.rule if request.url_rule is not None else "<unmatched>"
+        metrics.endpoint = f"{request.method} {rule}"
+
+
+def init_request_metrics(app: Flask) -> EndpointStats:
+    """Install the middleware, SQL hooks and endpoint tagging on ``app``."""
+    stats = EndpointStats(int(app.config.get("REQUEST_METRICS_WINDOW") or 1000))
+    app.extensions["request_metrics"] = stats
+    app.wsgi_app = RequestMetricsMiddleware(app.wsgi_app, app, stats)
+    app.before_request(_remember_endpoint)
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    return stats
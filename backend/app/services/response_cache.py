@@ -0,0 +1,186 @@
+"""Response cache for read-heavy evaluation endpoints
+
+Entries are keyed by the endpoint, the global evaluations version token,
+the normalized query string and the response timezone. Because every write
+bumps the version, stale entries are never served and simply age out of
+the LRU; no TTL is involved.
+
+Backends:
+- ``memory`` (default): per-process LRU
+- ``sqlite``: LRU table in a local SQLite file shared by all workers
+- ``none``: caching disabled
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+from flask import current_app
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """Thread-safe in-process LRU."""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend:
+    """LRU stored in a SQLite file so several worker processes share it."""
+
+    def __init__(self, path: str, max_entries: int = 2048):
+        self.path = path
+        self.max_entries = max_entries
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS ix_response_cache_accessed_at "
+                "ON response_cache (accessed_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5, isolation_level=None)
+
+    def get(self, key: str) -> bytes | None:
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT value FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE response_cache SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            return row[0]
+
+    def set(self, key: str, value: bytes) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, accessed_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            connection.execute(
+                "DELETE FROM response_cache WHERE key IN ("
+                "SELECT key FROM response_cache ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM response_cache")
+
+
+class ResponseCache:
+    """Service class for the versioned response cache
+
+    Handles:
+    - Backend selection from ``RESPONSE_CACHE_*`` settings
+    - Key derivation from version token and request parameters
+    - JSON (de)serialization of cached payloads
+    """
+
+    EXTENSION_KEY = "response_cache"
+
+    @staticmethod
+    def create_backend(config) -> CacheBackend | None:
+        backend = (config.get("RESPONSE_CACHE_BACKEND") or "memory").lower()
+        max_entries = int(config.get("RESPONSE_CACHE_MAX_ENTRIES") or 512)
+        if backend == "none":
+            return None
+        if backend == "memory":
+            return MemoryCacheBackend(max_entries)
+        if backend == "sqlite":
+            path = config.get("RESPONSE_CACHE_PATH") or os.path.join(
+                config.get("UPLOAD_FOLDER", "uploads"), "response_cache.sqlite3"
+            )
+            return SQLiteCacheBackend(path, max_entries)
+        raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {backend}")
+
+    @staticmethod
+    def backend() -> CacheBackend | None:
+        extensions = current_app.extensions
+        if ResponseCache.EXTENSION_KEY not in extensions:
+            extensions[ResponseCache.EXTENSION_KEY] = ResponseCache.create_backend(
+                current_app.config
+            )
+        return extensions[ResponseCache.EXTENSION_KEY]
+
+    @staticmethod
+    def key(namespace: str, version: str, *parts: object) -> str:
+        encoded = json.dumps(
+            [namespace, version, *parts], default=str, separators=(",", ":")
+        )
+        return f"{namespace}:{hashlib.sha256(encoded.encode('utf-8')).hexdigest()}"
+
+    @staticmethod
+    def get(key: str) -> Any | None:
+        backend = ResponseCache.backend()
+        if backend is None:
+            return None
+        try:
+            value = backend.get(key)
+        except sqlite3.Error as e:
+            current_app.logger.warning(f"Response cache read failed: {str(e)}")
+            return None
+        return json.loads(value) if value is not None else None
+
+    @staticmethod
+    def set(key: str, payload: Any) -> None:
+        backend = ResponseCache.backend()
+        if backend is None:
+            return
+        try:
+            backend.set(key, json.dumps(payload, default=str).encode("utf-8"))
+        except sqlite3.Error as e:
+            current_app.logger.warning(f"Response cache write failed: {str(e)}")
+
+    @staticmethod
+    def clear() -> None:
+        backend = ResponseCache.backend()
+        if backend is not None:
+            backend.clear()
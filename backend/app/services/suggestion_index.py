@@ -0,0 +1,294 @@
+"""Typeahead suggestions for evaluation filter fields
+
+Each worker keeps the distinct values of the product and charger columns
+in memory, with how many evaluations use them. Values are indexed under
+every word start, so ``min`` suggests ``Park Min``. Lookups are a binary
+search over a sorted key list and never touch the database.
+
+Freshness:
+- Writes committed by this worker are applied as deltas on commit, and
+  the index adopts the version that commit produced
+- Writes from other workers are picked up by comparing the evaluations
+  data version at most every ``SUGGEST_REFRESH_SECONDS``
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+
+from flask import current_app, has_app_context
+from sqlalchemy import event, func, inspect, select
+from sqlalchemy.orm import Session
+
+from app import db
+from app.models.data_version import touches_evaluations, version_token
+from app.models.evaluation import Evaluation
+
+SUGGEST_FIELDS = {
+    "product_name": Evaluation.product_name,
+    "scs_charger_name": Evaluation.scs_charger_name,
+    "head_office_charger_name": Evaluation.head_office_charger_name,
+}
+SUGGEST_FIELD_ALIASES = {"product": "product_name"}
+MAX_CACHED_PREFIXES = 4096
+_PENDING_KEY = "suggestion_deltas"
+_VERSION_KEY = "suggestion_version"
+
+
+def _word_keys(value: str) -> list[str]:
+    """Lower-cased suffixes of ``value`` starting at each word."""
+    folded = value.casefold()
+    keys = [folded]
+    for index in range(1, len(folded)):
+        if folded[index - 1] in " -_/." and folded[index] not in " -_/.":
+            keys.append(folded[index:])
+    return keys
+
+
+class PrefixIndex:
+    """Distinct values with usage counts, searchable by word prefix."""
+
+    def __init__(self, counts: Counter | None = None):
+        self.counts: Counter = Counter(
+            {
+                value: count
+                for value, count in (counts or {}).items()
+                if value and count > 0
+            }
+        )
+        self._keys: list[tuple[str, str]] = sorted(
+            (key, value) for value in self.counts for key in _word_keys(value)
+        )
+        # Ranked answers per (prefix, limit); short prefixes match many values
+        # and keystrokes repeat them far more often than values change.
+        self._results: dict[tuple[str, int], list[tuple[str, int]]] = {}
+
+    def add(self, value: str, delta: int = 1) -> None:
+        if not value:
+            return
+        self._results.clear()
+        previous = self.counts[value]
+        current = previous + delta
+        if current > 0:
+            self.counts[value] = current
+            if previous <= 0:
+                for key in _word_keys(value):
+                    insort(self._keys, (key, value))
+            return
+        self.counts.pop(value, None)
+        if previous > 0:
+            for key in _word_keys(value):
+                position = bisect_left(self._keys, (key, value))
+                if position < len(self._keys) and self._keys[position] == (key, value):
+                    del self._keys[position]
+
+    def search(self, prefix: str, limit: int) -> list[tuple[str, int]]:
+        """Return up to ``limit`` ``(value, count)`` pairs, most used first."""
+        folded = prefix.casefold()
+        cached = self._results.get((folded, limit))
+        if cached is not None:
+            return cached
+        if not folded:
+            candidates = set(self.counts)
+        else:
+            candidates = set()
+            position = bisect_left(self._keys, (folded, ""))
+            while position < len(self._keys) and self._keys[position][0].startswith(
+                folded
+            ):
+                candidates.add(self._keys[position][1])
+                position += 1
+        ranked = heapq.nsmallest(
+            limit, candidates, key=lambda value: (-self.counts[value], value.casefold())
+        )
+        result = [(value, self.counts[value]) for value in ranked]
+        if len(self._results) >= MAX_CACHED_PREFIXES:
+            self._results.clear()
+        self._results[(folded, limit)] = result
+        return result
+
+
+class SuggestionIndex:
+    """Service class for the per-worker typeahead index
+
+    Handles:
+    - Lazy loading of distinct field values on first use
+    - Applying committed local writes as count deltas
+    - Reloading when another worker bumped the evaluations version
+    """
+
+    EXTENSION_KEY = "suggestion_index"
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self.fields: dict[str, PrefixIndex] | None = None
+        self.version: str | None = None
+        self.checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def instance() -> SuggestionIndex:
+        extensions = current_app.extensions
+        if SuggestionIndex.EXTENSION_KEY not in extensions:
+            extensions[SuggestionIndex.EXTENSION_KEY] = SuggestionIndex(
+                float(current_app.config.get("SUGGEST_REFRESH_SECONDS") or 30)
+            )
+        return extensions[SuggestionIndex.EXTENSION_KEY]
+
+    @staticmethod
+    def resolve_field(field: str | None) -> str:
+        field = SUGGEST_FIELD_ALIASES.get(field or "", field)
+        if field not in SUGGEST_FIELDS:
+            raise ValueError(
+                f"Unsupported field: {field}. Use one of: {', '.join(SUGGEST_FIELDS)}"
+            )
+        return field
+
+    @staticmethod
+    def suggest(field: str, prefix: str, limit: int = 10) -> list[dict]:
+        index = SuggestionIndex.instance()
+        index.ensure_fresh()
+        with index._lock:
+            matches = index.fields[field].search(prefix, limit)
+        return [{"value": value, "count": count} for value, count in matches]
+
+    def ensure_fresh(self) -> None:
+        now = time.monotonic()
+        if self.fields is not None and now - self.checked_at < self.refresh_seconds:
+            return
+        version = version_token()
+        with self._lock:
+            self.checked_at = now
+            if self.fields is not None and version == self.version:
+                return
+        self.load(version)
+
+    def load(self, version: str) -> None:
+        fields = {}
+        for field, column in SUGGEST_FIELDS.items():
+            rows = db.session.execute(
+                select(column, func.count())
+                .where(column.isnot(None), column != "")
+                .group_by(column)
+            ).all()
+            fields[field] = PrefixIndex(Counter(dict(rows)))
+        with self._lock:
+            self.fields = fields
+            self.version = version
+            self.checked_at = time.monotonic()
+
+    def apply(
+        self,
+        deltas: list[tuple[str, str, int]],
+        base: int | None = None,
+        version: str | None = None,
+    ) -> None:
+        """Apply committed count deltas.
+
+        ``base`` is the counter the commit started from and ``version`` the
+        token it produced. The index only adopts ``version`` when it was
+        loaded at ``base``; otherwise another writer committed in between and
+        the next ``ensure_fresh`` still reloads.
+        """
+        with self._lock:
+            if self.fields is None:
+                return
+            for field, value, delta in deltas:
+                self.fields[field].add(value, delta)
+            if version is not None and _counter(self.version) == base:
+                self.version = version
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self.fields = None
+            self.version = None
+
+
+def _counter(version: str | None) -> int | None:
+    if version is None:
+        return None
+    return int(version.split(":", 1)[0])
+
+
+def _field_deltas(session: Session) -> list[tuple[str, str, int]] | None:
+    """Count changes of this flush, or None when an old value is unknown."""
+    deltas = []
+    for obj in session.new:
+        if isinstance(obj, Evaluation):
+            deltas.extend((field, getattr(obj, field), 1) for field in SUGGEST_FIELDS)
+    for obj in session.deleted:
+        if isinstance(obj, Evaluation):
+            state = inspect(obj)
+            for field in SUGGEST_FIELDS:
+                if field not in state.dict:
+                    return None
+                deltas.append((field, state.dict[field], -1))
+    for obj in session.dirty:
+        if not isinstance(obj, Evaluation) or obj in session.deleted:
+            continue
+        state = inspect(obj)
+        for field in SUGGEST_FIELDS:
+            history = state.attrs[field].history
+            if not history.has_changes():
+                continue
+            if not history.deleted:
+                return None
+            deltas.extend((field, value, -1) for value in history.deleted)
+            deltas.extend((field, value, 1) for value in history.added)
+    return [(field, value, delta) for field, value, delta in deltas if value]
+
+
+def _keep_previous_value(target, value, oldvalue, initiator) -> None:
+    pass
+
+
+# active_history loads the old value when an expired attribute is assigned,
+# so the flush history can decrement it instead of forcing a reload.
+for _column in SUGGEST_FIELDS.values():
+    event.listen(_column, "set", _keep_previous_value, active_history=True)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_suggestion_deltas(session: Session, flush_context) -> None:
+    pending = session.info.setdefault(_PENDING_KEY, [])
+    if pending is None:
+        return
+    deltas = _field_deltas(session)
+    session.info[_PENDING_KEY] = None if deltas is None else pending + deltas
+    if not touches_evaluations(session) or not has_app_context():
+        return
+    index = current_app.extensions.get(SuggestionIndex.EXTENSION_KEY)
+    if index is None or index.fields is None:
+        return
+    # The version row stays locked from this transaction's first bump until
+    # commit, so the counter it started from is the first value read minus one.
+    version = version_token(session=session)
+    base, _ = session.info.get(_VERSION_KEY, (_counter(version) - 1, None))
+    session.info[_VERSION_KEY] = (base, version)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_suggestion_deltas(session: Session) -> None:
+    if _PENDING_KEY not in session.info:
+        return
+    deltas = session.info.pop(_PENDING_KEY)
+    base, version = session.info.pop(_VERSION_KEY, (None, None))
+    if not has_app_context():
+        return
+    index = current_app.extensions.get(SuggestionIndex.EXTENSION_KEY)
+    if index is None:
+        return
+    if deltas is None:
+        index.invalidate()
+    elif deltas or version is not None:
+        index.apply(deltas, base, version)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_suggestion_deltas(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_VERSION_KEY, None)
@@ -0,0 +1,107 @@
+"""Field-level patches for update audit logs
+
+Update logs used to store two full snapshots of the edited record. Most
+fields are unchanged between them, and rich text or ``nand_info`` can be
+large, so each edit repeated the same JSON twice. A patch keeps:
+
+- ``changed``: ``{field: {"old": value, "new": value}}``; a missing side
+  means the field was added or removed
+- ``same``: unchanged fields
+
+Values whose JSON exceeds ``AUDIT_BLOB_THRESHOLD`` bytes are stored once in
+the blob store and referenced as ``{"$ref": digest}``, so a large field that
+does not change costs 64 characters per log instead of its full size.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from flask import current_app, has_app_context
+
+PATCH_MARKER = "$patch"
+REF_KEY = "$ref"
+DEFAULT_BLOB_THRESHOLD = 1024
+_MISSING = object()
+
+
+def _blob_threshold() -> int:
+    if has_app_context():
+        return int(
+            current_app.config.get("AUDIT_BLOB_THRESHOLD") or DEFAULT_BLOB_THRESHOLD
+        )
+    return DEFAULT_BLOB_THRESHOLD
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode(
+        "utf-8"
+    )
+
+
+def _compact(value: Any, threshold: int) -> Any:
+    encoded = _encode(value)
+    if len(encoded) <= threshold:
+        return value
+    from app.services.blob_store import BlobStore
+
+    return {REF_KEY: BlobStore.put(encoded, "application/json")}
+
+
+def _resolve(value: Any) -> Any:
+    if isinstance(value, dict) and set(value) == {REF_KEY}:
+        from app.services.blob_store import BlobStore
+
+        return json.loads(BlobStore.read(value[REF_KEY]))
+    return value
+
+
+def is_patch(value: Any) -> bool:
+    return isinstance(value, dict) and value.get(PATCH_MARKER) == 1
+
+
+def make_patch(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Return the patch turning snapshot ``old`` into ``new``."""
+    threshold = _blob_threshold()
+    changed: dict[str, dict[str, Any]] = {}
+    same: dict[str, Any] = {}
+    for key in dict.fromkeys([*old, *new]):
+        before = old.get(key, _MISSING)
+        after = new.get(key, _MISSING)
+        if (
+            before is not _MISSING
+            and after is not _MISSING
+            and _encode(before) == _encode(after)
+        ):
+            same[key] = _compact(after, threshold)
+            continue
+        change = {}
+        if before is not _MISSING:
+            change["old"] = _compact(before, threshold)
+        if after is not _MISSING:
+            change["new"] = _compact(after, threshold)
+        changed[key] = change
+    return {PATCH_MARKER: 1, "changed": changed, "same": same}
+
+
+def changed_fields(patch: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return ``(old, new)`` restricted to the fields the patch changed."""
+    old: dict[str, Any] = {}
+    new: dict[str, Any] = {}
+    for key, change in patch.get("changed", {}).items():
+        if "old" in change:
+            old[key] = _resolve(change["old"])
+        if "new" in change:
+            new[key] = _resolve(change["new"])
+    return old, new
+
+
+def expand_patch(patch: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Rebuild the full ``(old, new)`` snapshots a patch was made from."""
+    old, new = changed_fields(patch)
+    for key, value in patch.get("same", {}).items():
+        value = _resolve(value)
+        old[key] = value
+        new[key] = value
+    return old, new
@@ -0,0 +1,44 @@
+"""Conditional GET helpers (ETag / If-None-Match)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from flask import Request, Response
+
+
+def compute_etag(*parts: object) -> str:
+    """Return a stable validator for JSON-serializable ``parts``.
+
+    Datetimes and other non-JSON values are stringified, so change markers
+    such as ``max(updated_at)`` can be passed as-is.
+    """
+    encoded = json.dumps(parts, default=str, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:32]
+
+
+def request_fingerprint(request: Request) -> list[list[str]]:
+    """Return the query string as sorted pairs so parameter order is ignored."""
+    return sorted([key, value] for key, value in request.args.items(multi=True))
+
+
+def not_modified(request: Request, etag: str, weak: bool = False) -> Response | None:
+    """Return a ``304`` response when ``If-None-Match`` matches ``etag``.
+
+    If-None-Match always uses weak comparison, so weak and strong validators
+    are matched the same way.
+    """
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    apply_etag(response, etag, weak=weak)
+    return response
+
+
+def apply_etag(response: Response, etag: str, weak: bool = False) -> Response:
+    """Attach ``etag`` and require clients to revalidate before reuse."""
+    response.set_etag(etag, weak=weak)
+    response.cache_control.no_cache = True
+    response.cache_control.private = True
+    return response
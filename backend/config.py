@@ -124,6 +124,59 @@ class Config:
     BACKUP_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "backups")
     BACKUP_RETENTION_DAYS = 30
 
+    # Operation log archive: rows older than the retention window move to
+    # monthly gzip NDJSON segments (flask archive-operation-logs)
+    LOG_ARCHIVE_FOLDER = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "archive", "operation_logs"
+    )
+    LOG_RETENTION_DAYS = int(os.environ.get("LOG_RETENTION_DAYS") or 180)
+    LOG_ARCHIVE_CHUNK_SIZE = int(os.environ.get("LOG_ARCHIVE_CHUNK_SIZE") or 1000)
+
+    # Newest nested process raw records kept per evaluation by
+    # `flask compact-nested-payloads`
+    NESTED_RAW_KEEP = int(os.environ.get("NESTED_RAW_KEEP") or 20)
+
+    # Response cache for list/KPI endpoints: "memory", "sqlite" or "none"
+    RESPONSE_CACHE_BACKEND = os.environ.get("RESPONSE_CACHE_BACKEND") or "memory"
+    RESPONSE_CACHE_PATH = os.environ.get("RESPONSE_CACHE_PATH")
+    RESPONSE_CACHE_MAX_ENTRIES = int(
+        os.environ.get("RESPONSE_CACHE_MAX_ENTRIES") or 512
+    )
+
+    # Answer /api/evaluations/kpis from evaluation_kpi_daily when filters allow
+    KPI_ROLLUP_ENABLED = os.environ.get("KPI_ROLLUP_ENABLED", "true").lower() != "false"
+
+    # Seconds between data-version checks of the per-worker typeahead index
+    SUGGEST_REFRESH_SECONDS = float(os.environ.get("SUGGEST_REFRESH_SECONDS") or 30)
+
+    # Per-worker LRU of fail code -> id used by nested saves
+    FAIL_CODE_CACHE_SIZE = int(os.environ.get("FAIL_CODE_CACHE_SIZE") or 4096)
+
+    # Operation logs: "async" batches them off the request path, "sync" commits inline
+    OPERATION_LOG_MODE = os.environ.get("OPERATION_LOG_MODE") or "async"
+    OPERATION_LOG_FLUSH_INTERVAL = float(
+        os.environ.get("OPERATION_LOG_FLUSH_INTERVAL") or 1.0
+    )
+    OPERATION_LOG_BATCH_SIZE = int(os.environ.get("OPERATION_LOG_BATCH_SIZE") or 200)
+    OPERATION_LOG_QUEUE_SIZE = int(os.environ.get("OPERATION_LOG_QUEUE_SIZE") or 10000)
+    # Longest a request waits for queue space before its log row is dropped
+    OPERATION_LOG_ENQUEUE_TIMEOUT = float(
+        os.environ.get("OPERATION_LOG_ENQUEUE_TIMEOUT") or 0.05
+    )
+    # Request latency/DB-time capture and the per-endpoint sample window size
+    REQUEST_METRICS_ENABLED = (
+        os.environ.get("REQUEST_METRICS_ENABLED", "true").lower() != "false"
+    )
+    REQUEST_METRICS_WINDOW = int(os.environ.get("REQUEST_METRICS_WINDOW") or 1000)
+    # Update audit logs move JSON values larger than this (bytes) to the blob store
+    AUDIT_BLOB_THRESHOLD = int(os.environ.get("AUDIT_BLOB_THRESHOLD") or 1024)
+    # Newest logs embedded in GET /api/evaluations/<id>; the rest via /logs
+    DETAIL_LOG_LIMIT = int(os.environ.get("DETAIL_LOG_LIMIT") or 20)
+    # Seconds between re-reads of the view_log_mode/view_log_sample_rate settings
+    VIEW_LOG_POLICY_REFRESH_SECONDS = float(
+        os.environ.get("VIEW_LOG_POLICY_REFRESH_SECONDS") or 30
+    )
+
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -150,6 +203,8 @@ class TestingConfig(Config):
     TESTING = True
     SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
     WTF_CSRF_ENABLED = False
+    OPERATION_LOG_MODE = "sync"
+    VIEW_LOG_POLICY_REFRESH_SECONDS = 0
 
     # Override MySQL-specific engine options for SQLite compatibility
     SQLALCHEMY_ENGINE_OPTIONS = {
@@ -0,0 +1,43 @@
+"""add hourly view counters
+
+Revision ID: a3b5c7d9e1f2
+Revises: f8c0d2e4a6b8
+Create Date: 2026-10-16 01:10:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a3b5c7d9e1f2"
+down_revision = "f8c0d2e4a6b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "view_counters" in inspector.get_table_names():
+        return
+
+    op.create_table(
+        "view_counters",
+        sa.Column("target_type", sa.String(length=50), nullable=False),
+        sa.Column("target_id", sa.Integer(), nullable=False),
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("ip_address", sa.String(length=45), nullable=False),
+        sa.Column("view_count", sa.Integer(), nullable=False),
+        sa.Column("last_viewed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "target_type", "target_id", "bucket_start", "ip_address"
+        ),
+    )
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "view_counters" in inspector.get_table_names():
+        op.drop_table("view_counters")
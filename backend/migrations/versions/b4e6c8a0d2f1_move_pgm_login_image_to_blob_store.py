@@ -0,0 +1,211 @@
+"""move pgm_login_image to blob store
+
+Revision ID: b4e6c8a0d2f1
+Revises: 6f2a9c8d1e7b
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from urllib.parse import unquote_to_bytes
+
+import sqlalchemy as sa
+from alembic import op
+from flask import current_app
+
+# revision identifiers, used by Alembic.
+revision = "b4e6c8a0d2f1"
+down_revision = "6f2a9c8d1e7b"
+branch_labels = None
+depends_on = None
+
+
+CHUNK_SIZE = 200
+DEFAULT_CONTENT_TYPE = "application/octet-stream"
+BLOB_REF_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+DATA_URL_PATTERN = re.compile(r"^data:([\w.+-]+/[\w.+-]+)?(;[^,]*)?,", re.DOTALL)
+MAGIC_TYPES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+)
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+# Blob layout as of this revision: UPLOAD_FOLDER/blobs/<digest[:2]>/<digest>
+# with a ``<digest>.json`` sidecar holding the content type and size.
+def _blob_root() -> str:
+    return os.path.join(current_app.config.get("UPLOAD_FOLDER", "uploads"), "blobs")
+
+
+def _blob_path(digest: str) -> str:
+    return os.path.join(_blob_root(), digest[:2], digest)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _sniff_content_type(data: bytes) -> str:
+    for magic, content_type in MAGIC_TYPES:
+        if data.startswith(magic):
+            return content_type
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return DEFAULT_CONTENT_TYPE
+
+
+def _put_blob(data: bytes, content_type: str | None) -> str:
+    digest = hashlib.sha256(data).hexdigest()
+    path = _blob_path(digest)
+    if not os.path.isfile(path):
+        metadata = {
+            "content_type": content_type or _sniff_content_type(data),
+            "size": len(data),
+        }
+        _write_atomic(f"{path}.json", json.dumps(metadata).encode("utf-8"))
+        _write_atomic(path, data)
+    return digest
+
+
+def _decode_data_url(value: str) -> tuple[bytes, str | None]:
+    """Decode a ``data:`` URL (or bare base64) into bytes and content type."""
+    match = DATA_URL_PATTERN.match(value)
+    try:
+        if match:
+            payload = value[match.end() :]
+            if ";base64" not in (match.group(2) or ""):
+                return unquote_to_bytes(payload), match.group(1)
+            return base64.b64decode(payload, validate=False), match.group(1)
+        return base64.b64decode("".join(value.split()), validate=True), None
+    except (binascii.Error, ValueError) as exc:
+        raise ValueError("Image must be a data URL or base64 string") from exc
+
+
+def _blob_content_type(digest: str) -> str:
+    try:
+        with open(f"{_blob_path(digest)}.json") as handle:
+            return json.load(handle).get("content_type") or DEFAULT_CONTENT_TYPE
+    except (OSError, ValueError):
+        return DEFAULT_CONTENT_TYPE
+
+
+def _iter_chunks(bind, column: str):
+    """Yield (id, value) batches with a non-null ``column`` in id order."""
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                f"SELECT id, {column} FROM evaluations "
+                f"WHERE {column} IS NOT NULL AND id > :last_id "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": CHUNK_SIZE},
+        ).fetchall()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "evaluations" not in inspector.get_table_names():
+        return
+
+    existing_columns = {col["name"] for col in inspector.get_columns("evaluations")}
+    if "pgm_login_image_ref" not in existing_columns:
+        with op.batch_alter_table("evaluations", schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column("pgm_login_image_ref", sa.String(length=64), nullable=True)
+            )
+
+    if "pgm_login_image" not in existing_columns:
+        return
+
+    moved = 0
+    for rows in _iter_chunks(bind, "pgm_login_image"):
+        for evaluation_id, value in rows:
+            digest = None
+            if value.strip():
+                try:
+                    data, content_type = _decode_data_url(value)
+                except ValueError:
+                    # Keep unrecognised values rather than losing them.
+                    logger.warning(
+                        "evaluation %s: PGM image is not base64, stored as text",
+                        evaluation_id,
+                    )
+                    data, content_type = value.encode("utf-8"), "text/plain"
+                digest = _put_blob(data, content_type)
+            bind.execute(
+                sa.text(
+                    "UPDATE evaluations SET pgm_login_image_ref = :ref, "
+                    "pgm_login_image = NULL WHERE id = :id"
+                ),
+                {"ref": digest, "id": evaluation_id},
+            )
+            moved += 1
+    logger.info("Moved %s PGM login image(s) to %s", moved, _blob_root())
+
+    with op.batch_alter_table("evaluations", schema=None) as batch_op:
+        batch_op.drop_column("pgm_login_image")
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "evaluations" not in inspector.get_table_names():
+        return
+
+    existing_columns = {col["name"] for col in inspector.get_columns("evaluations")}
+    if "pgm_login_image" not in existing_columns:
+        with op.batch_alter_table("evaluations", schema=None) as batch_op:
+            batch_op.add_column(sa.Column("pgm_login_image", sa.Text(), nullable=True))
+
+    if "pgm_login_image_ref" not in existing_columns:
+        return
+
+    for rows in _iter_chunks(bind, "pgm_login_image_ref"):
+        for evaluation_id, digest in rows:
+            value = None
+            path = _blob_path(digest) if BLOB_REF_PATTERN.match(digest) else None
+            if path and os.path.isfile(path):
+                with open(path, "rb") as handle:
+                    data = handle.read()
+                content_type = _blob_content_type(digest)
+                if content_type == "text/plain":
+                    value = data.decode("utf-8")
+                else:
+                    encoded = base64.b64encode(data).decode("ascii")
+                    value = f"data:{content_type};base64,{encoded}"
+            bind.execute(
+                sa.text(
+                    "UPDATE evaluations SET pgm_login_image = :value WHERE id = :id"
+                ),
+                {"value": value, "id": evaluation_id},
+            )
+
+    with op.batch_alter_table("evaluations", schema=None) as batch_op:
+        batch_op.drop_column("pgm_login_image_ref")
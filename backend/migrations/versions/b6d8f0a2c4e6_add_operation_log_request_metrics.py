@@ -0,0 +1,48 @@
+"""add request metrics columns to operation logs
+
+Revision ID: b6d8f0a2c4e6
+Revises: a3b5c7d9e1f2
+Create Date: 2026-10-16 01:40:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b6d8f0a2c4e6"
+down_revision = "a3b5c7d9e1f2"
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = (
+    ("duration_ms", sa.Float()),
+    ("db_time_ms", sa.Float()),
+    ("db_statements", sa.Integer()),
+    ("response_bytes", sa.Integer()),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "operation_logs" not in inspector.get_table_names():
+        return
+    existing = {column["name"] for column in inspector.get_columns("operation_logs")}
+    with op.batch_alter_table("operation_logs") as batch_op:
+        for name, column_type in COLUMNS:
+            if name not in existing:
+                batch_op.add_column(sa.Column(name, column_type, nullable=True))
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "operation_logs" not in inspector.get_table_names():
+        return
+    existing = {column["name"] for column in inspector.get_columns("operation_logs")}
+    with op.batch_alter_table("operation_logs") as batch_op:
+        for name, _ in reversed(COLUMNS):
+            if name in existing:
+                batch_op.drop_column(name)
@@ -0,0 +1,115 @@
+"""add evaluation search tokens
+
+Revision ID: c5f7a9b1d3e4
+Revises: b4e6c8a0d2f1
+Create Date: 2026-10-16 00:10:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c5f7a9b1d3e4"
+down_revision = "b4e6c8a0d2f1"
+branch_labels = None
+depends_on = None
+
+
+CHUNK_SIZE = 1000
+SEARCH_FIELDS = (
+    "evaluation_number",
+    "product_name",
+    "scs_charger_name",
+    "head_office_charger_name",
+)
+TRIGRAM_SIZE = 3
+
+
+def _token_rows(evaluation_id: int, values: dict[str, str | None]) -> list[dict]:
+    """Distinct lower-cased trigrams of each searchable column."""
+    rows = []
+    for field, value in values.items():
+        text = (value or "").lower()
+        grams = {
+            text[index : index + TRIGRAM_SIZE]
+            for index in range(len(text) - TRIGRAM_SIZE + 1)
+        }
+        rows.extend(
+            {"field": field, "token": token, "evaluation_id": evaluation_id}
+            for token in sorted(grams)
+        )
+    return rows
+
+
+def _backfill(bind, tokens_table) -> None:
+    columns = ", ".join(SEARCH_FIELDS)
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                f"SELECT id, {columns} FROM evaluations "
+                "WHERE id > :last_id ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": CHUNK_SIZE},
+        ).fetchall()
+        if not rows:
+            return
+        tokens = []
+        for row in rows:
+            values = dict(zip(SEARCH_FIELDS, row[1:], strict=True))
+            tokens.extend(_token_rows(row[0], values))
+        if tokens:
+            op.bulk_insert(tokens_table, tokens)
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    table_names = inspector.get_table_names()
+    if "evaluations" not in table_names:
+        return
+
+    if "evaluation_search_tokens" not in table_names:
+        tokens_table = op.create_table(
+            "evaluation_search_tokens",
+            sa.Column("field", sa.String(length=32), nullable=False),
+            sa.Column("token", sa.String(length=16), nullable=False),
+            sa.Column("evaluation_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["evaluation_id"], ["evaluations.id"], ondelete="CASCADE"
+            ),
+            sa.PrimaryKeyConstraint("field", "token", "evaluation_id"),
+        )
+        op.create_index(
+            op.f("ix_evaluation_search_tokens_evaluation_id"),
+            "evaluation_search_tokens",
+            ["evaluation_id"],
+            unique=False,
+        )
+    else:
+        tokens_table = sa.table(
+            "evaluation_search_tokens",
+            sa.column("field", sa.String),
+            sa.column("token", sa.String),
+            sa.column("evaluation_id", sa.Integer),
+        )
+        bind.execute(sa.text("DELETE FROM evaluation_search_tokens"))
+
+    _backfill(bind, tokens_table)
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "evaluation_search_tokens" not in inspector.get_table_names():
+        return
+
+    existing_indexes = {
+        index["name"] for index in inspector.get_indexes("evaluation_search_tokens")
+    }
+    index_name = op.f("ix_evaluation_search_tokens_evaluation_id")
+    if index_name in existing_indexes:
+        op.drop_index(index_name, table_name="evaluation_search_tokens")
+    op.drop_table("evaluation_search_tokens")
@@ -0,0 +1,44 @@
+"""add payload hash to nested process raw records
+
+Revision ID: c7e9a1b3d5f7
+Revises: b6d8f0a2c4e6
+Create Date: 2026-10-16 02:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c7e9a1b3d5f7"
+down_revision = "b6d8f0a2c4e6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "evaluation_processes_raw" not in inspector.get_table_names():
+        return
+    existing = {
+        column["name"] for column in inspector.get_columns("evaluation_processes_raw")
+    }
+    if "payload_hash" not in existing:
+        with op.batch_alter_table("evaluation_processes_raw") as batch_op:
+            batch_op.add_column(
+                sa.Column("payload_hash", sa.String(length=64), nullable=True)
+            )
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "evaluation_processes_raw" not in inspector.get_table_names():
+        return
+    existing = {
+        column["name"] for column in inspector.get_columns("evaluation_processes_raw")
+    }
+    if "payload_hash" in existing:
+        with op.batch_alter_table("evaluation_processes_raw") as batch_op:
+            batch_op.drop_column("payload_hash")
@@ -0,0 +1,220 @@
+"""move nested raw payloads and nested-save log payloads to payload_blobs
+
+Revision ID: d0e2f4a6b8c1
+Revises: c7e9a1b3d5f7
+Create Date: 2026-10-16 03:10:00.000000
+
+"""
+
+import hashlib
+import json
+import logging
+import zlib
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = "d0e2f4a6b8c1"
+down_revision = "c7e9a1b3d5f7"
+branch_labels = None
+depends_on = None
+
+
+CHUNK_SIZE = 200
+LOG_TARGET = "evaluation_nested_process"
+# Payload blob format as of this revision: zlib-compressed canonical JSON
+# addressed by its SHA-256; log rows point at it as {"$payload": digest}.
+PAYLOAD_REF_KEY = "$payload"
+COMPRESSION_LEVEL = 6
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def _json_value(value):
+    return json.loads(value) if isinstance(value, (str, bytes)) else value
+
+
+def _encode_payload(payload) -> tuple[str, bytes, int]:
+    """Return ``(digest, compressed bytes, canonical size)``."""
+    encoded = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=str
+    ).encode("utf-8")
+    return (
+        hashlib.sha256(encoded).hexdigest(),
+        zlib.compress(encoded, COMPRESSION_LEVEL),
+        len(encoded),
+    )
+
+
+def _iter_chunks(bind, query: str, params: dict | None = None):
+    """Yield row batches of ``query`` (selecting id first) in id order."""
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(f"{query} AND id > :last_id ORDER BY id LIMIT :limit"),
+            {**(params or {}), "last_id": last_id, "limit": CHUNK_SIZE},
+        ).fetchall()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
+
+def _store(bind, payload, known: set[str]) -> tuple[str, int, int]:
+    """Insert the payload blob if new.
+
+    Returns (digest, canonical JSON size, compressed bytes added). The size
+    is measured on the decoded payload because drivers differ in what they
+    return for JSON columns (text on MySQL/SQLite, a dict on PostgreSQL).
+    """
+    digest, data, size = _encode_payload(payload)
+    if digest in known:
+        return digest, size, 0
+    known.add(digest)
+    exists = bind.execute(
+        sa.text("SELECT 1 FROM payload_blobs WHERE digest = :digest"),
+        {"digest": digest},
+    ).first()
+    if exists:
+        return digest, size, 0
+    bind.execute(
+        sa.text(
+            "INSERT INTO payload_blobs (digest, data, size, created_at) "
+            "VALUES (:digest, :data, :size, CURRENT_TIMESTAMP)"
+        ),
+        {"digest": digest, "data": data, "size": size},
+    )
+    return digest, size, len(data)
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = inspector.get_table_names()
+    if "payload_blobs" not in tables:
+        op.create_table(
+            "payload_blobs",
+            sa.Column("digest", sa.String(length=64), nullable=False),
+            sa.Column(
+                "data",
+                sa.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql"),
+                nullable=False,
+            ),
+            sa.Column("size", sa.Integer(), nullable=False),
+            sa.Column(
+                "created_at",
+                sa.DateTime(timezone=True),
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+                nullable=False,
+            ),
+            sa.PrimaryKeyConstraint("digest"),
+        )
+
+    known: set[str] = set()
+    before = after = 0
+
+    if "evaluation_processes_raw" in tables:
+        with op.batch_alter_table("evaluation_processes_raw") as batch_op:
+            batch_op.alter_column("payload", existing_type=sa.JSON(), nullable=True)
+
+        converted = 0
+        for rows in _iter_chunks(
+            bind,
+            "SELECT id, payload FROM evaluation_processes_raw "
+            "WHERE payload IS NOT NULL",
+        ):
+            for raw_id, value in rows:
+                digest, size, added = _store(bind, _json_value(value), known)
+                before += size
+                after += added
+                bind.execute(
+                    sa.text(
+                        "UPDATE evaluation_processes_raw SET payload = NULL, "
+                        "payload_hash = :digest WHERE id = :id"
+                    ),
+                    {"digest": digest, "id": raw_id},
+                )
+                converted += 1
+        logger.info("Moved %s nested raw payload(s) to payload_blobs", converted)
+
+    if "operation_logs" in tables:
+        converted = 0
+        for rows in _iter_chunks(
+            bind,
+            "SELECT id, new_data FROM operation_logs "
+            "WHERE target_type = :target AND new_data IS NOT NULL",
+            {"target": LOG_TARGET},
+        ):
+            for log_id, value in rows:
+                payload = _json_value(value)
+                if not isinstance(payload, dict) or PAYLOAD_REF_KEY in payload:
+                    continue
+                digest, size, added = _store(bind, payload, known)
+                before += size
+                after += added
+                bind.execute(
+                    sa.text("UPDATE operation_logs SET new_data = :ref WHERE id = :id"),
+                    {"ref": json.dumps({PAYLOAD_REF_KEY: digest}), "id": log_id},
+                )
+                converted += 1
+        logger.info("Moved %s nested-save log payload(s) to payload_blobs", converted)
+
+    logger.info(
+        "Payload store: %s bytes of canonical JSON now take %s bytes (%s reclaimed)",
+        before,
+        after,
+        before - after,
+    )
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = inspector.get_table_names()
+    if "payload_blobs" not in tables:
+        return
+
+    def load(digest):
+        row = bind.execute(
+            sa.text("SELECT data FROM payload_blobs WHERE digest = :digest"),
+            {"digest": digest},
+        ).first()
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+    if "operation_logs" in tables:
+        for rows in _iter_chunks(
+            bind,
+            "SELECT id, new_data FROM operation_logs "
+            "WHERE target_type = :target AND new_data IS NOT NULL",
+            {"target": LOG_TARGET},
+        ):
+            for log_id, value in rows:
+                ref = _json_value(value)
+                if isinstance(ref, dict) and set(ref) == {PAYLOAD_REF_KEY}:
+                    bind.execute(
+                        sa.text(
+                            "UPDATE operation_logs SET new_data = :data WHERE id = :id"
+                        ),
+                        {"data": load(ref[PAYLOAD_REF_KEY]), "id": log_id},
+                    )
+
+    if "evaluation_processes_raw" in tables:
+        for rows in _iter_chunks(
+            bind,
+            "SELECT id, payload_hash FROM evaluation_processes_raw "
+            "WHERE payload IS NULL",
+        ):
+            for raw_id, digest in rows:
+                bind.execute(
+                    sa.text(
+                        "UPDATE evaluation_processes_raw SET payload = :data "
+                        "WHERE id = :id"
+                    ),
+                    {"data": load(digest) or "{}", "id": raw_id},
+                )
+        with op.batch_alter_table("evaluation_processes_raw") as batch_op:
+            batch_op.alter_column("payload", existing_type=sa.JSON(), nullable=False)
+
+    op.drop_table("payload_blobs")
@@ -0,0 +1,43 @@
+"""add data versions
+
+Revision ID: d6a8b0c2e4f5
+Revises: c5f7a9b1d3e4
+Create Date: 2026-10-16 00:20:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d6a8b0c2e4f5"
+down_revision = "c5f7a9b1d3e4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "data_versions" in inspector.get_table_names():
+        return
+
+    versions_table = op.create_table(
+        "data_versions",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    # Seed the row so concurrent first writers only ever UPDATE it.
+    op.bulk_insert(
+        versions_table,
+        [{"name": "evaluations", "version": 0, "updated_at": None}],
+    )
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "data_versions" in inspector.get_table_names():
+        op.drop_table("data_versions")
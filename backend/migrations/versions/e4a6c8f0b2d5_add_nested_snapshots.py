@@ -0,0 +1,61 @@
+"""add evaluation_nested_snapshots
+
+Revision ID: e4a6c8f0b2d5
+Revises: d0e2f4a6b8c1
+Create Date: 2026-10-16 05:40:00.000000
+
+Snapshots are rendered by the next nested save of each evaluation; run
+``flask backfill-nested-snapshots`` to populate existing evaluations.
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = "e4a6c8f0b2d5"
+down_revision = "d0e2f4a6b8c1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "evaluation_nested_snapshots" in inspector.get_table_names():
+        return
+    op.create_table(
+        "evaluation_nested_snapshots",
+        sa.Column("evaluation_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("state", sa.String(length=64), nullable=False),
+        sa.Column(
+            "body",
+            sa.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["evaluation_id"], ["evaluations.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("evaluation_id"),
+    )
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "evaluation_nested_snapshots" in inspector.get_table_names():
+        op.drop_table("evaluation_nested_snapshots")
@@ -0,0 +1,87 @@
+"""add indexes for hot evaluation queries
+
+Revision ID: e7b9c1d3f5a7
+Revises: d6a8b0c2e4f5
+Create Date: 2026-10-16 00:30:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e7b9c1d3f5a7"
+down_revision = "d6a8b0c2e4f5"
+branch_labels = None
+depends_on = None
+
+
+# (table, index name, columns) matched to the access paths in app/api/evaluation.py
+INDEXES = (
+    (
+        "operation_logs",
+        "ix_operation_logs_target_type_target_id_created_at",
+        ["target_type", "target_id", "created_at"],
+    ),
+    ("evaluations", "ix_evaluations_status_updated_at", ["status", "updated_at"]),
+    ("evaluations", "ix_evaluations_status_start_date", ["status", "start_date"]),
+    ("evaluations", "ix_evaluations_created_at_id", ["created_at", "id"]),
+    (
+        "evaluation_details",
+        "ix_evaluation_details_evaluation_id",
+        ["evaluation_id"],
+    ),
+    (
+        "evaluation_results",
+        "ix_evaluation_results_evaluation_id",
+        ["evaluation_id"],
+    ),
+    (
+        "evaluation_processes",
+        "ix_evaluation_processes_evaluation_id",
+        ["evaluation_id"],
+    ),
+    (
+        "evaluation_step_failures",
+        "ix_evaluation_step_failures_step_id",
+        ["step_id"],
+    ),
+    (
+        "evaluation_step_failures",
+        "ix_evaluation_step_failures_fail_code_id",
+        ["fail_code_id"],
+    ),
+    ("evaluation_step_lots", "ix_evaluation_step_lots_lot_id", ["lot_id"]),
+    (
+        "evaluation_process_lots",
+        "ix_evaluation_process_lots_lot_number",
+        ["lot_number"],
+    ),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    table_names = set(inspector.get_table_names())
+
+    for table_name, index_name, columns in INDEXES:
+        if table_name not in table_names:
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table_name)}
+        if index_name in existing:
+            continue
+        op.create_index(index_name, table_name, columns, unique=False)
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    table_names = set(inspector.get_table_names())
+
+    for table_name, index_name, _columns in reversed(INDEXES):
+        if table_name not in table_names:
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table_name)}
+        if index_name in existing:
+            op.drop_index(index_name, table_name=table_name)
@@ -0,0 +1,48 @@
+"""add last_used_at to payload_blobs
+
+Revision ID: f2b4d6e8a0c3
+Revises: e4a6c8f0b2d5
+Create Date: 2026-10-17 01:20:00.000000
+
+Existing blobs start at the migration time, so the first compaction after
+the upgrade treats them as recently used and keeps them.
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f2b4d6e8a0c3"
+down_revision = "e4a6c8f0b2d5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "payload_blobs" not in inspector.get_table_names():
+        return
+    existing = {column["name"] for column in inspector.get_columns("payload_blobs")}
+    if "last_used_at" not in existing:
+        with op.batch_alter_table("payload_blobs") as batch_op:
+            batch_op.add_column(
+                sa.Column(
+                    "last_used_at",
+                    sa.DateTime(timezone=True),
+                    server_default=sa.text("CURRENT_TIMESTAMP"),
+                    nullable=False,
+                )
+            )
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "payload_blobs" not in inspector.get_table_names():
+        return
+    existing = {column["name"] for column in inspector.get_columns("payload_blobs")}
+    if "last_used_at" in existing:
+        with op.batch_alter_table("payload_blobs") as batch_op:
+            batch_op.drop_column("last_used_at")
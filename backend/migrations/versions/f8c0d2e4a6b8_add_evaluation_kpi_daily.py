@@ -0,0 +1,127 @@
+"""add evaluation kpi daily rollup
+
+Revision ID: f8c0d2e4a6b8
+Revises: e7b9c1d3f5a7
+Create Date: 2026-10-16 00:40:00.000000
+
+"""
+
+from datetime import datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f8c0d2e4a6b8"
+down_revision = "e7b9c1d3f5a7"
+branch_labels = None
+depends_on = None
+
+
+CHUNK_SIZE = 1000
+COUNTERS = (
+    "created_count",
+    "completed_count",
+    "open_started_count",
+    "open_updated_count",
+)
+COMPLETED_STATUS = "completed"
+OPEN_STATUSES = ("in_progress",)
+
+
+def _contributions(row):
+    """Yield the ``(day, counter)`` pairs one evaluation adds to the rollup."""
+    yield row.created_at, "created_count"
+    if row.status == COMPLETED_STATUS:
+        yield row.actual_end_date, "completed_count"
+    if row.status in OPEN_STATUSES:
+        yield row.start_date, "open_started_count"
+        yield row.updated_at, "open_updated_count"
+
+
+def _backfill(bind, rollup_table) -> None:
+    evaluations = sa.table(
+        "evaluations",
+        sa.column("id", sa.Integer),
+        sa.column("evaluation_type", sa.String),
+        sa.column("product_name", sa.String),
+        sa.column("status", sa.String),
+        sa.column("start_date", sa.Date),
+        sa.column("actual_end_date", sa.Date),
+        sa.column("created_at", sa.DateTime),
+        sa.column("updated_at", sa.DateTime),
+    )
+    totals = {}
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(evaluations)
+            .where(evaluations.c.id > last_id)
+            .order_by(evaluations.c.id)
+            .limit(CHUNK_SIZE)
+        ).fetchall()
+        if not rows:
+            break
+        for row in rows:
+            for day, counter in _contributions(row):
+                if isinstance(day, datetime):
+                    day = day.date()
+                if day is None:
+                    continue
+                key = (day, row.evaluation_type, row.product_name)
+                total = totals.setdefault(
+                    key,
+                    {
+                        "day": day,
+                        "evaluation_type": row.evaluation_type,
+                        "product_name": row.product_name,
+                        **dict.fromkeys(COUNTERS, 0),
+                    },
+                )
+                total[counter] += 1
+        last_id = rows[-1].id
+    rows = list(totals.values())
+    for start in range(0, len(rows), CHUNK_SIZE):
+        op.bulk_insert(rollup_table, rows[start : start + CHUNK_SIZE])
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    table_names = inspector.get_table_names()
+    if "evaluations" not in table_names:
+        return
+
+    if "evaluation_kpi_daily" not in table_names:
+        rollup_table = op.create_table(
+            "evaluation_kpi_daily",
+            sa.Column("day", sa.Date(), nullable=False),
+            sa.Column("evaluation_type", sa.String(length=32), nullable=False),
+            sa.Column("product_name", sa.String(length=100), nullable=False),
+            sa.Column("created_count", sa.Integer(), nullable=False),
+            sa.Column("completed_count", sa.Integer(), nullable=False),
+            sa.Column("open_started_count", sa.Integer(), nullable=False),
+            sa.Column("open_updated_count", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("day", "evaluation_type", "product_name"),
+        )
+    else:
+        rollup_table = sa.table(
+            "evaluation_kpi_daily",
+            sa.column("day", sa.Date),
+            sa.column("evaluation_type", sa.String),
+            sa.column("product_name", sa.String),
+            sa.column("created_count", sa.Integer),
+            sa.column("completed_count", sa.Integer),
+            sa.column("open_started_count", sa.Integer),
+            sa.column("open_updated_count", sa.Integer),
+        )
+        bind.execute(sa.text("DELETE FROM evaluation_kpi_daily"))
+
+    _backfill(bind, rollup_table)
+
+
+def downgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if "evaluation_kpi_daily" in inspector.get_table_names():
+        op.drop_table("evaluation_kpi_daily")
@@ -116,6 +116,153 @@ def backup_db():
         return 1
 
 
+@app.cli.command()
+@with_appcontext
+def rebuild_search_index():
+    """Rebuild the trigram index used by evaluation substring filters"""
+    try:
+        from app.models.search_index import rebuild_search_index as rebuild
+
+        indexed = rebuild()
+        print(f"✓ Search index rebuilt for {indexed} evaluations")
+
+    except Exception as e:
+        print(f"❌ Search index rebuild failed: {str(e)}")
+        return 1
+
+
+@app.cli.command()
+@click.option("--chunk-size", default=1000, show_default=True)
+@with_appcontext
+def rebuild_kpi_rollup(chunk_size):
+    """Recompute the daily KPI rollup used by the evaluation console"""
+    try:
+        from app.models.kpi_rollup import rebuild_kpi_rollup as rebuild
+
+        scanned = rebuild(chunk_size=chunk_size)
+        print(f"✓ KPI rollup rebuilt from {scanned} evaluations")
+
+    except Exception as e:
+        print(f"❌ KPI rollup rebuild failed: {str(e)}")
+        return 1
+
+
+@app.cli.command()
+@click.option("--retention-days", type=int, help="Defaults to LOG_RETENTION_DAYS")
+@click.option("--chunk-size", type=int, help="Defaults to LOG_ARCHIVE_CHUNK_SIZE")
+@with_appcontext
+def archive_operation_logs(retention_days, chunk_size):
+    """Move expired operation logs into monthly archive segments"""
+    try:
+        from app.services.log_archive import LogArchive
+
+        moved = LogArchive.archive(retention_days=retention_days, chunk_size=chunk_size)
+        print(f"✓ Archived {moved} operation logs to {LogArchive.root()}")
+
+    except Exception as e:
+        print(f"❌ Operation log archive failed: {str(e)}")
+        return 1
+
+
+@app.cli.command()
+@click.option("--keep", type=int, help="Defaults to NESTED_RAW_KEEP")
+@click.option(
+    "--grace-minutes",
+    default=60,
+    show_default=True,
+    help="Keep blobs a save used more recently",
+)
+@with_appcontext
+def compact_nested_payloads(keep, grace_minutes):
+    """Trim old nested process raw records and unreferenced payload blobs"""
+    try:
+        from app.services.payload_store import PayloadStore
+
+        result = PayloadStore.compact(keep=keep, grace_seconds=grace_minutes * 60)
+        stats = PayloadStore.stats()
+        print(
+            f"✓ Removed {result['raw_deleted']} raw records and "
+            f"{result['blobs_deleted']} payload blobs ({result['bytes_freed']} bytes)"
+        )
+        print(
+            f"✓ Payload store: {stats['blobs']} blobs, {stats['stored_bytes']} bytes "
+            f"stored for {stats['payload_bytes']} bytes of JSON"
+        )
+
+    except Exception as e:
+        print(f"❌ Nested payload compaction failed: {str(e)}")
+        return 1
+
+
+@app.cli.command()
+@click.option(
+    "--grace-minutes",
+    default=60,
+    show_default=True,
+    help="Keep blobs written or reused more recently",
+)
+@with_appcontext
+def prune_blobs(grace_minutes):
+    """Delete blob files no evaluation or operation log references"""
+    try:
+        from app.services.blob_store import BlobStore
+
+        blobs, freed = BlobStore.collect_garbage(grace_seconds=grace_minutes * 60)
+        print(f"✓ Removed {blobs} unreferenced blobs ({freed} bytes)")
+
+    except Exception as e:
+        print(f"❌ Blob pruning failed: {str(e)}")
+        return 1
+
+
+@app.cli.command()
+@click.option("--chunk-size", default=200, show_default=True)
+@click.option("--rebuild", is_flag=True, help="Re-render snapshots still current")
+@with_appcontext
+def backfill_nested_snapshots(chunk_size, rebuild):
+    """Materialize nested process snapshots for evaluations lacking a current one"""
+    try:
+        from app.api.evaluation import backfill_nested_snapshots as backfill
+
+        written = backfill(chunk_size=chunk_size, rebuild=rebuild)
+        print(f"✓ Materialized {written} nested process snapshots")
+
+    except Exception as e:
+        print(f"❌ Nested snapshot backfill failed: {str(e)}")
+        return 1
+
+
+@app.cli.command()
+@click.option("--verbose", is_flag=True, help="Print the full plan of every query")
+@click.option("--strict", is_flag=True, help="Exit with status 1 on any full scan")
+@with_appcontext
+def index_report(verbose, strict):
+    """EXPLAIN the hot evaluation queries and flag full table scans"""
+    try:
+        from app.services.index_advisor import IndexAdvisor
+
+        plans = IndexAdvisor.report()
+        print(f"Dialect: {db.engine.dialect.name}")
+        for plan in plans:
+            if plan.ok:
+                print(f"✓ {plan.name}")
+            else:
+                print(f"⚠️  {plan.name}: full scan on {', '.join(plan.full_scans)}")
+                print(f"     {plan.description}")
+            if verbose or not plan.ok:
+                for line in plan.plan:
+                    print(f"     {line}")
+
+        flagged = sum(1 for plan in plans if not plan.ok)
+        print(f"\n{len(plans) - flagged}/{len(plans)} hot queries use an index")
+        if strict and flagged:
+            raise SystemExit(1)
+
+    except Exception as e:
+        print(f"❌ Index report failed: {str(e)}")
+        return 1
+
+
 if __name__ == "__main__":
     # Check if database is initialized
     with app.app_context():
@@ -131,6 +278,10 @@ if __name__ == "__main__":
             print("  flask init-db   - Initialize database with default data")
             print("  flask reset-db  - Reset database (WARNING: deletes all data)")
             print("  flask backup-db - Create database backup")
+            print("  flask rebuild-search-index - Rebuild evaluation search index")
+            print("  flask rebuild-kpi-rollup - Recompute the daily KPI rollup")
+            print("  flask index-report - EXPLAIN hot queries and flag full scans")
+            print("  flask archive-operation-logs - Archive expired operation logs")
             exit(1)
 
     # Get configuration from environment
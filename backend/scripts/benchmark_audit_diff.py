@@ -0,0 +1,124 @@
+"""Compare update audit log storage: full snapshots vs field patches.
+
+Creates an evaluation with rich-text notes in an in-memory SQLite database,
+replays an edit history of small field changes and reports the bytes each
+update log would take as two full ``to_dict`` snapshots and as a patch plus
+the blob store content it references.
+
+Example:
+    python scripts/benchmark_audit_diff.py --edits 200
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import click
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import create_app, db
+from app.models import Evaluation
+from app.utils.audit_diff import expand_patch, make_patch
+
+PARAGRAPH = (
+    "<p>Lot <strong>{lot}</strong> passed the {step} screen at {temp}C; "
+    "see the attached <em>fail bitmap</em> for the marginal blocks.</p>"
+)
+EDITS = (
+    ("status", lambda rng: rng.choice(["in_progress", "completed"])),
+    ("remarks", lambda rng: f"<p>Follow-up {rng.randint(1, 9999)}</p>"),
+    ("process_step", lambda rng: f"M{rng.randint(1, 99):03d}"),
+    ("pgm_version", lambda rng: f"v{rng.randint(1, 5)}.{rng.randint(0, 20)}"),
+    ("scs_charger_name", lambda rng: rng.choice(["Kim Min", "Lee Seo", "Park Ji"])),
+)
+
+
+def _notes(rng: random.Random, paragraphs: int) -> str:
+    return "".join(
+        PARAGRAPH.format(
+            lot=f"L{rng.randint(10000, 99999)}",
+            step=rng.choice(["BI", "FT", "SLT"]),
+            temp=rng.choice([-40, 25, 85, 125]),
+        )
+        for _ in range(paragraphs)
+    )
+
+
+def _size(value: object) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def _blob_bytes(folder: str) -> int:
+    total = 0
+    for root, _, files in os.walk(folder):
+        total += sum(
+            os.path.getsize(os.path.join(root, name))
+            for name in files
+            if not name.endswith(".json")
+        )
+    return total
+
+
+@click.command()
+@click.option("--edits", default=200, show_default=True)
+@click.option("--paragraphs", default=40, show_default=True)
+def main(edits: int, paragraphs: int):
+    """Print snapshot vs patch storage for a replayed edit history."""
+    rng = random.Random(11)
+    app = create_app("testing")
+    app.config["UPLOAD_FOLDER"] = tempfile.mkdtemp(prefix="audit-diff-")
+    with app.app_context():
+        db.create_all()
+        evaluation = Evaluation(
+            evaluation_number="EV-AUDIT-0001",
+            evaluation_type="new_product",
+            product_name="Orion-77",
+            part_number="PN-000001",
+            start_date=date(2026, 1, 5),
+            process_step="M031",
+            test_process=_notes(rng, paragraphs),
+            v_process=_notes(rng, paragraphs),
+            pgm_login_text=_notes(rng, paragraphs // 2),
+        )
+        db.session.add(evaluation)
+        db.session.commit()
+
+        snapshot_bytes = 0
+        patch_bytes = 0
+        for _ in range(edits):
+            old = evaluation.to_dict()
+            field, value = rng.choice(EDITS)
+            setattr(evaluation, field, value(rng))
+            db.session.commit()
+            new = evaluation.to_dict()
+
+            patch = make_patch(old, new)
+            assert expand_patch(patch) == (
+                json.loads(json.dumps(old, default=str)),
+                json.loads(json.dumps(new, default=str)),
+            )
+            snapshot_bytes += _size(old) + _size(new)
+            patch_bytes += _size(patch)
+
+        blob_bytes = _blob_bytes(app.config["UPLOAD_FOLDER"])
+        total = patch_bytes + blob_bytes
+        click.echo(f"{edits} edits, record size {_size(evaluation.to_dict())} bytes")
+        click.echo(f"{'full snapshots':<24} {snapshot_bytes:>12,} bytes")
+        click.echo(f"{'patches (log rows)':<24} {patch_bytes:>12,} bytes")
+        click.echo(f"{'referenced blobs':<24} {blob_bytes:>12,} bytes")
+        click.echo(
+            f"{'patches + blobs':<24} {total:>12,} bytes"
+            f" ({snapshot_bytes / max(total, 1):.1f}x smaller)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Compare payload size and latency of evaluation list projections.
+
+Seeds an in-memory SQLite database with evaluations that carry realistic free-text
+columns, a PGM login image and NAND extensions, then requests
+``GET /api/evaluations`` with the full serializer, ``view=summary`` and an
+explicit ``fields=`` list.
+
+Example:
+    python scripts/benchmark_evaluation_list.py --rows 5000 --per-page 500
+
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import click
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import create_app, db
+from app.models import Evaluation
+from app.models.evaluation import NandEvaluation, NandProduct
+from app.services.blob_store import BlobStore
+
+SCENARIOS = {
+    "full": {},
+    "summary": {"view": "summary"},
+    "fields": {"fields": "evaluation_number,product_name,status,nand_info"},
+}
+
+
+def _seed(rows: int, image_kb: int, nand_ratio: float) -> None:
+    image_ref = BlobStore.put(os.urandom(image_kb * 1024), "image/png")
+    remarks = "Lot review notes. " * 40
+    product = NandProduct(dr_generation="V8", product_code="BM", display_order=1)
+    db.session.add(product)
+    db.session.flush()
+
+    nand_every = int(1 / nand_ratio) if nand_ratio > 0 else 0
+    base = date(2025, 1, 1)
+    for index in range(rows):
+        evaluation = Evaluation(
+            evaluation_number=f"BENCH-{index:07d}",
+            evaluation_type="new_product",
+            product_name=f"Product {index % 50}",
+            part_number=f"PN-{index:05d}",
+            start_date=base + timedelta(days=index % 365),
+            evaluation_name=f"Benchmark evaluation {index}",
+            remarks=remarks,
+            test_process=remarks,
+            v_process=remarks,
+            pgm_login_image_ref=image_ref,
+            process_step="M031",
+        )
+        db.session.add(evaluation)
+        if nand_every and index % nand_every == 0:
+            db.session.flush()
+            db.session.add(
+                NandEvaluation(
+                    evaluation_id=evaluation.id,
+                    nand_product_id=product.id,
+                    milestone_date=evaluation.start_date,
+                    milestone_status="approved",
+                    evaluation_item="S3 approval",
+                    fab_line="X1L",
+                )
+            )
+        if index % 1000 == 999:
+            db.session.commit()
+    db.session.commit()
+
+
+def _measure(client, params: dict, repeat: int) -> tuple[int, float]:
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = client.get("/api/evaluations", query_string=params)
+        timings.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200:
+            raise click.ClickException(response.get_data(as_text=True))
+        size = len(response.get_data())
+    return size, statistics.median(timings)
+
+
+@click.command()
+@click.option("--rows", default=2000, show_default=True, help="Evaluations to seed")
+@click.option("--per-page", default=500, show_default=True)
+@click.option("--image-kb", default=64, show_default=True, help="PGM image size")
+@click.option("--nand-ratio", default=0.2, show_default=True)
+@click.option("--repeat", default=5, show_default=True)
+def main(rows: int, per_page: int, image_kb: int, nand_ratio: float, repeat: int):
+    """Seed an in-memory SQLite database and print one line per scenario."""
+    app = create_app("testing")
+    app.config["UPLOAD_FOLDER"] = tempfile.mkdtemp(prefix="bench-uploads-")
+    with app.app_context():
+        db.create_all()
+        _seed(rows, image_kb, nand_ratio)
+        client = app.test_client()
+
+        click.echo(f"{'scenario':<10} {'bytes':>14} {'median ms':>10}")
+        baseline = None
+        for name, extra in SCENARIOS.items():
+            params = {"per_page": per_page, **extra}
+            size, elapsed = _measure(client, params, repeat)
+            baseline = baseline or size
+            click.echo(
+                f"{name:<10} {size:>14,} {elapsed:>10.1f}"
+                f"  ({size / baseline:.1%} of full)"
+            )
+
+
+if __name__ == "__main__":
+    main()
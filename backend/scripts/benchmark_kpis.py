@@ -0,0 +1,223 @@
+"""Compare the KPI rollup and live aggregates with the per-metric COUNTs.
+
+Seeds an in-memory SQLite database with evaluations spread over statuses,
+types and start dates, builds the daily rollup, then times the rollup and
+the live conditional-aggregate query against the previous implementation
+(one ``COUNT`` per card plus every open start date loaded into Python for
+the median).
+
+Example:
+    python scripts/benchmark_kpis.py --rows 100000
+
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import click
+from werkzeug.datastructures import MultiDict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import create_app, db
+from app.api.evaluation import (
+    ACTIVE_EVALUATION_STATUSES,
+    KPI_COUNT_FIELDS,
+    _apply_evaluation_base_filters,
+    _build_live_kpis,
+    _build_rollup_kpis,
+    _kpi_rollup_applies,
+    _median,
+)
+from app.models import Evaluation
+from app.models.evaluation import EvaluationStatus
+from app.models.kpi_rollup import rebuild_kpi_rollup
+from app.models.search_index import rebuild_search_index
+from app.utils.timezone import utcnow
+
+QUERIES = (
+    {},
+    {"product": "orion"},
+    {"group_by": "evaluation_type"},
+    {"group_by": "product_name"},
+    {"group_by": "scs_charger_name", "status": "in_progress"},
+)
+STATUSES = ("in_progress", "in_progress", "completed", "cancelled")
+TYPES = ("new_product", "mass_production")
+PRODUCTS = ("Orion", "Vega", "Lyra", "Draco", "Hydra", "Cetus", "Auriga")
+CHARGERS = ("Kim Min", "Lee Seo", "Park Ji", "Choi Hyun", "Jung Woo", "Kang Jae")
+
+
+def _seed(rows: int) -> None:
+    rng = random.Random(11)
+    now = utcnow()
+    batch = []
+    for index in range(rows):
+        status = rng.choice(STATUSES)
+        start_date = now.date() - timedelta(days=rng.randint(0, 400))
+        batch.append(
+            {
+                "evaluation_number": f"EV-KPI-{index:07d}",
+                "evaluation_type": rng.choice(TYPES),
+                "product_name": f"{rng.choice(PRODUCTS)}-{rng.randint(1, 40)}",
+                "part_number": f"PN-{index:06d}",
+                "status": status,
+                "start_date": start_date,
+                "actual_end_date": (
+                    start_date + timedelta(days=rng.randint(0, 30))
+                    if status == "completed"
+                    else None
+                ),
+                "scs_charger_name": rng.choice(CHARGERS),
+                "created_at": now - timedelta(days=rng.randint(0, 400)),
+                "updated_at": now - timedelta(hours=rng.randint(0, 240)),
+            }
+        )
+        if len(batch) == 5000:
+            db.session.execute(Evaluation.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(Evaluation.__table__.insert(), batch)
+    db.session.commit()
+
+
+def _legacy_kpis(args, *criteria) -> dict:
+    """The per-metric COUNT implementation, kept here as the baseline."""
+    now = utcnow()
+    today = now.date()
+    month_start = today.replace(day=1)
+    month_start_at = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    if month_start.month == 12:
+        next_month_start = month_start.replace(year=month_start.year + 1, month=1)
+        next_month_start_at = month_start_at.replace(
+            year=month_start_at.year + 1, month=1
+        )
+    else:
+        next_month_start = month_start.replace(month=month_start.month + 1)
+        next_month_start_at = month_start_at.replace(month=month_start_at.month + 1)
+
+    base_query = _apply_evaluation_base_filters(Evaluation.query, args).filter(
+        *criteria
+    )
+    open_query = base_query.filter(Evaluation.status.in_(ACTIVE_EVALUATION_STATUSES))
+    open_ages = [
+        max((today - row.start_date).days, 0)
+        for row in open_query.with_entities(Evaluation.start_date).all()
+        if row.start_date
+    ]
+    return {
+        "open_evaluations": open_query.count(),
+        "stale_open_evaluations": open_query.filter(
+            Evaluation.updated_at <= now - timedelta(hours=48)
+        ).count(),
+        "open_over_10d": open_query.filter(
+            Evaluation.start_date <= today - timedelta(days=10)
+        ).count(),
+        "median_open_age_days": _median(open_ages),
+        "created_this_month": base_query.filter(
+            Evaluation.created_at >= month_start_at,
+            Evaluation.created_at < next_month_start_at,
+        ).count(),
+        "total_evaluations": base_query.count(),
+        "completed_this_month": base_query.filter(
+            Evaluation.status == EvaluationStatus.COMPLETED.value,
+            Evaluation.actual_end_date >= month_start,
+            Evaluation.actual_end_date < next_month_start,
+        ).count(),
+    }
+
+
+def _legacy_grouped(args, group_by: str) -> dict:
+    # Without GROUP BY the console needs one full KPI pass per group value.
+    column = getattr(Evaluation, group_by)
+    keys = [
+        row[0]
+        for row in _apply_evaluation_base_filters(Evaluation.query, args)
+        .with_entities(column)
+        .distinct()
+        .all()
+    ]
+    overall = _legacy_kpis(args)
+    overall["groups"] = [
+        {"key": key, **_legacy_kpis(args, column == key)} for key in keys
+    ]
+    return overall
+
+
+def _time(build, repeat: int) -> tuple[dict, float]:
+    timings = []
+    result: dict = {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = build()
+        timings.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(timings)
+
+
+def _assert_same(legacy: dict, current: dict, params: dict, group_by) -> None:
+    for field in (*KPI_COUNT_FIELDS, "median_open_age_days"):
+        assert legacy[field] == current[field], (params, field)
+    if group_by:
+        expected = {group["key"]: group for group in legacy["groups"]}
+        for group in current["groups"]:
+            for field in (*KPI_COUNT_FIELDS, "median_open_age_days"):
+                assert expected[group["key"]][field] == group[field], (
+                    params,
+                    group["key"],
+                    field,
+                )
+
+
+@click.command()
+@click.option("--rows", default=100000, show_default=True)
+@click.option("--repeat", default=5, show_default=True)
+def main(rows: int, repeat: int):
+    """Print legacy vs aggregate KPI timings for representative filters."""
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        started = time.perf_counter()
+        _seed(rows)
+        rebuild_search_index(chunk_size=5000)
+        rebuild_kpi_rollup(chunk_size=5000)
+        click.echo(f"seeded {rows} rows in {time.perf_counter() - started:.1f}s")
+
+        click.echo(f"{'params':<58} {'legacy ms':>10} {'live ms':>8} {'rollup ms':>10}")
+        for params in QUERIES:
+            args = MultiDict(params)
+            group_by = params.get("group_by")
+            now = utcnow()
+            if group_by:
+                legacy, legacy_ms = _time(
+                    lambda a=args, g=group_by: _legacy_grouped(a, g), repeat
+                )
+            else:
+                legacy, legacy_ms = _time(lambda a=args: _legacy_kpis(a), repeat)
+            candidates = [
+                _time(
+                    lambda a=args, g=group_by, n=now: _build_live_kpis(a, g, n), repeat
+                )
+            ]
+            if _kpi_rollup_applies(args, group_by):
+                candidates.append(
+                    _time(
+                        lambda a=args, g=group_by, n=now: _build_rollup_kpis(a, g, n),
+                        repeat,
+                    )
+                )
+            for current, _ in candidates:
+                _assert_same(legacy, current, params, group_by)
+            timings = [f"{elapsed:.1f}" for _, elapsed in candidates] + ["-"]
+            click.echo(
+                f"{params!s:<58} {legacy_ms:>10.1f} {timings[0]:>8} {timings[1]:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Measure statements, fetched rows and wall time of the nested process read.
+
+Seeds one evaluation with a synthetic nested payload (steps x failures x
+lots, one process by default) and reads it back with the flat loader and
+through ``GET /api/evaluations/<id>/processes/nested``, once served from the
+snapshot the seeding save materialized and once assembled live. GET counts
+also cover the evaluation lookup, ETag markers and VIEW log. ``--baseline``
+replays the former read, which loaded steps through their ``lazy="joined"``
+failures, lot links and lots relationships: one statement whose result is
+the failures x lot links x lots product per step, de-duplicated by the ORM.
+
+Example:
+    python scripts/benchmark_nested_read.py --steps 100 --failures 50 --lots 5
+    python scripts/benchmark_nested_read.py --database-url postgresql://...
+
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+import click
+from sqlalchemy import delete, event, select
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import create_app, db
+from app.api.evaluation import (
+    _build_nested_payload,
+    _load_nested_payloads,
+)
+from app.models import Evaluation
+from app.models.evaluation import (
+    EvaluationNestedProcess,
+    EvaluationProcessLot,
+    EvaluationProcessRaw,
+    EvaluationProcessStep,
+    EvaluationStepFailure,
+    EvaluationStepLot,
+)
+from app.models.nested_snapshot import EvaluationNestedSnapshot
+from app.models.payload_blob import resolve_payload
+from config import TestingConfig
+
+STEP_CODES = ("M031", "M111", "M130", "AQL")
+
+
+def _payload(processes: int, steps: int, failures: int, lots: int) -> dict:
+    result = []
+    for p in range(processes):
+        lot_ids = [f"p{p}-lot-{index}" for index in range(lots)]
+        result.append(
+            {
+                "key": f"proc-{p}",
+                "name": f"Process {p}",
+                "order_index": p + 1,
+                "result_html": "<p>Synthetic</p>",
+                "lots": [
+                    {"client_id": lot_id, "lot_number": lot_id.upper(), "quantity": 500}
+                    for lot_id in lot_ids
+                ],
+                "steps": [
+                    {
+                        "order_index": s + 1,
+                        "step_code": STEP_CODES[s % len(STEP_CODES)],
+                        "lot_refs": lot_ids,
+                        "total_units": 500 * lots,
+                        "fail_units": failures,
+                        "failures": [
+                            {
+                                "sequence": f + 1,
+                                "serial_number": f"SN{p:02d}{s:04d}{f:04d}",
+                                "fail_code_text": f"F{f % 10:02d}",
+                                "analysis_result": "Open",
+                            }
+                            for f in range(failures)
+                        ],
+                    }
+                    for s in range(steps)
+                ],
+            }
+        )
+    return {"processes": result}
+
+
+def _legacy_read(evaluation_id: int) -> tuple[dict, list[str]]:
+    """Former read: ORM steps with their joined relationships."""
+    lots = (
+        EvaluationProcessLot.query.filter_by(evaluation_id=evaluation_id)
+        .order_by(EvaluationProcessLot.id.asc())
+        .all()
+    )
+    steps = (
+        EvaluationProcessStep.query.filter_by(evaluation_id=evaluation_id)
+        .order_by(
+            EvaluationProcessStep.order_index.asc(), EvaluationProcessStep.id.asc()
+        )
+        .all()
+    )
+    nested_processes = (
+        EvaluationNestedProcess.query.filter_by(evaluation_id=evaluation_id)
+        .order_by(EvaluationNestedProcess.order_index.asc())
+        .all()
+    )
+    latest_raw = (
+        EvaluationProcessRaw.query.filter_by(evaluation_id=evaluation_id)
+        .order_by(EvaluationProcessRaw.created_at.desc())
+        .first()
+    )
+    return _build_nested_payload(
+        lots,
+        steps,
+        nested_processes,
+        resolve_payload(latest_raw.payload, latest_raw.payload_hash)
+        if latest_raw
+        else None,
+        {step.id: [link.lot_id for link in step.lot_assignments] for step in steps},
+        {
+            step.id: sorted(step.failures, key=lambda failure: failure.sequence)
+            for step in steps
+        },
+    )
+
+
+def _legacy_rows(evaluation_id: int) -> int:
+    """Rows the joined step statement returns before ORM de-duplication."""
+    statement = select(EvaluationProcessStep).where(
+        EvaluationProcessStep.evaluation_id == evaluation_id
+    )
+    return len(db.session.connection().execute(statement).all())
+
+
+def _flat_rows(evaluation_id: int) -> int:
+    step_ids = select(EvaluationProcessStep.id).where(
+        EvaluationProcessStep.evaluation_id == evaluation_id
+    )
+    return sum(
+        db.session.execute(select(db.func.count()).where(condition)).scalar()
+        for condition in (
+            EvaluationProcessLot.evaluation_id == evaluation_id,
+            EvaluationProcessStep.evaluation_id == evaluation_id,
+            EvaluationStepLot.step_id.in_(step_ids),
+            EvaluationStepFailure.step_id.in_(step_ids),
+            EvaluationNestedProcess.evaluation_id == evaluation_id,
+        )
+    )
+
+
+def _measure(counter: list[int], action, repeat: int) -> tuple[int, float]:
+    timings = []
+    for _ in range(repeat):
+        counter[0] = 0
+        db.session.expunge_all()
+        started = time.perf_counter()
+        action()
+        timings.append((time.perf_counter() - started) * 1000)
+    return counter[0], statistics.median(timings)
+
+
+@click.command()
+@click.option("--processes", default=1, show_default=True)
+@click.option("--steps", default=100, show_default=True, help="Steps per process.")
+@click.option("--failures", default=50, show_default=True, help="Failures per step.")
+@click.option("--lots", default=5, show_default=True, help="Lots per process.")
+@click.option("--repeat", default=5, show_default=True, help="Runs per scenario.")
+@click.option("--baseline/--no-baseline", default=True, show_default=True)
+@click.option("--database-url", default=None, help="Scratch MySQL/PostgreSQL URL.")
+def main(processes, steps, failures, lots, repeat, baseline, database_url):
+    """Print statements, fetched rows and median wall time per read path."""
+    if database_url:
+        TestingConfig.SQLALCHEMY_DATABASE_URI = database_url
+    app = create_app("testing")
+    app.config["REQUEST_METRICS_ENABLED"] = False
+    counter = [0]
+
+    with app.app_context():
+        db.create_all()
+        evaluation = Evaluation(
+            evaluation_number=f"EV-NESTED-READ-{int(time.time())}",
+            evaluation_type="new_product",
+            product_name="Nested Read Bench",
+            part_number="PN-NESTED",
+            start_date=date(2026, 1, 5),
+            process_step="M031",
+        )
+        db.session.add(evaluation)
+        db.session.commit()
+        evaluation_id = evaluation.id
+
+        client = app.test_client()
+        url = f"/api/evaluations/{evaluation_id}/processes/nested"
+        saved = client.post(url, json=_payload(processes, steps, failures, lots))
+        saved.close()
+        if saved.status_code != 200:
+            raise click.ClickException(f"Seeding failed: {saved.status_code}")
+
+        @event.listens_for(db.engine, "before_cursor_execute")
+        def _count(*_args):
+            counter[0] += 1
+
+        def _get():
+            client.get(url).close()
+
+        def _drop_snapshot():
+            db.session.execute(delete(EvaluationNestedSnapshot))
+            db.session.commit()
+
+        click.echo(
+            f"{db.engine.dialect.name}: {processes} processes x {steps} steps x "
+            f"{failures} failures x {lots} lots"
+        )
+
+        flat_rows = _flat_rows(evaluation_id)
+        scenarios = [
+            (
+                "flat read",
+                None,
+                lambda: _load_nested_payloads([evaluation_id]),
+                flat_rows,
+            ),
+            ("GET snapshot", None, _get, 1),
+            ("GET live assembly", _drop_snapshot, _get, flat_rows),
+        ]
+        if baseline:
+            scenarios.append(
+                (
+                    "baseline joined read",
+                    None,
+                    lambda: _legacy_read(evaluation_id),
+                    _legacy_rows(evaluation_id),
+                )
+            )
+        for name, setup, action, rows in scenarios:
+            if setup is not None:
+                setup()
+            statements, elapsed = _measure(counter, action, repeat)
+            click.echo(
+                f"{name:<22} {statements:>4} statements {rows:>9,} rows "
+                f"{elapsed:>9.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Measure statements and wall time of the nested process save.
+
+Saves a synthetic payload (processes x steps x failures) through
+``POST /api/evaluations/<id>/processes/nested`` and reports, per scenario,
+the SQL statements issued (an executemany counts once) and the wall time.
+``--baseline`` replays the former write loop, one flush per step, on the
+same normalized payload for comparison.
+
+Runs on in-memory SQLite by default; pass ``--database-url`` with a scratch
+MySQL or PostgreSQL database to measure those dialects (tables are created
+in it). The per-dialect line shows how many INSERT round trips a first save
+needs: dialects without ``RETURNING`` on executemany (MySQL) fetch lot and
+step ids row by row.
+
+Example:
+    python scripts/benchmark_nested_save.py --steps 200 --failures 20
+    python scripts/benchmark_nested_save.py --database-url postgresql://...
+
+"""
+
+from __future__ import annotations
+
+import copy
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+import click
+from sqlalchemy import event
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import create_app, db
+from app.api.evaluation import _normalize_nested_payload
+from app.models import Evaluation
+from app.models.evaluation import (
+    EvaluationProcessLot,
+    EvaluationProcessStep,
+    EvaluationStepFailure,
+    EvaluationStepLot,
+    FailCode,
+)
+from config import TestingConfig
+
+STEP_CODES = ("M031", "M111", "M130", "AQL")
+
+
+def _payload(processes: int, steps: int, failures: int, lots: int) -> dict:
+    result = []
+    for p in range(processes):
+        lot_ids = [f"p{p}-lot-{index}" for index in range(lots)]
+        result.append(
+            {
+                "key": f"proc-{p}",
+                "name": f"Process {p}",
+                "order_index": p + 1,
+                "result_html": "<p>Synthetic</p>",
+                "lots": [
+                    {"client_id": lot_id, "lot_number": lot_id.upper(), "quantity": 500}
+                    for lot_id in lot_ids
+                ],
+                "steps": [
+                    {
+                        "order_index": s + 1,
+                        "step_code": STEP_CODES[s % len(STEP_CODES)],
+                        "lot_refs": lot_ids,
+                        "total_units": 500 * lots,
+                        "fail_units": failures,
+                        "failures": [
+                            {
+                                "sequence": f + 1,
+                                "serial_number": f"SN{p:02d}{s:04d}{f:04d}",
+                                "fail_code_text": f"F{f % 10:02d}",
+                                "analysis_result": "Open",
+                            }
+                            for f in range(failures)
+                        ],
+                    }
+                    for s in range(steps)
+                ],
+            }
+        )
+    return {"processes": result}
+
+
+def _legacy_save(evaluation_id: int, payload: dict) -> None:
+    """Former write loop: ORM rows with one flush per step, one fail code
+    lookup per failure."""
+    warnings: list[str] = []
+    for process in _normalize_nested_payload(payload, warnings)["processes"]:
+        lot_records = {}
+        for entry in process["lots"]:
+            record = EvaluationProcessLot(
+                evaluation_id=evaluation_id,
+                lot_number=entry["lot_number"],
+                quantity=entry["quantity"],
+                process_key=process["key"],
+                client_id=entry["client_id"],
+            )
+            db.session.add(record)
+            lot_records[entry["alias"]] = record
+        db.session.flush()
+        for step_data in process["steps"]:
+            step = EvaluationProcessStep(
+                evaluation_id=evaluation_id,
+                lot_number="MULTI",
+                quantity=0,
+                order_index=step_data["order_index"],
+                step_code=step_data["step_code"],
+                process_key=process["key"],
+            )
+            db.session.add(step)
+            db.session.flush()
+            for alias in step_data["lot_aliases"]:
+                db.session.add(
+                    EvaluationStepLot(step_id=step.id, lot_id=lot_records[alias].id)
+                )
+            for failure in step_data["failures"]:
+                fail_code = FailCode.query.filter_by(
+                    code=failure["fail_code_text"]
+                ).first()
+                db.session.add(
+                    EvaluationStepFailure(
+                        step_id=step.id,
+                        sequence=failure["sequence"],
+                        serial_number=failure["serial_number"],
+                        fail_code_id=fail_code.id if fail_code else None,
+                        fail_code_text=failure["fail_code_text"],
+                    )
+                )
+    db.session.commit()
+
+
+def _evaluation(number: str) -> int:
+    evaluation = Evaluation(
+        evaluation_number=number,
+        evaluation_type="new_product",
+        product_name="Nested Bench",
+        part_number="PN-NESTED",
+        start_date=date(2026, 1, 5),
+        process_step="M031",
+    )
+    db.session.add(evaluation)
+    db.session.commit()
+    return evaluation.id
+
+
+def _measure(counter: list[int], action) -> tuple[int, float]:
+    counter[0] = 0
+    started = time.perf_counter()
+    action()
+    return counter[0], (time.perf_counter() - started) * 1000
+
+
+@click.command()
+@click.option("--processes", default=2, show_default=True)
+@click.option("--steps", default=100, show_default=True, help="Steps per process.")
+@click.option("--failures", default=20, show_default=True, help="Failures per step.")
+@click.option("--lots", default=3, show_default=True, help="Lots per process.")
+@click.option("--baseline/--no-baseline", default=True, show_default=True)
+@click.option("--database-url", default=None, help="Scratch MySQL/PostgreSQL URL.")
+def main(processes, steps, failures, lots, baseline, database_url):
+    """Print statements and wall time per nested save scenario."""
+    if database_url:
+        TestingConfig.SQLALCHEMY_DATABASE_URI = database_url
+    app = create_app("testing")
+    app.config["REQUEST_METRICS_ENABLED"] = False
+    payload = _payload(processes, steps, failures, lots)
+    counter = [0]
+
+    with app.app_context():
+        db.create_all()
+
+        @event.listens_for(db.engine, "before_cursor_execute")
+        def _count(*_args):
+            counter[0] += 1
+
+        client = app.test_client()
+        evaluation_id = _evaluation(f"EV-NESTED-{int(time.time())}")
+        url = f"/api/evaluations/{evaluation_id}/processes/nested"
+
+        edited = copy.deepcopy(payload)
+        edited["processes"][0]["steps"][0]["failures"][0]["analysis_result"] = "Fixed"
+        scenarios = [
+            ("first save", lambda: client.post(url, json=payload)),
+            ("unchanged resave", lambda: client.post(url, json=payload)),
+            ("one failure edited", lambda: client.post(url, json=edited)),
+        ]
+        if baseline:
+            legacy_id = _evaluation(f"EV-NESTED-LEGACY-{int(time.time())}")
+            scenarios.append(
+                ("baseline first save", lambda: _legacy_save(legacy_id, payload))
+            )
+
+        rows = processes * steps * (1 + lots + failures)
+        click.echo(
+            f"{db.engine.dialect.name}: {processes} processes x {steps} steps x "
+            f"{failures} failures ({rows:,} step/link/failure rows)"
+        )
+        for name, action in scenarios:
+            statements, elapsed = _measure(counter, action)
+            click.echo(f"{name:<22} {statements:>7,} statements {elapsed:>9.1f} ms")
+
+        new_ids = processes * (lots + steps)
+        for dialect in (sqlite.dialect(), postgresql.dialect(), mysql.dialect()):
+            returning = dialect.insert_executemany_returning_sort_by_parameter_order
+            trips = (2 if returning else new_ids) + 2
+            click.echo(f"{dialect.name:<11} first-save INSERT round trips: {trips:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compare trigram-indexed substring filters with plain ILIKE scans.
+
+Seeds an in-memory SQLite database with evaluations, builds the search index and
+times the evaluation list filters with and without the token table.
+
+Example:
+    python scripts/benchmark_search_index.py --rows 100000
+
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import click
+from werkzeug.datastructures import MultiDict
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app import create_app, db
+from app.api.evaluation import _apply_evaluation_base_filters
+from app.models import Evaluation
+from app.models.search_index import rebuild_search_index
+
+QUERIES = (
+    {"product": "orion-77"},
+    {"evaluation_number": "EV-2025-04312"},
+    {"scs_charger_name": "park min"},
+    {"product": "vega", "head_office_charger_name": "choi"},
+)
+SURNAMES = ("Kim", "Lee", "Park", "Choi", "Jung", "Kang", "Cho", "Yoon")
+GIVEN = ("Min", "Seo", "Ji", "Hyun", "Woo", "Jae", "Eun", "Soo")
+PRODUCTS = ("Orion", "Vega", "Lyra", "Draco", "Hydra", "Cetus", "Auriga")
+
+
+def _seed(rows: int) -> None:
+    rng = random.Random(7)
+    base = date(2024, 1, 1)
+    batch = []
+    for index in range(rows):
+        batch.append(
+            {
+                "evaluation_number": f"EV-2025-{index:05d}",
+                "evaluation_type": "new_product",
+                "product_name": f"{rng.choice(PRODUCTS)}-{rng.randint(1, 999)}",
+                "part_number": f"PN-{index:06d}",
+                "status": "in_progress",
+                "start_date": base + timedelta(days=index % 600),
+                "scs_charger_name": f"{rng.choice(SURNAMES)} {rng.choice(GIVEN)}",
+                "head_office_charger_name": f"{rng.choice(SURNAMES)} {rng.choice(GIVEN)}",
+            }
+        )
+        if len(batch) == 5000:
+            db.session.execute(Evaluation.__table__.insert(), batch)
+            batch = []
+    if batch:
+        db.session.execute(Evaluation.__table__.insert(), batch)
+    db.session.commit()
+
+
+def _plain_filters(query, args):
+    for key, column in (
+        ("product", Evaluation.product_name),
+        ("evaluation_number", Evaluation.evaluation_number),
+        ("scs_charger_name", Evaluation.scs_charger_name),
+        ("head_office_charger_name", Evaluation.head_office_charger_name),
+    ):
+        if args.get(key):
+            query = query.filter(column.ilike(f"%{args[key]}%"))
+    return query
+
+
+def _time(build, repeat: int) -> tuple[int, float]:
+    timings = []
+    count = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = build().with_entities(Evaluation.id).count()
+        timings.append((time.perf_counter() - started) * 1000)
+    return count, statistics.median(timings)
+
+
+@click.command()
+@click.option("--rows", default=100000, show_default=True)
+@click.option("--repeat", default=5, show_default=True)
+def main(rows: int, repeat: int):
+    """Print ILIKE vs trigram-index timings for representative filters."""
+    app = create_app("testing")
+    with app.app_context():
+        db.create_all()
+        started = time.perf_counter()
+        _seed(rows)
+        indexed = rebuild_search_index(chunk_size=5000)
+        click.echo(
+            f"seeded and indexed {indexed} rows in {time.perf_counter() - started:.1f}s"
+        )
+
+        click.echo(f"{'filters':<52} {'rows':>6} {'ilike ms':>9} {'index ms':>9}")
+        for params in QUERIES:
+            args = MultiDict(params)
+            plain_count, plain_ms = _time(
+                lambda a=args: _plain_filters(Evaluation.query, a), repeat
+            )
+            index_count, index_ms = _time(
+                lambda a=args: _apply_evaluation_base_filters(Evaluation.query, a),
+                repeat,
+            )
+            assert plain_count == index_count, params
+            click.echo(
+                f"{params!s:<52} {index_count:>6} {plain_ms:>9.1f} {index_ms:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
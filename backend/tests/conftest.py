@@ -1,6 +1,7 @@
 """Pytest configuration file for the backend tests."""
 
 import os
+import tempfile
 
 import pytest
 
@@ -24,6 +25,7 @@ def app():
             "SQLALCHEMY_TRACK_MODIFICATIONS": False,
             "JWT_SECRET_KEY": "test-secret-key",
             "PRESERVE_CONTEXT_ON_EXCEPTION": False,
+            "UPLOAD_FOLDER": tempfile.mkdtemp(prefix="eval-uploads-"),
         }
     )
 
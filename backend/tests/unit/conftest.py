@@ -12,3 +12,23 @@ def pytest_collection_modifyitems(
     for item in items:
         if "tests/unit" in str(item.fspath):
             item.add_marker(pytest.mark.unit)
+
+
+@pytest.fixture
+def view_log_mode(session):
+    """Set the VIEW log policy for one test and restore the default after it."""
+    from app.models.system_config import SystemConfig
+
+    keys = ("view_log_mode", "view_log_sample_rate")
+
+    def _set(mode: str, sample_rate: float | None = None) -> None:
+        SystemConfig.set_config("view_log_mode", mode)
+        if sample_rate is not None:
+            SystemConfig.set_config("view_log_sample_rate", sample_rate, "float")
+
+    yield _set
+
+    SystemConfig.query.filter(SystemConfig.config_key.in_(keys)).delete(
+        synchronize_session=False
+    )
+    session.commit()
@@ -0,0 +1,73 @@
+"""Unit tests for update audit log patches."""
+
+import json
+
+from app.models.operation_log import OperationLog, OperationType
+from app.services.blob_store import BlobStore
+from app.utils.audit_diff import expand_patch, make_patch
+from tests.helpers import create_test_evaluation, json_response
+
+RICH_TEXT = "<p>" + "Long evaluation notes. " * 200 + "</p>"
+
+
+def test_patch_keeps_changed_fields_and_references_large_values(app):
+    old = {"status": "in_progress", "remarks": RICH_TEXT, "legacy": 1}
+    new = {"status": "completed", "remarks": RICH_TEXT, "added": [1, 2]}
+
+    patch = make_patch(old, new)
+
+    assert patch["changed"] == {
+        "status": {"old": "in_progress", "new": "completed"},
+        "legacy": {"old": 1},
+        "added": {"new": [1, 2]},
+    }
+    reference = patch["same"]["remarks"]["$ref"]
+    assert BlobStore.exists(reference)
+    assert len(json.dumps(patch)) < len(RICH_TEXT)
+    assert expand_patch(patch) == (old, new)
+
+
+def test_operation_log_to_dict_returns_changes_or_snapshots(app):
+    old = {"status": "in_progress", "remarks": RICH_TEXT}
+    new = {"status": "completed", "remarks": RICH_TEXT}
+    log = OperationLog(
+        OperationType.UPDATE.value, "evaluation", new_data=make_patch(old, new)
+    )
+
+    compact = log.to_dict()
+    assert compact["old_data"] == {"status": "in_progress"}
+    assert compact["new_data"] == {"status": "completed"}
+
+    full = log.to_dict(snapshots=True)
+    assert full["old_data"] == old
+    assert full["new_data"] == new
+
+
+def test_update_evaluation_logs_a_patch(client, session):
+    evaluation = create_test_evaluation(session, product_name="Audit Diff Product")
+    url = f"/api/evaluations/{evaluation.id}"
+    assert client.put(url, json={"remarks": "first"}).status_code == 200
+
+    stored = (
+        OperationLog.query.filter_by(
+            target_type="evaluation",
+            target_id=evaluation.id,
+            operation_type=OperationType.UPDATE.value,
+        )
+        .one()
+        .new_data
+    )
+    assert "remarks" in stored["changed"]
+    assert stored["same"]["product_name"] == "Audit Diff Product"
+
+    logs = json_response(client.get(f"{url}/logs"))["data"]["logs"]
+    update = next(log for log in logs if log["operation_type"] == "update")
+    assert update["new_data"]["remarks"] == "first"
+    assert "product_name" not in update["new_data"]
+
+    full = json_response(client.get(f"{url}/logs", query_string={"snapshots": "full"}))
+    update = next(
+        log for log in full["data"]["logs"] if log["operation_type"] == "update"
+    )
+    assert update["old_data"]["product_name"] == "Audit Diff Product"
+    assert update["new_data"]["remarks"] == "first"
@@ -0,0 +1,139 @@
+"""Unit tests for the blob store and blob API."""
+
+import base64
+import os
+import threading
+import time
+
+from app.models.evaluation import Evaluation
+from app.services.blob_store import BlobStore
+from tests.helpers import json_response
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64 + b"pgm-login"
+PNG_DATA_URL = "data:image/png;base64," + base64.b64encode(PNG_BYTES).decode()
+
+
+def _create_with_image(client, image=PNG_DATA_URL, part_number="BLOB-001"):
+    response = client.post(
+        "/api/evaluations",
+        json={
+            "evaluation_type": "new_product",
+            "product_name": "Blob Product",
+            "part_number": part_number,
+            "start_date": "2026-03-23",
+            "process_step": "M031",
+            "pgm_login_image": image,
+        },
+    )
+    return response, json_response(response)
+
+
+def test_blob_store_dedupes_identical_content(app):
+    first = BlobStore.put(PNG_BYTES)
+    second = BlobStore.put_data_url(PNG_DATA_URL)
+
+    assert first == second
+    assert BlobStore.exists(first)
+    assert BlobStore.content_type(first) == "image/png"
+    assert BlobStore.to_data_url(first) == PNG_DATA_URL
+
+
+def test_blob_url_outside_a_request_is_a_path(app):
+    """CLI and script callers get a path instead of a url_for RuntimeError."""
+    digest = BlobStore.put(PNG_BYTES)
+    urls = []
+
+    def _serialize():
+        # A new thread starts without the request context pytest-flask pushes.
+        with app.app_context():
+            urls.append(BlobStore.url_for(digest))
+
+    thread = threading.Thread(target=_serialize)
+    thread.start()
+    thread.join()
+
+    assert urls == [f"/api/blobs/{digest}"]
+
+
+def test_create_evaluation_stores_image_reference(client, session):
+    response, body = _create_with_image(client)
+
+    assert response.status_code == 201
+    evaluation = body["data"]["evaluation"]
+    digest = evaluation["pgm_login_image_ref"]
+    assert BlobStore.is_ref(digest)
+    assert evaluation["pgm_login_image"].endswith(f"/api/blobs/{digest}")
+
+    created = session.get(Evaluation, evaluation["id"])
+    assert created.pgm_login_image_ref == digest
+
+    _, other = _create_with_image(client, part_number="BLOB-002")
+    assert other["data"]["evaluation"]["pgm_login_image_ref"] == digest
+
+
+def test_blob_route_serves_immutable_content_with_ranges(client):
+    digest = BlobStore.put(PNG_BYTES)
+
+    response = client.get(f"/api/blobs/{digest}")
+    assert response.status_code == 200
+    assert response.data == PNG_BYTES
+    assert response.mimetype == "image/png"
+    assert "immutable" in response.headers["Cache-Control"]
+    assert response.headers["ETag"] == f'"{digest}"'
+
+    response = client.get(f"/api/blobs/{digest}", headers={"Range": "bytes=0-7"})
+    assert response.status_code == 206
+    assert response.data == PNG_BYTES[:8]
+
+    response = client.get(
+        f"/api/blobs/{digest}", headers={"If-None-Match": f'"{digest}"'}
+    )
+    assert response.status_code == 304
+
+    assert client.get(f"/api/blobs/{'0' * 64}").status_code == 404
+
+
+def test_update_evaluation_keeps_round_tripped_image_url(client, session):
+    _, body = _create_with_image(client, part_number="BLOB-003")
+    evaluation = body["data"]["evaluation"]
+
+    response = client.put(
+        f"/api/evaluations/{evaluation['id']}",
+        json={"pgm_login_image": evaluation["pgm_login_image"]},
+    )
+    assert response.status_code == 200
+    updated = json_response(response)["data"]["evaluation"]
+    assert updated["pgm_login_image_ref"] == evaluation["pgm_login_image_ref"]
+
+    response = client.put(
+        f"/api/evaluations/{evaluation['id']}", json={"pgm_login_image": ""}
+    )
+    assert json_response(response)["data"]["evaluation"]["pgm_login_image"] is None
+
+
+def test_evaluation_rejects_invalid_image_values(client):
+    response, body = _create_with_image(client, image="not base64 at all!")
+    assert response.status_code == 400
+    assert body["success"] is False
+
+    response, _ = _create_with_image(client, image=f"/api/blobs/{'f' * 64}")
+    assert response.status_code == 400
+
+
+def test_prune_blobs_keeps_referenced_and_recent_files(client, session):
+    _, body = _create_with_image(client, part_number="BLOB-PRUNE")
+    kept = body["data"]["evaluation"]["pgm_login_image_ref"]
+    orphan = BlobStore.put(b"orphaned upload")
+    recent = BlobStore.put(b"upload still in flight")
+    hour_ago = time.time() - 3600
+    for digest in (kept, orphan):
+        os.utime(BlobStore.path_for(digest), (hour_ago, hour_ago))
+
+    deleted, freed = BlobStore.collect_garbage(grace_seconds=600)
+
+    assert deleted >= 1
+    assert freed >= len(b"orphaned upload")
+    assert not BlobStore.exists(orphan)
+    assert not os.path.exists(f"{BlobStore.path_for(orphan)}.json")
+    assert BlobStore.exists(kept)
+    assert BlobStore.exists(recent)
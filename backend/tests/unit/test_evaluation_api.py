@@ -469,6 +469,58 @@ def test_evaluation_kpis_returns_global_operational_metrics(client, session):
     }
 
 
+def test_evaluation_kpis_group_by_returns_per_group_metrics(client, session):
+    """group_by should return per-group KPIs whose counters sum to the totals."""
+    today = utcnow().date()
+    for number, evaluation_type, status, age in (
+        ("EV-KPI-GROUP-1", "new_product", "in_progress", 2),
+        ("EV-KPI-GROUP-2", "new_product", "in_progress", 6),
+        ("EV-KPI-GROUP-3", "new_product", "in_progress", 15),
+        ("EV-KPI-GROUP-4", "new_product", "in_progress", 30),
+        ("EV-KPI-GROUP-5", "mass_production", "in_progress", 11),
+        ("EV-KPI-GROUP-6", "mass_production", "completed", 3),
+    ):
+        create_test_evaluation(
+            session,
+            evaluation_number=number,
+            evaluation_type=evaluation_type,
+            product_name="Grouped KPI Product",
+            status=status,
+            start_date=today - timedelta(days=age),
+        )
+
+    response = client.get(
+        "/api/evaluations/kpis?product=Grouped KPI Product&group_by=evaluation_type"
+    )
+    body = json_response(response)
+
+    assert response.status_code == 200
+    data = body["data"]
+    assert data["group_by"] == "evaluation_type"
+    assert data["total_evaluations"] == 6
+    assert data["open_evaluations"] == 5
+    assert data["open_over_10d"] == 3
+    assert data["median_open_age_days"] == 11.0
+    groups = {group["key"]: group for group in data["groups"]}
+    assert [group["key"] for group in data["groups"]] == [
+        "new_product",
+        "mass_production",
+    ]
+    assert groups["new_product"]["open_evaluations"] == 4
+    assert groups["new_product"]["median_open_age_days"] == 10.5
+    assert groups["mass_production"]["total_evaluations"] == 2
+    assert groups["mass_production"]["open_over_10d"] == 1
+    assert groups["mass_production"]["median_open_age_days"] == 11.0
+
+
+def test_evaluation_kpis_rejects_unknown_group_by(client, session):
+    """An unsupported group_by column should be a 400."""
+    response = client.get("/api/evaluations/kpis?group_by=remarks")
+
+    assert response.status_code == 400
+    assert json_response(response)["success"] is False
+
+
 def test_evaluation_list_operational_view_all_active(client, session):
     """The all_active operational view should return only active evaluations."""
     create_test_evaluation(
@@ -601,3 +653,273 @@ def test_evaluation_list_operational_view_all(client, session):
     assert response.status_code == 200
     numbers = {row["evaluation_number"] for row in body["data"]["evaluations"]}
     assert numbers == {"EV-ALL-ACTIVE", "EV-ALL-COMPLETE", "EV-ALL-CANCELLED"}
+
+
+def _collect_cursor_pages(client, params):
+    seen = []
+    cursor = None
+    for _ in range(20):
+        query = dict(params, pagination="cursor")
+        if cursor:
+            query["cursor"] = cursor
+        body = json_response(client.get("/api/evaluations", query_string=query))
+        assert body["success"] is True
+        seen.extend(item["id"] for item in body["data"]["evaluations"])
+        cursor = body["data"]["next_cursor"]
+        assert body["data"]["has_more"] is (cursor is not None)
+        if cursor is None:
+            return seen
+    raise AssertionError("cursor pagination did not terminate")
+
+
+def test_evaluation_list_cursor_pagination_matches_offset_order(client, session):
+    product = "Cursor Walk Product"
+    base = date(2026, 1, 1)
+    for index in range(7):
+        create_test_evaluation(
+            session,
+            product_name=product,
+            start_date=base + timedelta(days=index % 3),
+            actual_end_date=(base + timedelta(days=index)) if index % 2 else None,
+        )
+
+    for sort_by, sort_order in [
+        (None, None),
+        ("start_date", "asc"),
+        ("actual_end_date", "desc"),
+        ("status", "asc"),
+    ]:
+        params = {"product": product, "per_page": 2}
+        if sort_by:
+            params.update(sort_by=sort_by, sort_order=sort_order)
+        offset_body = json_response(
+            client.get("/api/evaluations", query_string=dict(params, per_page=100))
+        )
+        cursor_ids = _collect_cursor_pages(client, params)
+
+        assert len(cursor_ids) == 7
+        assert len(set(cursor_ids)) == 7
+        if sort_by != "actual_end_date":
+            # Offset mode leaves NULL placement to the database.
+            assert cursor_ids == [
+                item["id"] for item in offset_body["data"]["evaluations"]
+            ]
+
+
+def test_evaluation_list_cursor_total_is_optional(client, session):
+    product = "Cursor Total Product"
+    for _ in range(3):
+        create_test_evaluation(session, product_name=product)
+
+    response = client.get(
+        "/api/evaluations",
+        query_string={"product": product, "pagination": "cursor", "per_page": 2},
+    )
+    body = json_response(response)
+    assert response.status_code == 200
+    assert body["data"]["total"] is None
+    assert len(body["data"]["evaluations"]) == 2
+    assert "page" not in body["data"]
+
+    response = client.get(
+        "/api/evaluations",
+        query_string={
+            "product": product,
+            "pagination": "cursor",
+            "include_total": "true",
+        },
+    )
+    assert json_response(response)["data"]["total"] == 3
+
+
+def test_evaluation_list_cursor_rejects_invalid_tokens(client, session):
+    product = "Cursor Invalid Product"
+    for _ in range(2):
+        create_test_evaluation(session, product_name=product)
+
+    response = client.get("/api/evaluations", query_string={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+    first = json_response(
+        client.get(
+            "/api/evaluations",
+            query_string={
+                "product": product,
+                "pagination": "cursor",
+                "per_page": 1,
+                "sort_by": "start_date",
+            },
+        )
+    )
+    response = client.get(
+        "/api/evaluations",
+        query_string={
+            "product": product,
+            "cursor": first["data"]["next_cursor"],
+            "sort_by": "product_name",
+        },
+    )
+    assert response.status_code == 400
+    assert json_response(response)["success"] is False
+
+
+def test_evaluation_list_summary_view_omits_heavy_columns(client, session):
+    product = "Summary View Product"
+    create_test_evaluation(
+        session,
+        product_name=product,
+        remarks="long remarks",
+        pgm_login_image="data:image/png;base64,AAAA",
+    )
+
+    response = client.get(
+        "/api/evaluations", query_string={"product": product, "view": "summary"}
+    )
+    body = json_response(response)
+
+    assert response.status_code == 200
+    item = body["data"]["evaluations"][0]
+    assert set(item) == set(Evaluation.SUMMARY_FIELDS)
+    assert item["start_date"] == date.today().isoformat()
+    assert body["data"]["total"] == 1
+
+    cursor_body = json_response(
+        client.get(
+            "/api/evaluations",
+            query_string={
+                "product": product,
+                "view": "summary",
+                "pagination": "cursor",
+                "sort_by": "start_date",
+            },
+        )
+    )
+    assert set(cursor_body["data"]["evaluations"][0]) == set(Evaluation.SUMMARY_FIELDS)
+
+
+def test_evaluation_list_fields_projection_batch_loads_nand_info(client, session):
+    created = json_response(
+        client.post(
+            "/api/evaluations",
+            json={
+                "evaluation_type": "mass_production",
+                "product_name": "Projection NAND Product",
+                "part_number": "NAND-PROJ",
+                "start_date": "2026-03-23",
+                "process_step": "M031",
+                "evaluation_reason": "nand",
+                "nand_info": {
+                    "dr_generation": "V7",
+                    "product_code": "BG",
+                    "milestone_date": "2026-04-06",
+                    "milestone_status": "approved",
+                    "evaluation_item": "S3 approval",
+                    "fab_line": "X1L",
+                    "applied_products": ["PM9A1"],
+                    "grades": ["Lv4"],
+                },
+            },
+        )
+    )
+    full = created["data"]["evaluation"]
+
+    response = client.get(
+        "/api/evaluations",
+        query_string={
+            "product": "Projection NAND Product",
+            "fields": "evaluation_number,nand_info",
+        },
+    )
+    item = json_response(response)["data"]["evaluations"][0]
+
+    assert set(item) == {"id", "evaluation_number", "nand_info"}
+    assert item["evaluation_number"] == full["evaluation_number"]
+    assert item["nand_info"] == full["nand_info"]
+
+
+def test_evaluation_list_rejects_unknown_fields(client):
+    response = client.get("/api/evaluations", query_string={"fields": "id,secret"})
+    assert response.status_code == 400
+    assert "secret" in json_response(response)["message"]
+
+    response = client.get("/api/evaluations", query_string={"view": "compact"})
+    assert response.status_code == 400
+
+
+def test_evaluation_logs_report_aggregated_view_activity(client, session):
+    """GET /logs should summarize views without one log row per page load."""
+    evaluation = create_test_evaluation(session, product_name="View Counter Product")
+    for _ in range(3):
+        assert client.get(f"/api/evaluations/{evaluation.id}").status_code == 200
+    assert (
+        client.get(f"/api/evaluations/{evaluation.id}/processes/nested").status_code
+        == 200
+    )
+
+    data = json_response(client.get(f"/api/evaluations/{evaluation.id}/logs"))["data"]
+
+    assert all(log["operation_type"] != "view" for log in data["logs"])
+    activity = data["view_activity"]
+    assert activity["total_views"] == 4
+    assert activity["unique_ips"] == 1
+    assert {row["target_type"]: row["views"] for row in activity["hourly"]} == {
+        "evaluation": 3,
+        "evaluation_nested_process": 1,
+    }
+
+
+def test_evaluation_logs_are_cursor_paginated_and_filtered(
+    client, session, view_log_mode
+):
+    """GET /logs should page newest first and honour types/exclude_views."""
+    view_log_mode("full")
+    evaluation = create_test_evaluation(session, product_name="Log Page Product")
+    url = f"/api/evaluations/{evaluation.id}"
+    for index in range(3):
+        assert client.put(url, json={"remarks": f"r{index}"}).status_code == 200
+    assert client.get(url).status_code == 200
+
+    everything = json_response(client.get(f"{url}/logs"))["data"]["logs"]
+    assert [log["operation_type"] for log in everything] == [
+        "view",
+        "update",
+        "update",
+        "update",
+    ]
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"per_page": 3, "exclude_views": "true"}
+        if cursor:
+            params["cursor"] = cursor
+        page = json_response(client.get(f"{url}/logs", query_string=params))["data"]
+        seen.extend(page["logs"])
+        cursor = page["next_cursor"]
+        assert page["has_more"] is (cursor is not None)
+        if cursor is None:
+            break
+    assert [log["id"] for log in seen] == [log["id"] for log in everything[1:]]
+
+    views = json_response(client.get(f"{url}/logs", query_string={"types": "view"}))
+    assert [log["id"] for log in views["data"]["logs"]] == [everything[0]["id"]]
+    assert client.get(f"{url}/logs", query_string={"types": "bogus"}).status_code == 400
+    assert client.get(f"{url}/logs", query_string={"cursor": "!!"}).status_code == 400
+
+
+def test_evaluation_detail_caps_embedded_logs(client, session):
+    """GET /<id> should embed only the newest logs and link to /logs."""
+    evaluation = create_test_evaluation(session, product_name="Log Cap Product")
+    url = f"/api/evaluations/{evaluation.id}"
+    for index in range(3):
+        assert client.put(url, json={"remarks": f"r{index}"}).status_code == 200
+
+    data = json_response(client.get(url, query_string={"log_limit": 2}))["data"]
+    evaluation_data = data["evaluation"]
+
+    assert len(evaluation_data["logs"]) == 2
+    assert evaluation_data["logs_url"] == f"{url}/logs"
+    timeline = json_response(client.get(f"{url}/logs"))["data"]["logs"]
+    assert [log["id"] for log in evaluation_data["logs"]] == [
+        log["id"] for log in timeline if log["target_type"] == "evaluation"
+    ][:2]
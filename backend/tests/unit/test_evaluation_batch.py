@@ -0,0 +1,155 @@
+"""Unit tests for batch evaluation loading and ``include=`` expansion."""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.models import db
+from tests.helpers import create_test_evaluation, json_response
+
+NESTED_PAYLOAD = {
+    "processes": [
+        {
+            "key": "proc-batch",
+            "name": "Batch Process",
+            "order_index": 1,
+            "lots": [
+                {
+                    "client_id": "batch-lot",
+                    "temp_id": "batch-lot",
+                    "lot_number": "LOT-BATCH",
+                    "quantity": 2,
+                }
+            ],
+            "steps": [
+                {
+                    "order_index": 1,
+                    "step_code": "M130",
+                    "step_label": "LI",
+                    "lot_refs": ["batch-lot"],
+                    "results_applicable": True,
+                    "total_units": 2,
+                    "fail_units": 0,
+                }
+            ],
+        }
+    ]
+}
+
+
+@contextmanager
+def _count_queries():
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+
+def _seed(client, session, product, count):
+    evaluations = [
+        create_test_evaluation(session, product_name=product) for _ in range(count)
+    ]
+    for evaluation in evaluations:
+        response = client.post(
+            f"/api/evaluations/{evaluation.id}/processes/nested", json=NESTED_PAYLOAD
+        )
+        assert response.status_code == 200
+        response = client.put(
+            f"/api/evaluations/{evaluation.id}/status",
+            json={"status": "cancelled", "cancel_reason": "Batch test"},
+        )
+        assert response.status_code == 200
+    return evaluations
+
+
+def test_batch_matches_single_evaluation_endpoints(client, session):
+    evaluations = _seed(client, session, "Batch Parity Product", 2)
+    ids = ",".join(str(e.id) for e in reversed(evaluations))
+
+    body = json_response(
+        client.get(
+            "/api/evaluations/batch",
+            query_string={"ids": f"{ids},999999", "include": "details,nested,logs"},
+        )
+    )
+    assert body["success"] is True
+    records = body["data"]["evaluations"]
+    assert [r["id"] for r in records] == [e.id for e in reversed(evaluations)]
+    assert body["data"]["missing_ids"] == [999999]
+
+    for record in records:
+        nested = json_response(
+            client.get(f"/api/evaluations/{record['id']}/processes/nested")
+        )["data"]
+        assert record["nested"] == nested
+        logs = json_response(client.get(f"/api/evaluations/{record['id']}/logs"))
+        expected = [
+            log["id"]
+            for log in logs["data"]["logs"]
+            if log["target_type"] != "evaluation_nested_process"
+            or log["operation_type"] != "view"
+        ]
+        assert [log["id"] for log in record["logs"]] == expected
+        assert record["details"] == []
+        assert record["processes"] == []
+
+
+def test_batch_query_count_does_not_grow_with_ids(client, session):
+    ids = [e.id for e in _seed(client, session, "Batch Query Product", 6)]
+    params = {"include": "details,nested,logs", "log_limit": "2"}
+
+    with _count_queries() as few:
+        response = client.get(
+            "/api/evaluations/batch",
+            query_string={**params, "ids": str(ids[0])},
+        )
+    assert response.status_code == 200
+
+    with _count_queries() as many:
+        response = client.get(
+            "/api/evaluations/batch",
+            query_string={**params, "ids": ",".join(map(str, ids))},
+        )
+    body = json_response(response)
+    assert len(many) == len(few)
+    assert all(len(r["logs"]) == 2 for r in body["data"]["evaluations"])
+
+
+def test_batch_rejects_invalid_requests(client):
+    assert client.get("/api/evaluations/batch").status_code == 400
+    assert (
+        client.get("/api/evaluations/batch", query_string={"ids": "1,x"}).status_code
+        == 400
+    )
+    response = client.get(
+        "/api/evaluations/batch", query_string={"ids": "1", "include": "everything"}
+    )
+    assert response.status_code == 400
+
+
+def test_detail_include_returns_nested_and_log_timeline(client, session):
+    evaluation = _seed(client, session, "Detail Include Product", 1)[0]
+
+    body = json_response(
+        client.get(
+            f"/api/evaluations/{evaluation.id}", query_string={"include": "nested,logs"}
+        )
+    )
+    data = body["data"]["evaluation"]
+    assert data["nested"]["payload"]["processes"][0]["name"] == "Batch Process"
+    assert {"evaluation_status", "evaluation_nested_process"} <= {
+        log["target_type"] for log in data["logs"]
+    }
+
+    plain = json_response(client.get(f"/api/evaluations/{evaluation.id}"))
+    assert "nested" not in plain["data"]["evaluation"]
+    assert all(
+        log["target_type"] == "evaluation"
+        for log in plain["data"]["evaluation"]["logs"]
+    )
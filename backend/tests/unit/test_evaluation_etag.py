@@ -0,0 +1,105 @@
+"""Unit tests for conditional GET on evaluation endpoints."""
+
+from tests.helpers import create_test_evaluation
+
+NESTED_PAYLOAD = {
+    "processes": [
+        {
+            "key": "proc-etag",
+            "name": "ETag Process",
+            "order_index": 1,
+            "lots": [
+                {
+                    "client_id": "etag-lot",
+                    "temp_id": "etag-lot",
+                    "lot_number": "LOT-ETAG",
+                    "quantity": 1,
+                }
+            ],
+            "steps": [
+                {
+                    "order_index": 1,
+                    "step_code": "M130",
+                    "step_label": "LI",
+                    "lot_refs": ["etag-lot"],
+                    "results_applicable": True,
+                    "total_units": 1,
+                    "fail_units": 0,
+                }
+            ],
+        }
+    ]
+}
+
+
+def _revalidate(client, url, etag, **kwargs):
+    return client.get(url, headers={"If-None-Match": etag}, **kwargs)
+
+
+def test_detail_returns_304_until_evaluation_changes(client, session):
+    evaluation = create_test_evaluation(session, product_name="ETag Detail Product")
+    url = f"/api/evaluations/{evaluation.id}"
+
+    first = client.get(url)
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+    assert etag.startswith("W/")
+    assert "no-cache" in first.headers["Cache-Control"]
+
+    # The VIEW log written by the first read does not invalidate the validator.
+    cached = _revalidate(client, url, etag)
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+    response = client.put(url, json={"remarks": "changed"})
+    assert response.status_code == 200
+    changed = _revalidate(client, url, etag)
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_detail_validator_depends_on_include(client, session):
+    evaluation = create_test_evaluation(session, product_name="ETag Include Product")
+    url = f"/api/evaluations/{evaluation.id}"
+
+    etag = client.get(url).headers["ETag"]
+    response = _revalidate(client, url, etag, query_string={"include": "nested"})
+    assert response.status_code == 200
+    assert "nested" in response.get_json()["data"]["evaluation"]
+
+
+def test_nested_returns_304_until_nested_save(client, session):
+    evaluation = create_test_evaluation(session, product_name="ETag Nested Product")
+    url = f"/api/evaluations/{evaluation.id}/processes/nested"
+
+    etag = client.get(url).headers["ETag"]
+    assert not etag.startswith("W/")
+    assert _revalidate(client, url, etag).status_code == 304
+
+    assert client.post(url, json=NESTED_PAYLOAD).status_code == 200
+    response = _revalidate(client, url, etag)
+    assert response.status_code == 200
+    assert response.get_json()["data"]["payload"]["processes"][0]["name"] == (
+        "ETag Process"
+    )
+
+
+def test_list_validator_tracks_filters_and_table_changes(client, session):
+    create_test_evaluation(session, product_name="ETag List Product")
+    params = {"product": "ETag List Product", "per_page": 5}
+
+    etag = client.get("/api/evaluations", query_string=params).headers["ETag"]
+    assert (
+        _revalidate(client, "/api/evaluations", etag, query_string=params).status_code
+        == 304
+    )
+
+    other = _revalidate(
+        client, "/api/evaluations", etag, query_string={**params, "per_page": 6}
+    )
+    assert other.status_code == 200
+
+    create_test_evaluation(session, product_name="ETag List Product")
+    response = _revalidate(client, "/api/evaluations", etag, query_string=params)
+    assert response.status_code == 200
+    assert response.get_json()["data"]["total"] == 2
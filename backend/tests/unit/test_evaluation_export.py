@@ -0,0 +1,122 @@
+"""Unit tests for the streaming evaluation export endpoint."""
+
+import csv
+import io
+import json
+
+import pytest
+
+from app.models.operation_log import OperationLog
+from tests.helpers import create_test_evaluation, json_response
+
+NESTED_PAYLOAD = {
+    "processes": [
+        {
+            "key": "proc-export",
+            "name": "Export Process",
+            "order_index": 1,
+            "lots": [
+                {
+                    "client_id": "export-lot",
+                    "temp_id": "export-lot",
+                    "lot_number": "LOT-EXPORT",
+                    "quantity": 4,
+                }
+            ],
+            "steps": [
+                {
+                    "order_index": 1,
+                    "step_code": "M130",
+                    "step_label": "LI",
+                    "lot_refs": ["export-lot"],
+                    "results_applicable": True,
+                    "total_units": 4,
+                    "fail_units": 1,
+                    "failures": [{"serial_number": "SN1", "fail_code_text": "EXP01"}],
+                }
+            ],
+        }
+    ]
+}
+
+
+def _seed(client, session, product):
+    evaluations = [
+        create_test_evaluation(session, product_name=product, part_number=f"EXP-{i}")
+        for i in range(3)
+    ]
+    response = client.post(
+        f"/api/evaluations/{evaluations[0].id}/processes/nested", json=NESTED_PAYLOAD
+    )
+    assert response.status_code == 200
+    return evaluations
+
+
+def test_export_ndjson_matches_detail_and_nested_endpoints(client, session):
+    evaluations = _seed(client, session, "Export NDJSON Product")
+
+    response = client.get(
+        "/api/evaluations/export",
+        query_string={"format": "ndjson", "product": "Export NDJSON Product"},
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert "attachment" in response.headers["Content-Disposition"]
+
+    records = [
+        json.loads(line) for line in response.get_data(as_text=True).splitlines()
+    ]
+    assert {record["id"] for record in records} == {e.id for e in evaluations}
+
+    first = next(record for record in records if record["id"] == evaluations[0].id)
+    nested = json_response(
+        client.get(f"/api/evaluations/{evaluations[0].id}/processes/nested")
+    )["data"]["payload"]
+    assert first["nested"] == nested
+    assert first["results"] == []
+
+    log = (
+        session.query(OperationLog)
+        .filter_by(operation_type="export", target_type="evaluation_list")
+        .order_by(OperationLog.id.desc())
+        .first()
+    )
+    assert log.new_data["format"] == "ndjson"
+
+
+def test_export_csv_streams_summary_columns(client, session):
+    evaluations = _seed(client, session, "Export CSV Product")
+
+    response = client.get(
+        "/api/evaluations/export",
+        query_string={"product": "Export CSV Product", "ids": str(evaluations[0].id)},
+    )
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True).lstrip("﻿"))))
+
+    assert len(rows) == 1
+    assert rows[0]["id"] == str(evaluations[0].id)
+    assert rows[0]["fail_units"] == "1"
+    assert rows[0]["fail_codes"] == "EXP01"
+    assert rows[0]["nested_summary"] == "Export Process: M130 4/3/1"
+
+
+def test_export_xlsx_uses_write_only_workbook(client, session):
+    openpyxl = pytest.importorskip("openpyxl")
+    _seed(client, session, "Export XLSX Product")
+
+    response = client.get(
+        "/api/evaluations/export",
+        query_string={"format": "xlsx", "product": "Export XLSX Product"},
+    )
+    assert response.status_code == 200
+
+    workbook = openpyxl.load_workbook(io.BytesIO(response.get_data()))
+    rows = list(workbook.active.iter_rows(values_only=True))
+    assert rows[0][0] == "id"
+    assert len(rows) == 4
+
+
+def test_export_rejects_unknown_format(client):
+    response = client.get("/api/evaluations/export", query_string={"format": "pdf"})
+    assert response.status_code == 400
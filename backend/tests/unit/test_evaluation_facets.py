@@ -0,0 +1,140 @@
+"""Unit tests for the evaluation facet counts endpoint."""
+
+from datetime import timedelta
+
+from sqlalchemy import event
+
+from app.models import db
+from app.services.response_cache import ResponseCache
+from app.utils.timezone import utcnow
+from tests.helpers import create_test_evaluation, json_response
+
+
+def _seed(session, prefix):
+    today = utcnow().date()
+    rows = (
+        ("Facet Alpha", "new_product", "in_progress", "Kim Min", 12, 60),
+        ("Facet Alpha", "new_product", "in_progress", "Lee Seo", 2, 1),
+        ("Facet Alpha", "mass_production", "completed", "Kim Min", 30, 1),
+        ("Facet Beta", "new_product", "in_progress", None, 15, 1),
+        ("Facet Beta", "mass_production", "cancelled", "Lee Seo", 1, 1),
+        ("Other Gamma", "new_product", "in_progress", "Kim Min", 1, 1),
+    )
+    for index, (product, evaluation_type, status, charger, age, idle) in enumerate(
+        rows
+    ):
+        evaluation = create_test_evaluation(
+            session,
+            evaluation_number=f"{prefix}-{index}",
+            product_name=product,
+            evaluation_type=evaluation_type,
+            status=status,
+            scs_charger_name=charger,
+            start_date=today - timedelta(days=age),
+        )
+        evaluation.updated_at = utcnow() - timedelta(hours=idle)
+        session.commit()
+
+
+def _counts(data, facet):
+    return {item["value"]: item["count"] for item in data["facets"][facet]}
+
+
+def test_facets_exclude_their_own_filter(client, session):
+    _seed(session, "EV-FACET-OWN")
+    ResponseCache.clear()
+
+    response = client.get(
+        "/api/evaluations/facets",
+        query_string={
+            "evaluation_number": "EV-FACET-OWN",
+            "product": "Facet",
+            "status": "in_progress",
+        },
+    )
+    body = json_response(response)
+
+    assert response.status_code == 200
+    data = body["data"]
+    assert data["total"] == 3
+    # Status ignores status=in_progress but keeps product=Facet.
+    assert _counts(data, "status") == {
+        "in_progress": 3,
+        "completed": 1,
+        "cancelled": 1,
+    }
+    # Product ignores product=Facet but keeps status=in_progress.
+    assert _counts(data, "product_name") == {
+        "Facet Alpha": 2,
+        "Facet Beta": 1,
+        "Other Gamma": 1,
+    }
+    assert _counts(data, "evaluation_type") == {
+        "new_product": 3,
+        "mass_production": 0,
+    }
+    assert _counts(data, "scs_charger_name") == {
+        "Kim Min": 1,
+        "Lee Seo": 1,
+        None: 1,
+    }
+    assert _counts(data, "operational_view") == {
+        "all_active": 3,
+        "no_update_48h": 1,
+        "open_over_10d": 2,
+    }
+
+
+def test_facets_match_list_totals(client, session):
+    _seed(session, "EV-FACET-LIST")
+    ResponseCache.clear()
+    params = {"evaluation_number": "EV-FACET-LIST", "product": "Facet"}
+    data = json_response(client.get("/api/evaluations/facets", query_string=params))[
+        "data"
+    ]
+
+    for status, count in _counts(data, "status").items():
+        listed = json_response(
+            client.get("/api/evaluations", query_string={**params, "status": status})
+        )
+        assert listed["data"]["total"] == count, status
+    for view, count in _counts(data, "operational_view").items():
+        listed = json_response(
+            client.get(
+                "/api/evaluations",
+                query_string={**params, "operational_view": view},
+            )
+        )
+        assert listed["data"]["total"] == count, view
+
+
+def test_facets_use_one_statement_and_the_response_cache(client, session):
+    _seed(session, "EV-FACET-CACHE")
+    ResponseCache.clear()
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    params = {"evaluation_number": "EV-FACET-CACHE", "evaluation_type": "new_product"}
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        first = client.get("/api/evaluations/facets", query_string=params)
+        reads = [s for s in statements if "FROM evaluations" in s]
+        statements.clear()
+        second = client.get("/api/evaluations/facets", query_string=params)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+    assert first.status_code == second.status_code == 200
+    assert len(reads) == 1
+    assert "UNION ALL" in reads[0]
+    assert not any("FROM evaluations" in s for s in statements)
+    assert json_response(first) == json_response(second)
+
+    revalidated = client.get(
+        "/api/evaluations/facets",
+        query_string=params,
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+    assert revalidated.status_code == 304
@@ -0,0 +1,83 @@
+"""Unit tests for batched fail code resolution."""
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.models import db
+from app.models.evaluation import FailCode
+from app.services.fail_code_dictionary import FailCodeDictionary
+
+
+@contextmanager
+def _fail_code_statements():
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        if "fail_codes" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+
+def test_resolve_creates_missing_codes_in_one_batch(session):
+    session.add(FailCode(code="DICT-OLD", short_name=None, source=None))
+    session.commit()
+    pairs = [(f"dict-{index % 30}", f"Name {index % 30}") for index in range(600)]
+    pairs.append(("DICT-OLD", "Known"))
+
+    with _fail_code_statements() as statements:
+        ids = FailCodeDictionary.resolve(pairs)
+
+    # lookup, insert-or-ignore, read back, short name fill, source fill
+    assert len(statements) == 5
+    assert len(ids) == 31
+    created = session.get(FailCode, ids["DICT-7"])
+    assert created.is_provisional
+    assert created.short_name == "Name 7"
+    assert created.source == "nested-ui"
+    old = session.get(FailCode, ids["DICT-OLD"])
+    session.refresh(old)
+    assert (old.short_name, old.source) == ("Known", "nested-ui")
+    session.commit()
+
+    with _fail_code_statements() as statements:
+        assert FailCodeDictionary.resolve(pairs) == ids
+    assert statements == []
+
+
+def test_fail_code_edits_invalidate_the_cache(session):
+    FailCodeDictionary.resolve([("DICT-EDIT", "Edit")])
+    session.commit()
+    dictionary = FailCodeDictionary.instance()
+    assert dictionary.cached(["DICT-EDIT"])
+
+    fail_code = FailCode.query.filter_by(code="DICT-EDIT").one()
+    fail_code.description = "Renamed upstream"
+    session.commit()
+    dictionary.ensure_fresh()
+
+    assert dictionary.cached(["DICT-EDIT"]) == {}
+
+
+def test_rolled_back_codes_are_not_cached(session):
+    dictionary = FailCodeDictionary.instance()
+    assert "DICT-ROLLBACK" in FailCodeDictionary.resolve([("DICT-ROLLBACK", "Gone")])
+    # Not cached before the transaction commits.
+    assert dictionary.cached(["DICT-ROLLBACK"]) == {}
+    session.rollback()
+
+    assert dictionary.cached(["DICT-ROLLBACK"]) == {}
+    assert FailCode.query.filter_by(code="DICT-ROLLBACK").count() == 0
+
+    second = FailCodeDictionary.resolve([("DICT-ROLLBACK", "Again")])
+    session.commit()
+    created = FailCode.query.filter_by(code="DICT-ROLLBACK").one()
+    assert second == {"DICT-ROLLBACK": created.id}
+    assert dictionary.cached(["DICT-ROLLBACK"]) == {
+        "DICT-ROLLBACK": (created.id, True, True)
+    }
@@ -0,0 +1,50 @@
+"""Unit tests for the EXPLAIN-based index advisor."""
+
+from app.services.index_advisor import IndexAdvisor
+
+INDEXED_QUERIES = {
+    "evaluation_logs",
+    "evaluation_process_logs",
+    "list_default_order",
+    "list_keyset_page",
+    "operational_view_no_update_48h",
+    "operational_view_open_over_10d",
+    "step_failures",
+    "failures_by_fail_code",
+    "lots_by_lot_number",
+    "results_by_evaluation",
+}
+
+
+def test_hot_queries_use_indexes_on_sqlite(session):
+    plans = {plan.name: plan for plan in IndexAdvisor.report()}
+
+    assert INDEXED_QUERIES <= set(plans)
+    for name in INDEXED_QUERIES:
+        assert plans[name].plan, name
+        assert plans[name].ok, (name, plans[name].plan)
+
+
+def test_full_scans_are_detected_per_dialect():
+    assert IndexAdvisor.full_scans("sqlite", ["SCAN evaluations"]) == ["evaluations"]
+    assert IndexAdvisor.full_scans("sqlite", ["SCAN TABLE operation_logs"]) == [
+        "operation_logs"
+    ]
+    assert (
+        IndexAdvisor.full_scans(
+            "sqlite", ["SCAN evaluations USING COVERING INDEX ix_evaluations_a"]
+        )
+        == []
+    )
+    assert IndexAdvisor.full_scans(
+        "postgresql", ["Seq Scan on operation_logs  (cost=0.00..1.00 rows=1)"]
+    ) == ["operation_logs"]
+    mysql_plan = IndexAdvisor.format_plan(
+        "mysql",
+        ["id", "select_type", "table", "type", "key"],
+        [
+            (1, "SIMPLE", "evaluations", "ALL", None),
+            (1, "SIMPLE", "operation_logs", "ref", "ix_operation_logs_target"),
+        ],
+    )
+    assert IndexAdvisor.full_scans("mysql", mysql_plan) == ["evaluations"]
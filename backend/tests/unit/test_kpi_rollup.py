@@ -0,0 +1,93 @@
+"""Unit tests for the daily KPI rollup."""
+
+from datetime import timedelta
+
+from werkzeug.datastructures import MultiDict
+
+from app.api.evaluation import _build_live_kpis, _build_rollup_kpis
+from app.models.evaluation import Evaluation
+from app.models.kpi_rollup import EvaluationKpiDaily, rebuild_kpi_rollup
+from app.services.response_cache import ResponseCache
+from app.utils.timezone import utcnow
+from tests.helpers import create_test_evaluation, json_response
+
+
+def _assert_rollup_matches_live(product, group_by=None):
+    args = MultiDict({"product": product})
+    now = utcnow()
+    assert _build_rollup_kpis(args, group_by, now) == _build_live_kpis(
+        args, group_by, now
+    )
+
+
+def _seed(session, product):
+    today = utcnow().date()
+    evaluations = []
+    for index, (evaluation_type, status, age, idle_hours) in enumerate(
+        (
+            ("new_product", "in_progress", 3, 1),
+            ("new_product", "in_progress", 12, 60),
+            ("new_product", "completed", 20, 1),
+            ("mass_production", "in_progress", 40, 47),
+            ("mass_production", "cancelled", 5, 1),
+        )
+    ):
+        evaluation = create_test_evaluation(
+            session,
+            evaluation_number=f"EV-{product.replace(' ', '-')}-{index}",
+            evaluation_type=evaluation_type,
+            product_name=f"{product} {index % 2}",
+            status=status,
+            start_date=today - timedelta(days=age),
+            actual_end_date=today if status == "completed" else None,
+        )
+        evaluation.updated_at = utcnow() - timedelta(hours=idle_hours)
+        session.commit()
+        evaluations.append(evaluation)
+    return evaluations
+
+
+def test_rollup_follows_create_update_status_and_delete(client, session):
+    product = "Rollup Flow Product"
+    evaluations = _seed(session, product)
+    for group_by in (None, "evaluation_type", "product_name"):
+        _assert_rollup_matches_live(product, group_by)
+
+    response = client.put(
+        f"/api/evaluations/{evaluations[0].id}",
+        json={"product_name": f"{product} moved", "start_date": "2026-01-05"},
+    )
+    assert response.status_code == 200
+    response = client.put(
+        f"/api/evaluations/{evaluations[1].id}/status",
+        json={"status": "completed"},
+    )
+    assert response.status_code == 200
+    session.delete(evaluations[3])
+    session.commit()
+
+    for group_by in (None, "evaluation_type", "product_name"):
+        _assert_rollup_matches_live(product, group_by)
+    ResponseCache.clear()
+    body = json_response(
+        client.get(
+            "/api/evaluations/kpis",
+            query_string={"product": product, "group_by": "product_name"},
+        )
+    )
+    assert body["data"]["total_evaluations"] == 4
+    assert f"{product} moved" in {group["key"] for group in body["data"]["groups"]}
+
+
+def test_rebuild_recomputes_rollup(session):
+    product = "Rollup Rebuild Product"
+    _seed(session, product)
+    session.query(EvaluationKpiDaily).update(
+        {EvaluationKpiDaily.created_count: 99}, synchronize_session=False
+    )
+    session.commit()
+
+    scanned = rebuild_kpi_rollup(chunk_size=2)
+
+    assert scanned == session.query(Evaluation).count()
+    _assert_rollup_matches_live(product, "evaluation_type")
@@ -0,0 +1,119 @@
+"""Unit tests for the operation log archive."""
+
+import gzip
+import json
+from datetime import timedelta
+
+import pytest
+
+from app.models.operation_log import OperationLog, OperationType
+from app.services.log_archive import LogArchive
+from app.utils.timezone import utcnow
+from tests.helpers import create_test_evaluation, json_response
+
+
+@pytest.fixture
+def archive_folder(app, tmp_path, monkeypatch):
+    folder = tmp_path / "operation_logs"
+    monkeypatch.setitem(app.config, "LOG_ARCHIVE_FOLDER", str(folder))
+    return folder
+
+
+def _seed_logs(session, evaluation_id, ages_in_days):
+    logs = []
+    for index, age in enumerate(ages_in_days):
+        log = OperationLog(
+            operation_type=OperationType.VIEW.value
+            if index % 3 == 2
+            else OperationType.UPDATE.value,
+            target_type="evaluation",
+            target_id=evaluation_id,
+            operation_description=f"Archive seed {index}",
+            old_data={"remarks": f"before {index}"},
+            created_at=utcnow() - timedelta(days=age),
+        )
+        session.add(log)
+        logs.append(log)
+    session.commit()
+    return logs
+
+
+def test_archive_moves_expired_rows_into_monthly_segments(session, archive_folder):
+    evaluation = create_test_evaluation(session, product_name="Archive Product")
+    _seed_logs(session, evaluation.id, [400, 399, 398, 300, 5])
+
+    moved = LogArchive.archive(retention_days=180, chunk_size=2)
+
+    assert moved == 4
+    remaining = OperationLog.query.filter_by(target_id=evaluation.id).all()
+    assert [log.operation_description for log in remaining] == ["Archive seed 4"]
+
+    manifest = LogArchive.manifest()
+    assert len(manifest["segments"]) >= 2
+    archived = []
+    for month in manifest["segments"]:
+        with open(LogArchive.index_path(month)) as handle:
+            index = json.load(handle)
+        assert f"evaluation:{evaluation.id}" in index["targets"]
+        with gzip.open(LogArchive.segment_path(month), "rt") as handle:
+            lines = [json.loads(line) for line in handle]
+        assert len(lines) == index["rows"]
+        archived.extend(lines)
+    assert sorted(row["operation_description"] for row in archived) == [
+        f"Archive seed {index}" for index in range(4)
+    ]
+    assert all(row["old_data"]["remarks"].startswith("before") for row in archived)
+
+
+def test_logs_endpoint_pages_across_the_retention_boundary(
+    client, session, archive_folder
+):
+    evaluation = create_test_evaluation(session, product_name="Archive Page Product")
+    seeded = _seed_logs(session, evaluation.id, [420, 390, 360, 200, 30, 10, 1])
+    expected = [log.id for log in reversed(seeded)]
+    expected_updates = [
+        log.id for log in reversed(seeded) if log.operation_type != "view"
+    ]
+    LogArchive.archive(retention_days=180, chunk_size=3)
+
+    url = f"/api/evaluations/{evaluation.id}/logs"
+    seen = []
+    cursor = None
+    while True:
+        params = {"per_page": 2}
+        if cursor:
+            params["cursor"] = cursor
+        data = json_response(client.get(url, query_string=params))["data"]
+        seen.extend(data["logs"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert [log["id"] for log in seen] == expected
+    assert seen[-1]["old_data"] == {"remarks": "before 0"}
+
+    updates = json_response(
+        client.get(url, query_string={"per_page": 50, "exclude_views": "true"})
+    )["data"]["logs"]
+    assert [log["id"] for log in updates] == expected_updates
+
+
+def test_manifest_is_reread_only_after_it_changes(session, archive_folder, monkeypatch):
+    evaluation = create_test_evaluation(session, product_name="Archive Cache Product")
+    _seed_logs(session, evaluation.id, [400])
+    LogArchive.archive(retention_days=180)
+    first = LogArchive.archived_through()
+
+    opened = []
+    real_load = json.load
+    monkeypatch.setattr(
+        "app.services.log_archive.json.load",
+        lambda handle: opened.append(handle.name) or real_load(handle),
+    )
+    assert LogArchive.archived_through() == first
+    assert opened == []
+
+    _seed_logs(session, evaluation.id, [300])
+    LogArchive.archive(retention_days=180)
+    assert LogArchive.archived_through() > first
+    assert len(opened) == 1
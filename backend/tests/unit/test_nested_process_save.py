@@ -0,0 +1,173 @@
+"""Unit tests for the diff-based nested process save."""
+
+import copy
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app import db
+from app.models.evaluation import (
+    EvaluationProcessLot,
+    EvaluationProcessRaw,
+    EvaluationProcessStep,
+    EvaluationStepFailure,
+)
+from tests.helpers import create_test_evaluation, json_response
+
+PAYLOAD = {
+    "processes": [
+        {
+            "key": "proc-ft",
+            "name": "FT Process",
+            "order_index": 1,
+            "result_html": "<p>Done</p>",
+            "lots": [
+                {"client_id": "lot-a", "lot_number": "LOT-A", "quantity": 10},
+                {"client_id": "lot-b", "lot_number": "LOT-B", "quantity": 5},
+            ],
+            "steps": [
+                {
+                    "order_index": 1,
+                    "step_code": "M031",
+                    "lot_refs": ["lot-a", "lot-b"],
+                    "total_units": 15,
+                    "fail_units": 2,
+                    "failures": [
+                        {
+                            "sequence": 1,
+                            "fail_code_text": "F01",
+                            "analysis_result": "x",
+                        },
+                        {"sequence": 2, "fail_code_text": "F02"},
+                    ],
+                },
+                {"order_index": 2, "step_code": "M010", "lot_refs": ["lot-b"]},
+            ],
+        }
+    ]
+}
+
+
+def _save(client, evaluation_id, payload):
+    response = client.post(
+        f"/api/evaluations/{evaluation_id}/processes/nested", json=payload
+    )
+    assert response.status_code == 200
+    return json_response(response)["data"]
+
+
+def _row_ids(model, evaluation_id):
+    query = model.query
+    if model is EvaluationStepFailure:
+        query = query.join(EvaluationProcessStep).filter(
+            EvaluationProcessStep.evaluation_id == evaluation_id
+        )
+    else:
+        query = query.filter_by(evaluation_id=evaluation_id)
+    return sorted(row.id for row in query.all())
+
+
+def test_identical_resave_is_a_no_op(client, session):
+    evaluation = create_test_evaluation(session, product_name="Nested Noop")
+    first = _save(client, evaluation.id, PAYLOAD)
+    assert first["unchanged"] is False
+    assert first["changes"]["deleted"] == 0
+
+    second = _save(client, evaluation.id, copy.deepcopy(PAYLOAD))
+
+    assert second["unchanged"] is True
+    assert (
+        EvaluationProcessRaw.query.filter_by(evaluation_id=evaluation.id).count() == 1
+    )
+
+
+def test_editing_one_failure_updates_one_row(client, session):
+    evaluation = create_test_evaluation(session, product_name="Nested Diff")
+    _save(client, evaluation.id, PAYLOAD)
+    step_ids = _row_ids(EvaluationProcessStep, evaluation.id)
+    failure_ids = _row_ids(EvaluationStepFailure, evaluation.id)
+
+    edited = copy.deepcopy(PAYLOAD)
+    edited["processes"][0]["steps"][0]["failures"][1]["analysis_result"] = "open"
+    data = _save(client, evaluation.id, edited)
+
+    assert data["changes"] == {"inserted": 0, "updated": 1, "deleted": 0}
+    assert _row_ids(EvaluationProcessStep, evaluation.id) == step_ids
+    assert _row_ids(EvaluationStepFailure, evaluation.id) == failure_ids
+    failure = EvaluationStepFailure.query.filter_by(sequence=2).filter(
+        EvaluationStepFailure.id.in_(failure_ids)
+    )
+    assert failure.one().analysis_result == "open"
+
+
+def test_removed_rows_are_deleted_and_read_back(client, session):
+    evaluation = create_test_evaluation(session, product_name="Nested Remove")
+    _save(client, evaluation.id, PAYLOAD)
+    lot_a = EvaluationProcessLot.query.filter_by(
+        evaluation_id=evaluation.id, client_id="lot-a"
+    ).one()
+
+    edited = copy.deepcopy(PAYLOAD)
+    process = edited["processes"][0]
+    process["lots"].pop(1)
+    process["steps"] = [
+        {
+            "order_index": 1,
+            "step_code": "M031",
+            "lot_refs": ["lot-a"],
+            "total_units": 10,
+            "fail_units": 1,
+            "failures": [{"sequence": 1, "fail_code_text": "F01"}],
+        }
+    ]
+    data = _save(client, evaluation.id, edited)
+
+    # lot-b, step 2, step 1's lot-b link and failure 2; cascades are not counted.
+    assert data["changes"]["deleted"] == 4
+    assert _row_ids(EvaluationProcessLot, evaluation.id) == [lot_a.id]
+
+    nested = json_response(
+        client.get(f"/api/evaluations/{evaluation.id}/processes/nested")
+    )["data"]["payload"]["processes"][0]
+    assert [lot["client_id"] for lot in nested["lots"]] == ["lot-a"]
+    assert len(nested["steps"]) == 1
+    assert nested["steps"][0]["lot_refs"] == ["lot-a"]
+    assert [failure["sequence"] for failure in nested["steps"][0]["failures"]] == [1]
+
+
+@contextmanager
+def _statements():
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+
+def test_nested_read_uses_flat_queries(client, session):
+    evaluation = create_test_evaluation(session, product_name="Nested Flat Read")
+    payload = copy.deepcopy(PAYLOAD)
+    payload["processes"][0]["steps"][0]["failures"].reverse()
+    _save(client, evaluation.id, payload)
+
+    with _statements() as statements:
+        response = client.get(f"/api/evaluations/{evaluation.id}/processes/nested")
+        nested = json_response(response)["data"]["payload"]["processes"][0]
+        response.close()
+
+    step = nested["steps"][0]
+    assert step["lot_refs"] == ["lot-a", "lot-b"]
+    assert [failure["sequence"] for failure in step["failures"]] == [1, 2]
+    assert step["failures"][0]["analysis_result"] == "x"
+    # No statement multiplies failures by lot links.
+    assert not [
+        statement
+        for statement in statements
+        if "evaluation_step_failures" in statement
+        and "evaluation_step_lots" in statement
+    ]
@@ -0,0 +1,103 @@
+"""Unit tests for materialized nested process snapshots."""
+
+import copy
+import json
+
+from app.api.evaluation import backfill_nested_snapshots
+from app.models.evaluation import EvaluationProcessStep
+from app.models.nested_snapshot import EvaluationNestedSnapshot
+from tests.helpers import create_test_evaluation, json_response
+
+PAYLOAD = {
+    "processes": [
+        {
+            "key": "proc-ft",
+            "name": "FT Process",
+            "order_index": 1,
+            "result_html": "<p>Done</p>",
+            "lots": [{"client_id": "lot-a", "lot_number": "LOT-A", "quantity": 10}],
+            "steps": [
+                {
+                    "order_index": 1,
+                    "step_code": "M031",
+                    "lot_refs": ["lot-a"],
+                    "total_units": 10,
+                    "fail_units": 1,
+                    "failures": [{"sequence": 1, "fail_code_text": "F01"}],
+                }
+            ],
+        }
+    ]
+}
+
+
+def _save(client, evaluation_id, payload):
+    response = client.post(
+        f"/api/evaluations/{evaluation_id}/processes/nested", json=payload
+    )
+    assert response.status_code == 200
+    response.close()
+
+
+def _get(client, evaluation_id):
+    response = client.get(f"/api/evaluations/{evaluation_id}/processes/nested")
+    assert response.status_code == 200
+    response.close()
+    return response
+
+
+def test_save_materializes_snapshot_served_on_read(client, session):
+    evaluation = create_test_evaluation(session, product_name="Snapshot Read")
+    _save(client, evaluation.id, PAYLOAD)
+
+    served = _get(client, evaluation.id)
+    assert served.headers["X-Nested-Snapshot-Version"] == "1"
+    assert (
+        served.get_data() == session.get(EvaluationNestedSnapshot, evaluation.id).body
+    )
+
+    # The stored body equals what live assembly returns.
+    session.delete(session.get(EvaluationNestedSnapshot, evaluation.id))
+    session.commit()
+    live = _get(client, evaluation.id)
+    assert "X-Nested-Snapshot-Version" not in live.headers
+    assert json_response(live) == json.loads(served.get_data())
+
+    edited = copy.deepcopy(PAYLOAD)
+    edited["processes"][0]["lots"][0]["quantity"] = 12
+    _save(client, evaluation.id, edited)
+    assert session.get(EvaluationNestedSnapshot, evaluation.id).version == 1
+    _save(client, evaluation.id, PAYLOAD)
+    assert session.get(EvaluationNestedSnapshot, evaluation.id).version == 2
+
+
+def test_stale_snapshot_falls_back_to_live_assembly(client, session):
+    evaluation = create_test_evaluation(session, product_name="Snapshot Stale")
+    _save(client, evaluation.id, PAYLOAD)
+
+    # A write outside the nested save changes the change markers.
+    step = EvaluationProcessStep.query.filter_by(evaluation_id=evaluation.id).one()
+    step.notes = "edited elsewhere"
+    session.commit()
+
+    response = _get(client, evaluation.id)
+    assert "X-Nested-Snapshot-Version" not in response.headers
+    steps = json_response(response)["data"]["payload"]["processes"][0]["steps"]
+    assert steps[0]["notes"] == "edited elsewhere"
+
+
+def test_backfill_renders_missing_and_stale_snapshots(client, session):
+    evaluation = create_test_evaluation(session, product_name="Snapshot Backfill")
+    empty = create_test_evaluation(session, product_name="Snapshot Empty")
+    _save(client, evaluation.id, PAYLOAD)
+    session.delete(session.get(EvaluationNestedSnapshot, evaluation.id))
+    session.commit()
+
+    assert backfill_nested_snapshots(chunk_size=1) >= 1
+    assert session.get(EvaluationNestedSnapshot, empty.id) is None
+    assert "X-Nested-Snapshot-Version" in _get(client, evaluation.id).headers
+
+    # Current snapshots are left alone unless a rebuild is requested.
+    before = session.get(EvaluationNestedSnapshot, evaluation.id).updated_at
+    backfill_nested_snapshots()
+    assert session.get(EvaluationNestedSnapshot, evaluation.id).updated_at == before
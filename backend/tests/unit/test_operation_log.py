@@ -1,6 +1,11 @@
 """Unit tests for the OperationLog model and functionality."""
 
+from sqlalchemy import event
+
+from app.models import db
 from app.models.operation_log import OperationLog, OperationType
+from app.models.view_counter import ViewCounter, hour_bucket, record_views, view_key
+from app.services.operation_log_writer import OperationLogWriter, _log_row
 
 
 def test_operation_log_creation(session):
@@ -63,3 +68,126 @@ def test_operation_log_to_dict(session):
     assert log_dict["user_agent"] == "Mozilla/5.0"
     assert log_dict["success"] is True
     assert "created_at" in log_dict
+
+
+def _view_log(description, target_type="evaluation_list", target_id=None, ip=None):
+    return OperationLog(
+        operation_type=OperationType.VIEW.value,
+        target_type=target_type,
+        target_id=target_id,
+        target_description=description,
+        ip_address=ip,
+        request_method="GET",
+    )
+
+
+def test_operation_log_writer_flushes_in_batches(app):
+    """Queued logs are written as batched inserts by the background thread."""
+    writer = OperationLogWriter(app, flush_interval=0.05, batch_size=3)
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "INSERT INTO operation_logs" in statement:
+            statements.append(executemany)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        for index in range(5):
+            assert writer.enqueue(_log_row(_view_log(f"Writer batch {index}")))
+        assert writer.flush()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+
+    assert writer.counters["written"] == 5
+    assert writer.counters["batches"] == len(statements) == 2
+    assert all(statements)
+    stored = OperationLog.query.filter(
+        OperationLog.target_description.like("Writer batch %")
+    ).all()
+    assert len(stored) == 5
+    assert all(log.created_at is not None and log.success for log in stored)
+
+
+def test_operation_log_writer_drops_when_queue_is_full(app, monkeypatch):
+    """A full queue drops rows and counts them instead of blocking."""
+    writer = OperationLogWriter(app, queue_size=2, enqueue_timeout=0)
+    monkeypatch.setattr(writer, "_ensure_worker", lambda: None)
+
+    results = [writer.enqueue(_log_row(_view_log("Writer drop"))) for _ in range(3)]
+
+    assert results == [True, True, False]
+    assert writer.counters["enqueued"] == 2
+    assert writer.counters["dropped"] == 1
+
+
+def test_operation_log_writer_sync_mode_commits_inline(session, view_log_mode):
+    """Tests run in sync mode, so a recorded log is readable immediately."""
+    view_log_mode("full")
+    OperationLogWriter.record(_view_log("Writer sync"))
+
+    assert OperationLogWriter.stats()["mode"] == "sync"
+    assert (
+        session.query(OperationLog).filter_by(target_description="Writer sync").count()
+        == 1
+    )
+
+
+def test_view_logs_aggregate_into_hourly_counters(session, view_log_mode):
+    """In aggregate mode VIEW events only bump their hourly counter."""
+    view_log_mode("aggregate")
+    for ip in ("10.0.0.1", "10.0.0.1", "10.0.0.2"):
+        OperationLogWriter.record(_view_log("Counted view", "evaluation", 4242, ip))
+
+    assert (
+        session.query(OperationLog).filter_by(target_description="Counted view").count()
+        == 0
+    )
+    counters = {
+        counter.ip_address: counter
+        for counter in session.query(ViewCounter).filter_by(
+            target_type="evaluation", target_id=4242
+        )
+    }
+    assert {ip: c.view_count for ip, c in counters.items()} == {
+        "10.0.0.1": 2,
+        "10.0.0.2": 1,
+    }
+    bucket = hour_bucket()
+    assert all(
+        c.bucket_start.replace(tzinfo=None) == bucket.replace(tzinfo=None)
+        for c in counters.values()
+    )
+
+
+def test_view_log_sample_mode_keeps_a_share_of_rows(
+    session, monkeypatch, view_log_mode
+):
+    """Sampled VIEW rows are kept by rate while every view is still counted."""
+    view_log_mode("sample", sample_rate=0.5)
+    draws = iter([0.1, 0.9, 0.4, 0.7])
+    monkeypatch.setattr(
+        "app.services.operation_log_writer.random.random", lambda: next(draws)
+    )
+    for _ in range(4):
+        OperationLogWriter.record(_view_log("Sampled view", "evaluation", 4243))
+
+    assert (
+        session.query(OperationLog).filter_by(target_description="Sampled view").count()
+        == 2
+    )
+    counter = session.query(ViewCounter).filter_by(target_id=4243).one()
+    assert counter.view_count == 4
+
+
+def test_record_views_adds_to_rows_written_by_another_worker(session):
+    """A key that already exists is incremented without failing the transaction."""
+    key = view_key("evaluation", 4244, "10.0.0.3")
+    with db.engine.begin() as connection:
+        record_views(connection, {key: 2})
+
+    record_views(session.connection(), {key: 3})
+    session.add(_view_log("After upsert"))
+    session.commit()
+
+    counter = session.query(ViewCounter).filter_by(target_id=4244).one()
+    assert counter.view_count == 5
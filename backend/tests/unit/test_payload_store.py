@@ -0,0 +1,143 @@
+"""Unit tests for the content-addressed nested payload store."""
+
+import copy
+from datetime import timedelta
+
+from app.models.evaluation import EvaluationProcessRaw
+from app.models.operation_log import OperationLog
+from app.models.payload_blob import (
+    PayloadBlob,
+    load_payload,
+    payload_digest,
+    store_payload,
+)
+from app.services.payload_store import PayloadStore
+from app.utils.timezone import utcnow
+from tests.helpers import create_test_evaluation, json_response
+
+PAYLOAD = {
+    "processes": [
+        {
+            "key": "proc-ft",
+            "name": "FT Process",
+            "order_index": 1,
+            "lots": [{"client_id": "lot-a", "lot_number": "LOT-A", "quantity": 10}],
+            "steps": [
+                {
+                    "order_index": 1,
+                    "step_code": "M031",
+                    "lot_refs": ["lot-a"],
+                    "total_units": 10,
+                    "fail_units": 1,
+                    "failures": [{"sequence": 1, "fail_code_text": "F01"}],
+                }
+            ],
+        }
+    ]
+}
+
+
+def _save(client, evaluation_id, payload):
+    response = client.post(
+        f"/api/evaluations/{evaluation_id}/processes/nested", json=payload
+    )
+    assert response.status_code == 200
+    return json_response(response)["data"]
+
+
+def _edited(quantity):
+    payload = copy.deepcopy(PAYLOAD)
+    payload["processes"][0]["lots"][0]["quantity"] = quantity
+    return payload
+
+
+def _nested_logs(evaluation_id):
+    return (
+        OperationLog.query.filter_by(
+            target_type="evaluation_nested_process", target_id=evaluation_id
+        )
+        .order_by(OperationLog.id)
+        .all()
+    )
+
+
+def test_identical_payloads_share_one_blob(client, session):
+    first = create_test_evaluation(session, product_name="Payload Dedupe A")
+    second = create_test_evaluation(session, product_name="Payload Dedupe B")
+    blobs_before = PayloadBlob.query.count()
+
+    _save(client, first.id, PAYLOAD)
+    _save(client, second.id, copy.deepcopy(PAYLOAD))
+
+    assert PayloadBlob.query.count() == blobs_before + 1
+    raw = EvaluationProcessRaw.query.filter_by(evaluation_id=second.id).one()
+    assert raw.payload is None
+    stored = load_payload(raw.payload_hash)
+    assert payload_digest(stored) == raw.payload_hash
+    assert stored["processes"][0]["name"] == "FT Process"
+
+    response = client.get(f"/api/evaluations/{second.id}/processes/nested")
+    assert response.status_code == 200
+    processes = json_response(response)["data"]["payload"]["processes"]
+    assert processes[0]["lots"][0]["lot_number"] == "LOT-A"
+
+
+def test_logs_reference_payload_until_snapshots_requested(client, session):
+    evaluation = create_test_evaluation(session, product_name="Payload Logs")
+    _save(client, evaluation.id, _edited(11))
+
+    log = _nested_logs(evaluation.id)[-1]
+    assert set(log.to_dict()["new_data"]) == {"$payload"}
+    full = log.to_dict(snapshots=True)["new_data"]
+    assert full["processes"][0]["lots"][0]["quantity"] == 11
+
+
+def test_compact_keeps_latest_raw_and_logged_blobs(client, session):
+    evaluation = create_test_evaluation(session, product_name="Payload Compact")
+    for quantity in (21, 22, 23):
+        _save(client, evaluation.id, _edited(quantity))
+    digests = [
+        raw.payload_hash
+        for raw in EvaluationProcessRaw.query.filter_by(evaluation_id=evaluation.id)
+        .order_by(EvaluationProcessRaw.id)
+        .all()
+    ]
+    assert len(set(digests)) == 3
+
+    # Older blobs stay alive through the nested-save logs that reference them.
+    result = PayloadStore.compact(keep=1, grace_seconds=0)
+    assert result["raw_deleted"] >= 2
+    remaining = EvaluationProcessRaw.query.filter_by(evaluation_id=evaluation.id).all()
+    assert [raw.payload_hash for raw in remaining] == digests[-1:]
+    assert all(session.get(PayloadBlob, digest) for digest in digests)
+
+    for log in _nested_logs(evaluation.id):
+        session.delete(log)
+    session.commit()
+
+    result = PayloadStore.compact(keep=1, grace_seconds=0)
+    assert session.get(PayloadBlob, digests[0]) is None
+    assert session.get(PayloadBlob, digests[1]) is None
+    assert session.get(PayloadBlob, digests[-1]) is not None
+    assert result["blobs_deleted"] >= 2
+    assert result["bytes_freed"] > 0
+
+
+def test_garbage_collection_spares_blobs_a_save_just_reused(session):
+    digest = store_payload({"unreferenced": True})
+    session.commit()
+    blob = session.get(PayloadBlob, digest)
+    blob.last_used_at = utcnow() - timedelta(hours=2)
+    session.commit()
+
+    # A save reuses the blob; its raw record has not committed yet.
+    assert store_payload({"unreferenced": True}) == digest
+    session.commit()
+    PayloadStore.collect_garbage()
+    session.expire_all()
+    assert session.get(PayloadBlob, digest) is not None
+
+    session.get(PayloadBlob, digest).last_used_at = utcnow() - timedelta(hours=2)
+    session.commit()
+    PayloadStore.collect_garbage()
+    assert session.get(PayloadBlob, digest) is None
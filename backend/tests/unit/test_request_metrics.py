@@ -0,0 +1,140 @@
+"""Unit tests for per-request latency and DB-time capture."""
+
+from app.models.operation_log import OperationLog, OperationType
+from app.services.operation_log_writer import OperationLogWriter
+from app.services.request_metrics import EndpointStats
+from tests.helpers import create_test_evaluation, json_response
+
+
+def _latest_log(evaluation_id, operation_type):
+    return (
+        OperationLog.query.filter_by(
+            target_type="evaluation",
+            target_id=evaluation_id,
+            operation_type=operation_type,
+        )
+        .order_by(OperationLog.id.desc())
+        .first()
+    )
+
+
+def test_sync_log_gets_request_metrics(client, session):
+    evaluation = create_test_evaluation(session, product_name="Metrics Product")
+
+    with client.put(
+        f"/api/evaluations/{evaluation.id}", json={"remarks": "timed"}
+    ) as response:
+        assert response.status_code == 200
+
+    session.expire_all()
+    log = _latest_log(evaluation.id, OperationType.UPDATE.value)
+    assert log.duration_ms > 0
+    assert 0 < log.db_time_ms <= log.duration_ms
+    assert log.db_statements > 0
+    assert log.response_bytes == len(response.data)
+
+
+def test_nested_save_log_gets_request_metrics(client, session):
+    evaluation = create_test_evaluation(session, product_name="Metrics Nested")
+    payload = {
+        "processes": [
+            {
+                "key": "proc-metrics",
+                "name": "Metrics Process",
+                "order_index": 1,
+                "lots": [{"client_id": "lot-m", "lot_number": "LOT-M", "quantity": 5}],
+                "steps": [
+                    {
+                        "order_index": 1,
+                        "step_code": "M031",
+                        "lot_refs": ["lot-m"],
+                        "total_units": 5,
+                        "fail_units": 0,
+                        "failures": [],
+                    }
+                ],
+            }
+        ]
+    }
+
+    with client.post(
+        f"/api/evaluations/{evaluation.id}/processes/nested", json=payload
+    ) as response:
+        assert response.status_code == 200
+
+    session.expire_all()
+    log = (
+        OperationLog.query.filter_by(
+            target_type="evaluation_nested_process", target_id=evaluation.id
+        )
+        .order_by(OperationLog.id.desc())
+        .first()
+    )
+    assert log.duration_ms > 0
+    assert log.db_statements > 0
+    assert log.response_bytes == len(response.data)
+
+
+def test_async_log_is_queued_with_request_metrics(
+    client, session, monkeypatch, view_log_mode
+):
+    view_log_mode("full")
+    evaluation = create_test_evaluation(session, product_name="Metrics Async Product")
+    writer = OperationLogWriter.instance()
+    monkeypatch.setattr(writer, "mode", "async")
+    queued = []
+    monkeypatch.setattr(writer, "_put", queued.append)
+
+    with client.get(f"/api/evaluations/{evaluation.id}") as response:
+        assert response.status_code == 200
+
+    (row,) = [
+        row
+        for kind, row in queued
+        if kind == "log"
+        and row["target_id"] == evaluation.id
+        and row["operation_type"] == OperationType.VIEW.value
+    ]
+    assert row["response_bytes"] == len(response.data)
+    assert row["db_statements"] > 0
+    assert row["duration_ms"] >= row["db_time_ms"]
+
+
+def test_endpoint_metrics_summarize_recent_requests(app, client, session):
+    stats = app.extensions["request_metrics"]
+    stats.reset()
+    evaluation = create_test_evaluation(session, product_name="Metrics List Product")
+    for _ in range(3):
+        client.get(f"/api/evaluations/{evaluation.id}").close()
+
+    data = json_response(client.get("/api/metrics/endpoints"))["data"]
+
+    detail = next(
+        row
+        for row in data["endpoints"]
+        if row["endpoint"] == "GET /api/evaluations/<int:evaluation_id>"
+    )
+    assert detail["count"] == 3
+    assert sum(detail["histogram"].values()) == 3
+    assert detail["p50_ms"] <= detail["p95_ms"] <= detail["max_ms"]
+    assert detail["avg_db_statements"] > 0
+
+
+def test_endpoint_stats_window_keeps_latest_samples():
+    stats = EndpointStats(window=2)
+    for duration in (1, 700, 3000):
+        stats.add(
+            "GET /x",
+            {
+                "duration_ms": duration,
+                "db_time_ms": 0,
+                "db_statements": 1,
+                "response_bytes": 10,
+            },
+        )
+
+    (summary,) = stats.summary()
+    assert summary["count"] == 2
+    assert summary["histogram"]["le_1000"] == 1
+    assert summary["histogram"]["le_5000"] == 1
+    assert summary["max_ms"] == 3000
@@ -0,0 +1,118 @@
+"""Unit tests for the versioned response cache."""
+
+from sqlalchemy import event
+
+from app.models import db
+from app.models.data_version import version_token
+from app.services.response_cache import (
+    MemoryCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+)
+from tests.helpers import create_test_evaluation, json_response
+
+
+def _count_statements(callback):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        callback()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+    return statements
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_entries=2)
+    backend.set("a", b"1")
+    backend.set("b", b"2")
+    assert backend.get("a") == b"1"
+    backend.set("c", b"3")
+
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+    assert backend.get("c") == b"3"
+
+
+def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = SQLiteCacheBackend(path, max_entries=2)
+    second = SQLiteCacheBackend(path, max_entries=2)
+
+    first.set("a", b"1")
+    assert second.get("a") == b"1"
+    second.set("b", b"2")
+    second.set("c", b"3")
+    assert first.get("a") is None
+    assert first.get("c") == b"3"
+
+
+def test_writes_bump_evaluations_version(client, session):
+    before = version_token()
+    evaluation = create_test_evaluation(session, product_name="Version Product")
+    after_create = version_token()
+    assert after_create != before
+
+    response = client.put(
+        f"/api/evaluations/{evaluation.id}/status",
+        json={"status": "cancelled", "cancel_reason": "Version test"},
+    )
+    assert response.status_code == 200
+    after_status = version_token()
+    assert after_status != after_create
+
+    # Read-only requests write VIEW logs but leave the version alone.
+    client.get(f"/api/evaluations/{evaluation.id}")
+    assert version_token() == after_status
+
+    session.delete(evaluation)
+    session.commit()
+    assert version_token() != after_status
+
+
+def test_list_and_kpis_are_served_from_cache_until_a_write(client, session):
+    ResponseCache.clear()
+    create_test_evaluation(session, product_name="Cached List Product")
+    params = {"product": "Cached List Product"}
+
+    first = json_response(client.get("/api/evaluations", query_string=params))
+    kpis = json_response(client.get("/api/evaluations/kpis", query_string=params))
+    assert first["data"]["total"] == 1
+    assert kpis["data"]["total_evaluations"] == 1
+
+    statements = _count_statements(
+        lambda: client.get("/api/evaluations", query_string=params)
+    )
+    assert not any("FROM evaluations" in statement for statement in statements)
+
+    create_test_evaluation(session, product_name="Cached List Product")
+    second = json_response(client.get("/api/evaluations", query_string=params))
+    kpis = json_response(client.get("/api/evaluations/kpis", query_string=params))
+    assert second["data"]["total"] == 2
+    assert kpis["data"]["total_evaluations"] == 2
+
+
+def test_live_kpis_aggregate_in_two_queries(client, session):
+    ResponseCache.clear()
+    create_test_evaluation(session, product_name="Two Query KPI Product")
+
+    # Charger grouping has no rollup dimension, so this runs live.
+    statements = _count_statements(
+        lambda: client.get(
+            "/api/evaluations/kpis",
+            query_string={
+                "product": "Two Query KPI Product",
+                "group_by": "scs_charger_name",
+            },
+        )
+    )
+    evaluation_reads = [s for s in statements if "FROM evaluations" in s]
+    assert len(evaluation_reads) == 2
+
+
+def test_cache_can_be_disabled(app):
+    assert ResponseCache.create_backend({"RESPONSE_CACHE_BACKEND": "none"}) is None
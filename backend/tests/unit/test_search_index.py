@@ -0,0 +1,100 @@
+"""Unit tests for the evaluation trigram search index."""
+
+from app.models.evaluation import Evaluation
+from app.models.search_index import (
+    EvaluationSearchToken,
+    _insert_tokens,
+    rebuild_search_index,
+    substring_filter,
+    token_rows,
+    trigrams,
+)
+from tests.helpers import create_test_evaluation, json_response
+
+
+def _tokens(session, evaluation_id, field):
+    return {
+        row.token
+        for row in session.query(EvaluationSearchToken).filter_by(
+            evaluation_id=evaluation_id, field=field
+        )
+    }
+
+
+def test_trigrams_are_lowercase_and_distinct():
+    assert trigrams("AbAbA") == {"aba", "bab"}
+    assert trigrams("ab") == set()
+    assert trigrams(None) == set()
+
+
+def test_search_tokens_follow_insert_update_and_delete(session):
+    evaluation = create_test_evaluation(
+        session, product_name="Trigram Alpha", scs_charger_name=None
+    )
+    assert _tokens(session, evaluation.id, "product_name") == trigrams("Trigram Alpha")
+    assert _tokens(session, evaluation.id, "scs_charger_name") == set()
+
+    evaluation.product_name = "Trigram Beta"
+    evaluation.scs_charger_name = "Kim"
+    session.commit()
+    assert _tokens(session, evaluation.id, "product_name") == trigrams("Trigram Beta")
+    assert _tokens(session, evaluation.id, "scs_charger_name") == {"kim"}
+
+    evaluation_id = evaluation.id
+    session.delete(evaluation)
+    session.commit()
+    assert (
+        session.query(EvaluationSearchToken)
+        .filter_by(evaluation_id=evaluation_id)
+        .count()
+        == 0
+    )
+
+
+def test_substring_filter_matches_plain_ilike(session):
+    names = ["SSD Gamma-X1", "ssd gamma-x2", "Gamma SSD", "Delta Unit"]
+    for name in names:
+        create_test_evaluation(session, product_name=name, part_number="TRI-CMP")
+
+    for term in ["gamma-x", "SSD", "Unit", "a-", "mma s", "%mma", "zzzz"]:
+        base = session.query(Evaluation).filter(Evaluation.part_number == "TRI-CMP")
+        indexed = base.filter(substring_filter(Evaluation.product_name, term))
+        plain = base.filter(Evaluation.product_name.ilike(f"%{term}%"))
+        assert {e.id for e in indexed} == {e.id for e in plain}, term
+
+
+def test_list_filters_use_index_after_rebuild(client, session):
+    create_test_evaluation(
+        session, product_name="Rebuild Omega", head_office_charger_name="Lee Rebuild"
+    )
+    session.query(EvaluationSearchToken).delete()
+    session.commit()
+
+    assert rebuild_search_index(chunk_size=2) >= 1
+
+    response = client.get(
+        "/api/evaluations",
+        query_string={"product": "ld omeg", "head_office_charger_name": "lee reb"},
+    )
+    body = json_response(response)
+    assert [item["product_name"] for item in body["data"]["evaluations"]] == [
+        "Rebuild Omega"
+    ]
+
+
+def test_collation_equal_tokens_do_not_block_writes(client, session):
+    evaluation = create_test_evaluation(session, product_name="Cafe Café")
+    assert {"afe", "afé"} <= _tokens(session, evaluation.id, "product_name")
+
+    # Accent-insensitive collations treat these as one key; re-inserting an
+    # existing key must be skipped instead of failing the write.
+    _insert_tokens(
+        session.connection(), token_rows(evaluation.id, {"product_name": "Café"})
+    )
+    evaluation.product_name = "Café Cafe au lait"
+    session.commit()
+    assert "afé" in _tokens(session, evaluation.id, "product_name")
+
+    response = client.get("/api/evaluations?product=café")
+    ids = [item["id"] for item in json_response(response)["data"]["evaluations"]]
+    assert evaluation.id in ids
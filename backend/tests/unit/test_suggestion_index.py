@@ -0,0 +1,123 @@
+"""Unit tests for the typeahead suggestion index."""
+
+from collections import Counter
+
+from sqlalchemy import event
+
+from app.models import Evaluation, db
+from app.models.data_version import bump_version
+from app.services.suggestion_index import PrefixIndex, SuggestionIndex
+from app.utils.timezone import utcnow
+from tests.helpers import create_test_evaluation, json_response
+
+
+def _suggest(client, **params):
+    response = client.get("/api/evaluations/suggest", query_string=params)
+    assert response.status_code == 200
+    return [item["value"] for item in json_response(response)["data"]["suggestions"]]
+
+
+def _statements(callback):
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        result = callback()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+    return result, statements
+
+
+def test_prefix_index_ranks_by_frequency_and_matches_word_starts():
+    index = PrefixIndex(Counter({"Park Min": 3, "Park Ji": 5, "Min Seo": 1}))
+
+    assert index.search("park", 10) == [("Park Ji", 5), ("Park Min", 3)]
+    assert index.search("MIN", 10) == [("Park Min", 3), ("Min Seo", 1)]
+    assert index.search("", 1) == [("Park Ji", 5)]
+
+    index.add("Park Ji", -5)
+    assert index.search("park", 10) == [("Park Min", 3)]
+    assert index.search("ji", 10) == []
+
+
+def test_suggest_is_served_from_memory_and_follows_writes(client, session):
+    SuggestionIndex.instance().invalidate()
+    for _ in range(2):
+        create_test_evaluation(session, product_name="Zephyr Alpha")
+    create_test_evaluation(session, product_name="Zephyr Beta")
+
+    assert _suggest(client, field="product", prefix="zeph") == [
+        "Zephyr Alpha",
+        "Zephyr Beta",
+    ]
+    values, statements = _statements(
+        lambda: _suggest(client, field="product", prefix="zephyr b")
+    )
+    assert values == ["Zephyr Beta"]
+    assert statements == []
+
+    evaluation = create_test_evaluation(session, product_name="Zephyr Gamma")
+    evaluation.product_name = "Zephyr Beta"
+    session.commit()
+    for _ in range(2):
+        create_test_evaluation(session, product_name="Zephyr Beta")
+
+    values, statements = _statements(
+        lambda: _suggest(client, field="product", prefix="zeph")
+    )
+    assert values == ["Zephyr Beta", "Zephyr Alpha"]
+    assert statements == []
+
+
+def test_local_writes_advance_the_index_version(client, session):
+    index = SuggestionIndex.instance()
+    index.invalidate()
+    _suggest(client, field="product", prefix="")
+    index.refresh_seconds = 0
+    try:
+        create_test_evaluation(session, product_name="Vireo Local")
+
+        values, statements = _statements(
+            lambda: _suggest(client, field="product", prefix="vireo")
+        )
+        assert values == ["Vireo Local"]
+        assert not any("GROUP BY" in statement for statement in statements)
+
+        with db.engine.begin() as connection:
+            bump_version(connection)
+        _, statements = _statements(
+            lambda: _suggest(client, field="product", prefix="vireo")
+        )
+        assert any("GROUP BY" in statement for statement in statements)
+    finally:
+        index.refresh_seconds = 30
+
+
+def test_suggest_ignores_rolled_back_writes(client, session):
+    SuggestionIndex.instance().invalidate()
+    _suggest(client, field="scs_charger_name", prefix="")
+
+    session.add(
+        Evaluation(
+            evaluation_number="EV-SUGGEST-ROLLBACK",
+            evaluation_type="new_product",
+            product_name="Rollback Product",
+            part_number="RB-1",
+            start_date=utcnow().date(),
+            scs_charger_name="Quill Rollback",
+        )
+    )
+    session.flush()
+    session.rollback()
+
+    assert _suggest(client, field="scs_charger_name", prefix="quill") == []
+
+
+def test_suggest_rejects_unknown_field(client):
+    response = client.get("/api/evaluations/suggest?field=remarks&prefix=a")
+
+    assert response.status_code == 400
+    assert json_response(response)["success"] is False
@@ -6,14 +6,15 @@ export const fetchAllEvaluationPages = async (
   pageSize = DEFAULT_EXPORT_PAGE_SIZE,
 ) => {
   const evaluations = []
-  let page = 1
+  let cursor = null
 
   while (true) {
     const response = await apiClient.get('/evaluations', {
       params: {
         ...params,
-        page,
+        pagination: 'cursor',
         per_page: pageSize,
+        ...(cursor ? { cursor } : {}),
       },
     })
     const data = response.data?.data || {}
@@ -21,17 +22,28 @@ export const fetchAllEvaluationPages = async (
 
     evaluations.push(...pageEvaluations)
 
-    const total = Number(data.total)
-    const pages = Number(data.pages)
-    const reachedTotal = Number.isFinite(total) && evaluations.length >= total
-    const reachedLastPage = Number.isFinite(pages) && page >= pages
-
-    if (pageEvaluations.length === 0 || reachedTotal || reachedLastPage) {
+    cursor = data.next_cursor || null
+    if (pageEvaluations.length === 0 || !data.has_more || !cursor) {
       break
     }
-
-    page += 1
   }
 
   return evaluations
 }
+
+export const parseNdjson = (text) =>
+  String(text || '')
+    .split('\n')
+    .map((line) => line.trim())
+    .filter(Boolean)
+    .map((line) => JSON.parse(line))
+
+export const fetchEvaluationExportRecords = async (apiClient, params = {}) => {
+  const response = await apiClient.get('/evaluations/export', {
+    params: { ...params, format: 'ndjson' },
+    responseType: 'text',
+    transformResponse: [(data) => data],
+    timeout: 0,
+  })
+  return parseNdjson(response.data)
+}
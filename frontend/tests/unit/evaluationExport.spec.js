@@ -1,7 +1,10 @@
-import { fetchAllEvaluationPages } from '../../src/utils/evaluationExport'
+import {
+  fetchAllEvaluationPages,
+  fetchEvaluationExportRecords,
+} from '../../src/utils/evaluationExport'
 
 describe('fetchAllEvaluationPages', () => {
-  it('fetches every page while preserving export filters', async () => {
+  it('follows cursors while preserving export filters', async () => {
     const apiClient = {
       get: jest
         .fn()
@@ -9,8 +12,8 @@ describe('fetchAllEvaluationPages', () => {
           data: {
             data: {
               evaluations: [{ id: 1 }, { id: 2 }],
-              total: 3,
-              pages: 2,
+              next_cursor: 'cursor-2',
+              has_more: true,
             },
           },
         })
@@ -18,8 +21,8 @@ describe('fetchAllEvaluationPages', () => {
           data: {
             data: {
               evaluations: [{ id: 3 }],
-              total: 3,
-              pages: 2,
+              next_cursor: null,
+              has_more: false,
             },
           },
         }),
@@ -29,10 +32,10 @@ describe('fetchAllEvaluationPages', () => {
 
     expect(evaluations).toEqual([{ id: 1 }, { id: 2 }, { id: 3 }])
     expect(apiClient.get).toHaveBeenNthCalledWith(1, '/evaluations', {
-      params: { status: 'completed', page: 1, per_page: 2 },
+      params: { status: 'completed', pagination: 'cursor', per_page: 2 },
     })
     expect(apiClient.get).toHaveBeenNthCalledWith(2, '/evaluations', {
-      params: { status: 'completed', page: 2, per_page: 2 },
+      params: { status: 'completed', pagination: 'cursor', per_page: 2, cursor: 'cursor-2' },
     })
   })
 
@@ -51,3 +54,20 @@ describe('fetchAllEvaluationPages', () => {
     expect(apiClient.get).toHaveBeenCalledTimes(1)
   })
 })
+
+describe('fetchEvaluationExportRecords', () => {
+  it('requests NDJSON once and parses every line', async () => {
+    const apiClient = {
+      get: jest.fn().mockResolvedValue({
+        data: '{"id":1,"nested":{"processes":[]}}\n{"id":2,"results":[]}\n',
+      }),
+    }
+
+    const records = await fetchEvaluationExportRecords(apiClient, { ids: '1,2' })
+
+    expect(records).toEqual([{ id: 1, nested: { processes: [] } }, { id: 2, results: [] }])
+    expect(apiClient.get).toHaveBeenCalledTimes(1)
+    expect(apiClient.get.mock.calls[0][0]).toBe('/evaluations/export')
+    expect(apiClient.get.mock.calls[0][1].params).toEqual({ ids: '1,2', format: 'ndjson' })
+  })
+})